@@ -0,0 +1,100 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Compare the latency of the ``Commit`` requests, and the time taken by
+the blocks, when the committed blocks are written in sync and behind the
+consensus."""
+
+import argparse
+import codecs
+import json
+import time
+
+from abci import types_v0_31_5 as types
+
+import bigchaindb
+from bigchaindb.backend import connect
+from bigchaindb.backend.schema import drop_database, init_database
+from bigchaindb.common.crypto import generate_key_pair
+from bigchaindb.common.exceptions import DatabaseDoesNotExist
+from bigchaindb.core import App
+from bigchaindb.lib import BigchainDB
+from bigchaindb.models import Transaction
+
+DBNAME = 'bigchain_benchmark'
+VALIDATOR = codecs.decode(b'VAgFZtYw8bNR5TMZHFOBDWk9cAmEu3/c6JgRBmddbbI=', 'base64')
+
+
+def blocks(count, size):
+    """Return ``count`` blocks of ``size`` raw transactions, each block
+    transferring the assets created by the previous one."""
+    private_key, public_key = generate_key_pair()
+    block = [Transaction.create([public_key], [([public_key], 1)], metadata={'index': index})
+             .sign([private_key]) for index in range(size)]
+    result = [block]
+    for _ in range(count - 1):
+        block = [Transaction.transfer(tx.to_inputs(), [([public_key], 1)],
+                                      asset_id=tx.asset.get('id', tx.id)).sign([private_key])
+                 for tx in block]
+        result.append(block)
+    return [[json.dumps(tx.to_dict()).encode('utf8') for tx in block] for block in result]
+
+
+def new_database(backend):
+    """Return a connection to an empty database."""
+    connection = connect(backend=backend, name=DBNAME)
+    try:
+        drop_database(connection, DBNAME)
+    except DatabaseDoesNotExist:
+        pass
+    init_database(connection, DBNAME)
+    return connection
+
+
+def run(mode, connection, raw_blocks):
+    """Run the blocks through a new application, and return the latencies
+    of the commits and the times taken by the blocks."""
+    bigchaindb.config['commit']['mode'] = mode
+    app = App(types, BigchainDB(connection, cache_chain_state=True))
+    app.init_chain(types.RequestInitChain(validators=[
+        types.ValidatorUpdate(power=10, pub_key=types.PubKey(type='ed25519', data=VALIDATOR))]))
+
+    commits, totals = [], []
+    for height, raw_block in enumerate(raw_blocks, 1):
+        start = time.perf_counter()
+        app.begin_block(types.RequestBeginBlock())
+        for raw_transaction in raw_block:
+            assert app.deliver_tx(raw_transaction).code == 0
+        app.end_block(types.RequestEndBlock(height=height))
+        commit = time.perf_counter()
+        app.commit()
+        end = time.perf_counter()
+        commits.append(end - commit)
+        totals.append(end - start)
+    app.block_writer.wait()
+    return commits, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--backend', default='inmemory',
+                        help='the database backend, e.g. inmemory, localsqlite or localmongodb')
+    parser.add_argument('--blocks', type=int, default=20,
+                        help='the number of blocks')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 64, 256],
+                        help='the numbers of transactions of the blocks')
+    args = parser.parse_args()
+
+    print('{:>8} {:>14} {:>14} {:>14}'.format('block', 'mode', 'commit ms', 'block ms'))
+    for size in args.sizes:
+        raw_blocks = blocks(args.blocks, size)
+        for mode in ('sync', 'write_behind'):
+            commits, totals = run(mode, new_database(args.backend), raw_blocks)
+            print('{:>8} {:>14} {:>14.2f} {:>14.2f}'.format(
+                size, mode, sum(commits) / len(commits) * 1e3, sum(totals) / len(totals) * 1e3))
+
+
+if __name__ == '__main__':
+    main()
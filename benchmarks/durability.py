@@ -0,0 +1,45 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Compare the throughput of the blocks with each durability profile of
+the MongoDB collections. It needs a MongoDB server, set with the
+``database`` settings of the configuration, e.g. a replica set for the
+``majority`` write concerns to be meaningful."""
+
+import argparse
+
+import bigchaindb
+from bigchaindb.config_utils import autoconfigure
+
+from commit import blocks, new_database, run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--blocks', type=int, default=20,
+                        help='the number of blocks')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 64, 256],
+                        help='the numbers of transactions of the blocks')
+    parser.add_argument('--mode', default='sync', choices=['sync', 'write_behind'],
+                        help='the mode of the commits')
+    args = parser.parse_args()
+
+    autoconfigure()
+    database = bigchaindb.config['database']
+    # NOTE: `None` uses the write and read concerns of the server
+    profiles = [None] + sorted(database['durability_profiles'])
+
+    print('{:>8} {:>14} {:>14} {:>14}'.format('block', 'profile', 'commit ms', 'tx/s'))
+    for size in args.sizes:
+        raw_blocks = blocks(args.blocks, size)
+        for profile in profiles:
+            database['durability'] = profile
+            commits, totals = run(args.mode, new_database('localmongodb'), raw_blocks)
+            print('{:>8} {:>14} {:>14.2f} {:>14.0f}'.format(
+                size, str(profile), sum(commits) / len(commits) * 1e3, size * len(totals) / sum(totals)))
+
+
+if __name__ == '__main__':
+    main()
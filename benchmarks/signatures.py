@@ -0,0 +1,55 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Compare the verification of Ed25519 signatures one by one, and in
+batches."""
+
+import argparse
+import os
+import time
+
+from nacl.signing import SigningKey
+
+from bigchaindb.common.crypto import verify_signature, verify_signatures
+
+
+def signatures(count, keys):
+    signing_keys = [SigningKey.generate() for _ in range(keys)]
+    result = []
+    for index in range(count):
+        signing_key = signing_keys[index % keys]
+        message = os.urandom(64)
+        result.append((bytes(signing_key.verify_key), message, signing_key.sign(message).signature))
+    return result
+
+
+def timed(function, *args, repeat=3):
+    """Return the best time of ``repeat`` runs of ``function``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 16, 64, 256],
+                        help='the numbers of signatures of the batches')
+    parser.add_argument('--keys', type=int, default=8,
+                        help='the number of distinct public keys')
+    args = parser.parse_args()
+
+    print('{:>8} {:>14} {:>14}'.format('batch', 'one by one µs', 'batch µs'))
+    for size in args.sizes:
+        batch = signatures(size, args.keys)
+        one_by_one = timed(lambda: [verify_signature(*signature) for signature in batch])
+        batched = timed(verify_signatures, batch)
+        print('{:>8} {:>14.1f} {:>14.1f}'.format(size, one_by_one / size * 1e6, batched / size * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,8 @@ from bigchaindb.core import App  # noqa
 
 _database_keys_map = {
     'localmongodb': ('host', 'port', 'name'),
+    'localsqlite': ('directory', 'name'),
+    'inmemory': ('name',),
 }
 
 _base_database_localmongodb = {
@@ -44,11 +46,61 @@ _database_localmongodb = {
     'keyfile': None,
     'keyfile_passphrase': None,
     'crlfile': None,
+    # the name of the durability profile the collections are used with, if
+    # None they are used with the write and read concerns of the server
+    'durability': None,
+    # the write concern, and the optional `read_concern` level, of the
+    # collections of every profile, the others use the `default` ones
+    'durability_profiles': {
+        'fast': {
+            'default': {'w': 1, 'j': False},
+        },
+        'balanced': {
+            'default': {'w': 1, 'j': False},
+            'blocks': {'w': 'majority', 'j': True},
+            'pre_commit': {'w': 'majority', 'j': True},
+        },
+        'safe': {
+            'default': {'w': 'majority', 'j': True},
+        },
+    },
 }
 _database_localmongodb.update(_base_database_localmongodb)
 
+_base_database_localsqlite = {
+    'directory': '~/.bigchaindb_data',
+    'name': 'bigchain',
+}
+
+# NOTE: the database is a file, `host` and `port` are unused
+_database_localsqlite = {
+    'backend': 'localsqlite',
+    'host': None,
+    'port': None,
+    'connection_timeout': 5000,
+    'max_tries': 3,
+}
+_database_localsqlite.update(_base_database_localsqlite)
+
+_base_database_inmemory = {
+    'name': 'bigchain',
+}
+
+# NOTE: the database is held in the memory of the process, `host` and
+#       `port` are unused
+_database_inmemory = {
+    'backend': 'inmemory',
+    'host': None,
+    'port': None,
+    'connection_timeout': 5000,
+    'max_tries': 3,
+}
+_database_inmemory.update(_base_database_inmemory)
+
 _database_map = {
     'localmongodb': _database_localmongodb,
+    'localsqlite': _database_localsqlite,
+    'inmemory': _database_inmemory,
 }
 
 config = {
@@ -75,6 +127,39 @@ config = {
     },
     # FIXME: hardcoding to localmongodb for now
     'database': _database_map['localmongodb'],
+    'cache': {
+        # approximate memory budgets, in bytes
+        'validation': 8 * 1024 * 1024,
+        'transactions': 32 * 1024 * 1024,
+        'transaction_dicts': 16 * 1024 * 1024,
+        'inputs': 4 * 1024 * 1024,
+        'documents': 64 * 1024 * 1024,
+    },
+    'commit': {
+        # `sync` to write the blocks before replying to the `Commit`
+        # requests, `write_behind` to write them in the background
+        'mode': 'sync',
+    },
+    'committed_filter': {
+        # number of transaction ids the filter of the committed transactions
+        # is first sized for, it grows beyond
+        'capacity': 1000000,
+        # probability that a new transaction id is looked up in the database
+        'error_rate': 0.001,
+        # file the filter is written to, so that it is not rebuilt from all
+        # the transactions at startup. If None, no snapshot is written
+        'snapshot': None,
+        # number of blocks between two snapshots
+        'snapshot_interval': 1000,
+    },
+    'check_tx': {
+        # number of processes verifying the transactions of the mempool, if
+        # 0 they are verified by the ABCI application itself
+        'concurrency': 0,
+        # number of transactions waiting for their verification, the next
+        # ones are rejected
+        'queue_depth': 1024,
+    },
     'log': {
         'file': log_config['handlers']['file']['filename'],
         'error_file': log_config['handlers']['errors']['filename'],
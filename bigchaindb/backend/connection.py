@@ -4,6 +4,7 @@
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
 import logging
+from contextlib import contextmanager
 from importlib import import_module
 from itertools import repeat
 
@@ -14,6 +15,8 @@ from bigchaindb.common.exceptions import ConfigurationError
 
 BACKENDS = {
     'localmongodb': 'bigchaindb.backend.localmongodb.connection.LocalMongoDBConnection',
+    'localsqlite': 'bigchaindb.backend.localsqlite.connection.LocalSQLiteConnection',
+    'inmemory': 'bigchaindb.backend.inmemory.connection.InMemoryConnection',
 }
 
 logger = logging.getLogger(__name__)
@@ -22,7 +25,7 @@ logger = logging.getLogger(__name__)
 def connect(backend=None, host=None, port=None, name=None, max_tries=None,
             connection_timeout=None, replicaset=None, ssl=None, login=None, password=None,
             ca_cert=None, certfile=None, keyfile=None, keyfile_passphrase=None,
-            crlfile=None):
+            crlfile=None, **kwargs):
     """Create a new connection to the database backend.
 
     All arguments default to the current configuration's values if not
@@ -35,6 +38,8 @@ def connect(backend=None, host=None, port=None, name=None, max_tries=None,
         name (str): the name of the database to use.
         replicaset (str): the name of the replica set (only relevant for
                           MongoDB connections).
+        **kwargs: the settings specific to the backend, e.g. the
+            ``directory`` of the SQLite database file.
 
     Returns:
         An instance of :class:`~bigchaindb.backend.connection.Connection`
@@ -85,7 +90,8 @@ def connect(backend=None, host=None, port=None, name=None, max_tries=None,
                  max_tries=max_tries, connection_timeout=connection_timeout,
                  replicaset=replicaset, ssl=ssl, login=login, password=password,
                  ca_cert=ca_cert, certfile=certfile, keyfile=keyfile,
-                 keyfile_passphrase=keyfile_passphrase, crlfile=crlfile)
+                 keyfile_passphrase=keyfile_passphrase, crlfile=crlfile,
+                 **kwargs)
 
 
 class Connection:
@@ -146,6 +152,16 @@ class Connection:
 
         raise NotImplementedError()
 
+    @contextmanager
+    def transaction(self):
+        """Group the queries run in its context in a single transaction,
+        if the backend supports it.
+
+        The default implementation runs every query on its own.
+        """
+
+        yield self
+
     def connect(self):
         """Try to connect to the database.
 
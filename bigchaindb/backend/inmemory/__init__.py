@@ -0,0 +1,33 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""In-memory backend implementation.
+
+Contains an implementation of the :mod:`~bigchaindb.backend.schema` and
+:mod:`~bigchaindb.backend.query` interfaces storing the documents in Python
+dicts, with secondary indexes mirroring the ones of MongoDB.
+
+The data is lost when the process exits, and is not shared between
+processes. The backend is meant for benchmarks, free from the variance of
+a database server, and for fast tests. You can specify BigchainDB to use it
+by either setting ``database.backend`` to ``'inmemory'`` in your
+configuration file, or setting the ``BIGCHAINDB_DATABASE_BACKEND``
+environment variable to ``'inmemory'``.
+
+The backend doesn't store the documents in MongoDB, but the restrictions of
+MongoDB on the keys and the languages of the assets and of the metadata still
+apply to the transactions it validates: they are rules of the network.
+
+If configured to use it, BigchainDB will automatically return instances
+of :class:`~bigchaindb.backend.inmemory.connection.InMemoryConnection` for
+:func:`~bigchaindb.backend.connection.connect` and dispatch calls of the
+generic backend interfaces to the implementations in this module.
+"""
+
+# Register the single dispatched modules on import.
+from bigchaindb.backend.inmemory import schema, query # noqa
+
+# InMemoryConnection should always be accessed via
+# ``bigchaindb.backend.connect()``.
@@ -0,0 +1,59 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import logging
+from contextlib import contextmanager
+from threading import Lock
+
+from bigchaindb.backend.connection import Connection
+from bigchaindb.backend.inmemory.storage import Database
+
+logger = logging.getLogger(__name__)
+
+# the databases of the process, by name
+DATABASES = {}
+_databases_lock = Lock()
+
+
+class InMemoryConnection(Connection):
+    """A connection to a database held in the memory of the process.
+
+    The connections to the same database name share its tables, so that
+    the connections of the process see the same data.
+    """
+
+    def run(self, query):
+        """Run ``query``, a function of the
+        :class:`~bigchaindb.backend.inmemory.storage.Database`."""
+
+        database = self.conn
+        if DATABASES.get(self.dbname) is not database:
+            # the database was dropped by another connection
+            self._conn = None
+            database = self.conn
+        with database.lock:
+            return query(database)
+
+    @contextmanager
+    def transaction(self):
+        """Run the queries of the block without interleaving the queries of
+        other threads.
+
+        The queries are not rolled back if an exception is raised.
+        """
+
+        database = self.conn
+        with database.lock:
+            yield self
+
+    def _connect(self):
+        """Return the database, creating it if it does not exist."""
+
+        with _databases_lock:
+            database = DATABASES.get(self.dbname)
+            if database is None:
+                from bigchaindb.backend.inmemory.schema import INDEXES
+                database = DATABASES[self.dbname] = Database(self.dbname, INDEXES)
+            return database
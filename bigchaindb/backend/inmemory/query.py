@@ -0,0 +1,577 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Query implementation for the in-memory backend"""
+
+from bigchaindb import backend
+from bigchaindb.backend.exceptions import DuplicateKeyError
+from bigchaindb.backend.utils import (module_dispatch_registrar, parse_text_search,
+                                      project, text_values)
+from bigchaindb.backend.inmemory.connection import InMemoryConnection
+from bigchaindb.backend.inmemory.storage import copy, fold, stems
+from bigchaindb.common.transaction import Transaction
+
+register_query = module_dispatch_registrar(backend.query)
+
+
+def _insert_many(table, documents, ordered=True):
+    """Insert ``documents`` in ``table``, as MongoDB's ``insert_many``.
+
+    An unordered insert stores all the new documents before raising
+    :exc:`~.DuplicateKeyError`.
+    """
+    error = None
+    for document in documents:
+        try:
+            table.insert(document)
+        except DuplicateKeyError as exc:
+            if ordered:
+                raise
+            error = exc
+    if error is not None:
+        raise error
+
+
+@register_query(InMemoryConnection)
+def store_transactions(conn, signed_transactions):
+    return conn.run(lambda db: _insert_many(db['transactions'], signed_transactions))
+
+
+@register_query(InMemoryConnection)
+def get_transaction(conn, transaction_id):
+    return conn.run(lambda db: db['transactions'].find_one('transaction_id', (transaction_id,)))
+
+
+def _find_many(table, index, keys):
+    """Return the documents with any of the ``keys`` in ``index``, in the
+    order of their insertion."""
+    index = table.indexes[index]
+    return table.read(sorted({id_ for key in keys for id_ in index.get(key)}))
+
+
+@register_query(InMemoryConnection)
+def get_transactions(conn, transaction_ids):
+    return conn.run(lambda db: _find_many(db['transactions'], 'transaction_id',
+                                          [(transaction_id,) for transaction_id in transaction_ids]))
+
+
+@register_query(InMemoryConnection)
+def get_transaction_ids(conn):
+    return iter(conn.run(lambda db: [transaction['id']
+                                     for transaction in db['transactions'].documents.values()]))
+
+
+@register_query(InMemoryConnection)
+def get_full_transactions(conn, transaction_ids):
+    # NOTE: the asset of a `CREATE` transaction and the metadata of every
+    #       transaction are stored apart, with the id of the transaction
+    def query(db):
+        transactions = []
+        for transaction_id in transaction_ids:
+            transaction = db['transactions'].find_one('transaction_id', (transaction_id,))
+            if transaction is None:
+                continue
+            asset = db['assets'].find_one('asset_id', (transaction_id,))
+            if asset is not None:
+                asset.pop('id', None)
+                transaction['asset'] = asset
+            if 'metadata' not in transaction:
+                metadata = db['metadata'].find_one('transaction_id', (transaction_id,))
+                transaction['metadata'] = metadata.get('metadata') if metadata else None
+            transactions.append(transaction)
+        return transactions
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def store_metadatas(conn, metadata):
+    return conn.run(lambda db: _insert_many(db['metadata'], metadata, ordered=False))
+
+
+@register_query(InMemoryConnection)
+def get_metadata(conn, transaction_ids):
+    return conn.run(lambda db: _find_many(db['metadata'], 'transaction_id',
+                                          [(transaction_id,) for transaction_id in transaction_ids]))
+
+
+@register_query(InMemoryConnection)
+def store_asset(conn, asset):
+    try:
+        return conn.run(lambda db: db['assets'].insert(asset))
+    except DuplicateKeyError:
+        pass
+
+
+@register_query(InMemoryConnection)
+def store_assets(conn, assets):
+    return conn.run(lambda db: _insert_many(db['assets'], assets, ordered=False))
+
+
+@register_query(InMemoryConnection)
+def get_asset(conn, asset_id):
+    asset = conn.run(lambda db: db['assets'].find_one('asset_id', (asset_id,)))
+    if asset is not None:
+        asset.pop('id', None)
+    return asset
+
+
+@register_query(InMemoryConnection)
+def get_assets(conn, asset_ids):
+    return conn.run(lambda db: _find_many(db['assets'], 'asset_id',
+                                          [(asset_id,) for asset_id in asset_ids]))
+
+
+def _get_spending_transactions(db, links):
+    spent_outputs = _find_many(db['spent_outputs'], 'spent_output', links)
+    return [transaction for spent_output in spent_outputs
+            for transaction in db['transactions'].find('transaction_id', (spent_output['spent_by'],))]
+
+
+@register_query(InMemoryConnection)
+def get_spent(conn, transaction_id, output):
+    return conn.run(lambda db: _get_spending_transactions(db, [(transaction_id, output)]))
+
+
+@register_query(InMemoryConnection)
+def get_spending_transactions(conn, inputs):
+    return conn.run(lambda db: _get_spending_transactions(
+        db, [(input_['transaction_id'], input_['output_index']) for input_ in inputs]))
+
+
+def _last(table, index, **kwargs):
+    """Return the document with the greatest key in the ordered ``index``."""
+    ids = table.indexes[index].find(reverse=True, **kwargs)
+    return table.read(ids[:1])[0] if ids else None
+
+
+@register_query(InMemoryConnection)
+def get_latest_block(conn):
+    return conn.run(lambda db: _last(db['blocks'], 'height'))
+
+
+@register_query(InMemoryConnection)
+def store_block(conn, block):
+    try:
+        return conn.run(lambda db: db['blocks'].insert(block))
+    except DuplicateKeyError:
+        pass
+
+
+@register_query(InMemoryConnection)
+def get_txids_filtered(conn, asset_id, operation=None, last_tx=None):
+    # NOTE: an asset has a single `CREATE` transaction, its first one
+    reverse = last_tx and operation != Transaction.CREATE
+    records = conn.run(lambda db: _get_asset_history(db, asset_id, operation,
+                                                     limit=1 if last_tx else 0,
+                                                     reverse=reverse))
+    return (record['transaction_id'] for record in records)
+
+
+@register_query(InMemoryConnection)
+def get_asset_history(conn, asset_id, operation=None, after=None, limit=0):
+    return conn.run(lambda db: _get_asset_history(db, asset_id, operation, after, limit))
+
+
+def _get_asset_history(db, asset_id, operation=None, after=None, limit=0,
+                       reverse=False):
+    table = db['asset_history']
+    records = []
+    for id_ in table.indexes['asset_history'].find(
+            (asset_id,), after=(asset_id, *after) if after else None, reverse=reverse):
+        record = table.documents[id_]
+        if operation and record['operation'] != operation:
+            continue
+        records.append(copy(record))
+        if len(records) == limit:
+            break
+    return records
+
+
+@register_query(InMemoryConnection)
+def store_asset_history(conn, asset_history):
+    def query(db):
+        table = db['asset_history']
+        for record in asset_history:
+            if not table.indexes['transaction_id'].get((record['transaction_id'],)):
+                table.insert(record)
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def delete_all_asset_history(conn):
+    return conn.run(lambda db: db['asset_history'].clear())
+
+
+@register_query(InMemoryConnection)
+def get_block_transaction_ids(conn):
+    blocks = conn.run(lambda db: db['blocks'].read(db['blocks'].scan()))
+    return ({'height': block['height'], 'position': position, 'transaction_id': transaction_id}
+            for block in blocks
+            for position, transaction_id in enumerate(block['transactions']))
+
+
+@register_query(InMemoryConnection)
+def text_search(conn, search, *, language='english', case_sensitive=False,
+                diacritic_sensitive=False, text_score=False, limit=0, table='assets'):
+    # NOTE: the text index stems the English words, and ignores the case
+    #       and the diacritics, the sensitive searches filter its results
+    phrases, terms, negated = parse_text_search(search)
+    words = phrases or terms
+    if not words:
+        return []
+
+    def query(db):
+        documents = db[table]
+        index = documents.text_index
+        search_stems = [stem for word in words for stem in stems(word)]
+        if phrases:
+            ids = set.intersection(*(set(index.get(stem)) for stem in search_stems))
+        else:
+            ids = {id_ for stem in search_stems for id_ in index.get(stem)}
+        ids.difference_update(id_ for word in negated for stem in stems(word)
+                              for id_ in index.get(stem))
+
+        scores = {id_: sum(index.get(stem).get(id_, 0) for stem in search_stems) / index.lengths[id_]
+                  for id_ in ids}
+        results = []
+        for id_ in sorted(ids, key=lambda id_: (-scores[id_], id_)):
+            text = '\n'.join(text_values(documents.documents[id_]))
+            if phrases and not all(fold(phrase) in fold(text) for phrase in phrases):
+                continue
+            if case_sensitive or diacritic_sensitive:
+                if case_sensitive:
+                    matches = any(word in text for word in words)
+                else:
+                    matches = any(word.lower() in text.lower() for word in words)
+                if not matches:
+                    continue
+            document = copy(documents.documents[id_])
+            if text_score:
+                document['score'] = scores[id_]
+            results.append(document)
+            if len(results) == limit:
+                break
+        return results
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def get_owned_ids(conn, owner):
+    return conn.run(lambda db: db['transactions'].find('outputs', (owner,)))
+
+
+@register_query(InMemoryConnection)
+def get_block(conn, block_id):
+    return conn.run(lambda db: db['blocks'].find_one('height', (block_id,)))
+
+
+@register_query(InMemoryConnection)
+def get_block_with_transaction(conn, txid):
+    return [{'height': block['height']}
+            for block in conn.run(lambda db: db['blocks'].find('transactions', (txid,)))]
+
+
+def _delete_many(table, index, keys):
+    """Delete the documents whose key in ``index`` starts with any of
+    ``keys``."""
+    index = table.indexes[index]
+    find = index.get if index.keys is None else index.find
+    for id_ in {id_ for key in keys for id_ in find(key)}:
+        table.delete(id_)
+
+
+def _set_spent(owner_outputs, link, spent):
+    """Flag the owner outputs of the output ``link`` as ``spent``."""
+    for id_ in owner_outputs.indexes['owner_output'].find(link):
+        owner_output = owner_outputs.documents[id_]
+        if owner_output['spent'] != spent:
+            owner_outputs.replace(id_, dict(owner_output, spent=spent))
+
+
+@register_query(InMemoryConnection)
+def delete_transactions(conn, txn_ids):
+    keys = [(txn_id,) for txn_id in txn_ids]
+
+    def query(db):
+        _delete_many(db['assets'], 'asset_id', keys)
+        _delete_many(db['metadata'], 'transaction_id', keys)
+        _delete_many(db['transactions'], 'transaction_id', keys)
+        _delete_many(db['asset_history'], 'transaction_id', keys)
+
+        owner_outputs = db['owner_outputs']
+        _delete_many(owner_outputs, 'owner_output', keys)
+        for spent_output in _find_many(db['spent_outputs'], 'spent_by', keys):
+            _set_spent(owner_outputs, _link(spent_output), False)
+        _delete_many(db['spent_outputs'], 'spent_by', keys)
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def store_unspent_outputs(conn, *unspent_outputs):
+    if unspent_outputs:
+        try:
+            return conn.run(lambda db: _insert_many(db['utxos'], unspent_outputs, ordered=False))
+        except DuplicateKeyError:
+            pass
+
+
+def _link(output):
+    return (output['transaction_id'], output['output_index'])
+
+
+@register_query(InMemoryConnection)
+def delete_unspent_outputs(conn, *unspent_outputs):
+    if unspent_outputs:
+        return conn.run(lambda db: _delete_many(
+            db['utxos'], 'utxo', [_link(unspent_output) for unspent_output in unspent_outputs]))
+
+
+@register_query(InMemoryConnection)
+def update_unspent_outputs(conn, spent_outputs, unspent_outputs):
+    def query(db):
+        utxos = db['utxos']
+        _delete_many(utxos, 'utxo', [_link(spent_output) for spent_output in spent_outputs])
+        for unspent_output in unspent_outputs:
+            utxos.upsert('utxo', _link(unspent_output), unspent_output)
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def delete_all_unspent_outputs(conn):
+    return conn.run(lambda db: db['utxos'].clear())
+
+
+@register_query(InMemoryConnection)
+def get_unspent_output(conn, transaction_id, output_index):
+    return conn.run(lambda db: db['utxos'].find_one('utxo', (transaction_id, output_index)))
+
+
+@register_query(InMemoryConnection)
+def get_unspent_outputs_by_links(conn, links):
+    return conn.run(lambda db: _find_many(db['utxos'], 'utxo', [tuple(link) for link in links]))
+
+
+TRANSACTION_OUTPUTS = {
+    'id': None,
+    'operation': None,
+    'asset': {'id': None},
+    'outputs': {'amount': None, 'condition': {'uri': None}},
+}
+
+INPUTS_AND_OUTPUTS = {
+    'id': None,
+    'operation': None,
+    'asset': None,
+    'inputs': {'fulfills': None},
+    'outputs': {'amount': None, 'public_keys': None, 'condition': None},
+}
+
+
+@register_query(InMemoryConnection)
+def get_transaction_outputs(conn, transaction_ids):
+    return [project(transaction, TRANSACTION_OUTPUTS)
+            for transaction in get_transactions(conn, list(transaction_ids))]
+
+
+@register_query(InMemoryConnection)
+def get_spent_outputs(conn, links):
+    return conn.run(lambda db: _find_many(db['spent_outputs'], 'spent_output',
+                                          [tuple(link) for link in links]))
+
+
+@register_query(InMemoryConnection)
+def store_spent_outputs(conn, spent_outputs):
+    # NOTE: storing the spent outputs of a block again is a no-op, while
+    #       storing an output spent by another transaction violates the
+    #       unique index on `(transaction_id, output_index)`
+    def query(db):
+        table = db['spent_outputs']
+        inserted = []
+        for spent_output in spent_outputs:
+            stored = table.find_one('spent_output', _link(spent_output))
+            if stored is None:
+                inserted.append(table.insert(spent_output))
+            elif stored['spent_by'] != spent_output['spent_by']:
+                # NOTE: the records stored before the conflict are removed
+                #       so that none are left behind
+                for id_ in inserted:
+                    table.delete(id_)
+                raise DuplicateKeyError('output {transaction_id}:{output_index} already spent'
+                                        .format(**stored))
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def delete_all_spent_outputs(conn):
+    return conn.run(lambda db: db['spent_outputs'].clear())
+
+
+@register_query(InMemoryConnection)
+def store_owner_outputs(conn, owner_outputs, spent_outputs):
+    # NOTE: the outputs created and spent by the same block are stored
+    #       first, and flagged as spent after
+    def query(db):
+        table = db['owner_outputs']
+        index = table.indexes['owner_output']
+        for owner_output in owner_outputs:
+            if not index.get((owner_output['transaction_id'], owner_output['output_index'],
+                              owner_output['public_key'])):
+                table.insert(owner_output)
+        for spent_output in spent_outputs:
+            _set_spent(table, _link(spent_output), True)
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def get_owner_outputs(conn, public_keys, spent=None):
+    owner_outputs = conn.run(lambda db: _find_many(db['owner_outputs'], 'public_key',
+                                                   [(public_key,) for public_key in public_keys]))
+    if spent is None:
+        return owner_outputs
+    return [owner_output for owner_output in owner_outputs if owner_output['spent'] == spent]
+
+
+@register_query(InMemoryConnection)
+def delete_all_owner_outputs(conn):
+    return conn.run(lambda db: db['owner_outputs'].clear())
+
+
+@register_query(InMemoryConnection)
+def get_inputs_and_outputs(conn):
+    transactions = conn.run(lambda db: list(db['transactions'].documents.values()))
+    return (project(copy(transaction), INPUTS_AND_OUTPUTS) for transaction in transactions)
+
+
+@register_query(InMemoryConnection)
+def get_utxo_tree_nodes(conn, paths):
+    return conn.run(lambda db: _find_many(db['utxo_tree'], 'path', [(path,) for path in paths]))
+
+
+@register_query(InMemoryConnection)
+def update_utxo_tree_nodes(conn, nodes, deleted_paths):
+    def query(db):
+        table = db['utxo_tree']
+        _delete_many(table, 'path', [(path,) for path in deleted_paths])
+        for node in nodes:
+            table.upsert('path', (node['path'],), node)
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def delete_utxo_tree(conn):
+    return conn.run(lambda db: db['utxo_tree'].clear())
+
+
+@register_query(InMemoryConnection)
+def get_unspent_outputs(conn, *, query=None):
+    unspent_outputs = conn.run(lambda db: db['utxos'].read(db['utxos'].scan()))
+    if not query:
+        return iter(unspent_outputs)
+    return (unspent_output for unspent_output in unspent_outputs
+            if all(unspent_output.get(key) == value for key, value in query.items()))
+
+
+@register_query(InMemoryConnection)
+def store_pre_commit_state(conn, state):
+    def query(db):
+        table = db['pre_commit']
+        table.clear()
+        table.insert(state)
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def get_pre_commit_state(conn):
+    return conn.run(lambda db: next(iter(db['pre_commit'].read(db['pre_commit'].scan())), None))
+
+
+@register_query(InMemoryConnection)
+def store_schema_version(conn, version):
+    def query(db):
+        table = db['schema_version']
+        table.clear()
+        table.insert({'version': version})
+
+    return conn.run(query)
+
+
+@register_query(InMemoryConnection)
+def get_schema_version(conn):
+    schema_version = conn.run(
+        lambda db: next(iter(db['schema_version'].read(db['schema_version'].scan())), None))
+    return schema_version['version'] if schema_version else None
+
+
+@register_query(InMemoryConnection)
+def store_validator_set(conn, validators_update):
+    return conn.run(lambda db: db['validators'].upsert(
+        'height', (validators_update['height'],), validators_update))
+
+
+@register_query(InMemoryConnection)
+def delete_validator_set(conn, height):
+    return conn.run(lambda db: _delete_many(db['validators'], 'height', [(height,)]))
+
+
+@register_query(InMemoryConnection)
+def store_election(conn, election_id, height, is_concluded):
+    return conn.run(lambda db: db['elections'].upsert(
+        'election_id_height', (height, election_id),
+        {'election_id': election_id, 'height': height, 'is_concluded': is_concluded}))
+
+
+@register_query(InMemoryConnection)
+def store_elections(conn, elections):
+    return conn.run(lambda db: _insert_many(db['elections'], elections))
+
+
+@register_query(InMemoryConnection)
+def delete_elections(conn, height):
+    return conn.run(lambda db: _delete_many(db['elections'], 'election_id_height', [(height,)]))
+
+
+@register_query(InMemoryConnection)
+def get_validator_set(conn, height=None):
+    return conn.run(lambda db: _last(db['validators'], 'height',
+                                     upto=None if height is None else (height,)))
+
+
+@register_query(InMemoryConnection)
+def get_election(conn, election_id):
+    elections = conn.run(lambda db: db['elections'].find('election_id', (election_id,)))
+    return max(elections, key=lambda election: election['height'], default=None)
+
+
+@register_query(InMemoryConnection)
+def get_asset_tokens_for_public_key(conn, asset_id, public_key):
+    transactions = conn.run(lambda db: db['transactions'].find('asset_id', (asset_id,)))
+    return [transaction for transaction in transactions
+            if any(output['public_keys'] == [public_key]
+                   for output in transaction['outputs'])]
+
+
+@register_query(InMemoryConnection)
+def store_abci_chain(conn, height, chain_id, is_synced=True):
+    return conn.run(lambda db: db['abci_chains'].upsert(
+        'height', (height,), {'height': height, 'chain_id': chain_id, 'is_synced': is_synced}))
+
+
+@register_query(InMemoryConnection)
+def delete_abci_chain(conn, height):
+    return conn.run(lambda db: _delete_many(db['abci_chains'], 'height', [(height,)]))
+
+
+@register_query(InMemoryConnection)
+def get_latest_abci_chain(conn):
+    return conn.run(lambda db: _last(db['abci_chains'], 'height'))
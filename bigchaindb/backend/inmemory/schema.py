@@ -0,0 +1,106 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Utils to initialize and drop the database."""
+
+import logging
+
+from bigchaindb import backend
+from bigchaindb.backend.utils import module_dispatch_registrar
+from bigchaindb.backend.inmemory.connection import DATABASES, InMemoryConnection
+from bigchaindb.common.exceptions import DatabaseDoesNotExist
+
+
+logger = logging.getLogger(__name__)
+register_schema = module_dispatch_registrar(backend.schema)
+
+
+ASCENDING = 1
+DESCENDING = -1
+
+# NOTE: the indexes of the MongoDB backend, the `ordered` ones keeping
+#       their keys sorted for the queries on a range of keys. The index on
+#       the inputs of the transactions is left out, as no query uses it,
+#       and `election_id` is added for `get_election`.
+INDEXES = {
+    'transactions': [
+        ('id', dict(unique=True, name='transaction_id')),
+        ('asset.id', dict(name='asset_id')),
+        ('outputs.public_keys', dict(name='outputs')),
+    ],
+    'assets': [
+        ('id', dict(name='asset_id', unique=True)),
+        ('$**', dict(name='text', text=True)),
+    ],
+    'blocks': [
+        ([('height', DESCENDING)], dict(name='height', unique=True, ordered=True)),
+        # a multikey index, with an entry per transaction of each block
+        ('transactions', dict(name='transactions')),
+    ],
+    'metadata': [
+        ('id', dict(name='transaction_id', unique=True)),
+        ('$**', dict(name='text', text=True)),
+    ],
+    'utxos': [
+        ([('transaction_id', ASCENDING),
+          ('output_index', ASCENDING)], dict(name='utxo', unique=True)),
+    ],
+    'spent_outputs': [
+        ([('transaction_id', ASCENDING),
+          ('output_index', ASCENDING)], dict(name='spent_output', unique=True)),
+        ('spent_by', dict(name='spent_by')),
+    ],
+    'owner_outputs': [
+        ('public_key', dict(name='public_key')),
+        ([('transaction_id', ASCENDING),
+          ('output_index', ASCENDING),
+          ('public_key', ASCENDING)], dict(name='owner_output', unique=True, ordered=True)),
+    ],
+    'asset_history': [
+        ([('asset_id', ASCENDING),
+          ('height', ASCENDING),
+          ('position', ASCENDING),
+          ('transaction_id', ASCENDING)], dict(name='asset_history', unique=True, ordered=True)),
+        ('transaction_id', dict(name='transaction_id', unique=True)),
+    ],
+    'utxo_tree': [
+        ('path', dict(name='path', unique=True)),
+    ],
+    'pre_commit': [
+        ('height', dict(name='height', unique=True)),
+    ],
+    'elections': [
+        ([('height', DESCENDING), ('election_id', ASCENDING)],
+         dict(name='election_id_height', unique=True, ordered=True)),
+        ('election_id', dict(name='election_id')),
+    ],
+    'validators': [
+        ('height', dict(name='height', unique=True, ordered=True)),
+    ],
+    'abci_chains': [
+        ('height', dict(name='height', unique=True, ordered=True)),
+        ('chain_id', dict(name='chain_id', unique=True)),
+    ],
+    'schema_version': [],
+}
+
+
+@register_schema(InMemoryConnection)
+def create_database(conn, dbname):
+    logger.info('Create database `%s`.', dbname)
+    conn.run(lambda database: None)
+
+
+@register_schema(InMemoryConnection)
+def create_tables(conn, dbname):
+    for table_name in backend.schema.TABLES:
+        logger.info(f'Create `{table_name}` table.')
+        conn.run(lambda database: database[table_name])
+
+
+@register_schema(InMemoryConnection)
+def drop_database(conn, dbname):
+    if DATABASES.pop(dbname, None) is None:
+        raise DatabaseDoesNotExist('Database `{}` does not exist'.format(dbname))
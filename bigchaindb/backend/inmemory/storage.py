@@ -0,0 +1,306 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""The databases of the in-memory backend: tables of documents, and their
+secondary indexes."""
+
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from itertools import count, product
+from threading import RLock
+
+from bigchaindb.backend.exceptions import DuplicateKeyError
+from bigchaindb.backend.utils import text_values
+
+
+class _Max:
+    """A value greater than any other, bounding the keys of an ordered
+    index that start with a given prefix."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+MAX = _Max()
+
+
+def copy(value):
+    """Return a deep copy of the document ``value``.
+
+    The tuples are copied as lists, as they would be read back from
+    MongoDB.
+    """
+    if isinstance(value, dict):
+        return {key: copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [copy(item) for item in value]
+    return value
+
+
+def field_values(document, path):
+    """Return the values of the dotted ``path`` in ``document``.
+
+    As in a MongoDB multikey index, an array has a value per item, and a
+    missing field has the value ``None``.
+    """
+    values = [document]
+    for name in path.split('.'):
+        values = [item.get(name) for value in values
+                  for item in (value if isinstance(value, list) else [value])
+                  if isinstance(item, dict)]
+    values = [item for value in values
+              for item in (value if isinstance(value, list) else [value])]
+    return values or [None]
+
+
+def fold(text):
+    """Return ``text`` without its case and its diacritics."""
+    return ''.join(char for char in unicodedata.normalize('NFKD', text.casefold())
+                   if not unicodedata.combining(char))
+
+
+def stem(word):
+    """Return the stem of the English ``word``, stripping its most common
+    suffixes."""
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if word.endswith(suffix) and not word.endswith('ss') and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            if suffix in ('ing', 'ed') and word[-1] == word[-2] and word[-1] not in 'lsz':
+                word = word[:-1]
+            break
+    if word.endswith('e') and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def stems(text):
+    """Return the stems of the words of ``text``."""
+    return [stem(word) for word in re.findall(r'\w+', fold(text))]
+
+
+class Index:
+    """A secondary index of a table, mapping the values of its ``fields`` to
+    the ids of the documents.
+
+    The keys of an ``ordered`` index are also kept sorted, for the queries
+    on a range of keys.
+    """
+
+    def __init__(self, fields, name, unique=False, ordered=False):
+        self.name = name
+        self.fields = [fields] if isinstance(fields, str) else [field for field, _ in fields]
+        self.unique = unique
+        self.entries = {}
+        self.keys = [] if ordered else None
+
+    def keys_of(self, document):
+        return set(product(*(field_values(document, field) for field in self.fields)))
+
+    def check(self, document, id_):
+        """Raise :exc:`~.DuplicateKeyError` if storing ``document`` with the
+        id ``id_`` violates the unique index."""
+        if not self.unique:
+            return
+        for key in self.keys_of(document):
+            ids = self.entries.get(key)
+            if ids and (len(ids) > 1 or id_ not in ids):
+                raise DuplicateKeyError('duplicate key {!r} in index `{}`'.format(key, self.name))
+
+    def add(self, document, id_):
+        for key in self.keys_of(document):
+            ids = self.entries.get(key)
+            if ids is None:
+                ids = self.entries[key] = {}
+                if self.keys is not None:
+                    insort(self.keys, key)
+            ids[id_] = None
+
+    def remove(self, document, id_):
+        for key in self.keys_of(document):
+            ids = self.entries[key]
+            del ids[id_]
+            if not ids:
+                del self.entries[key]
+                if self.keys is not None:
+                    del self.keys[bisect_left(self.keys, key)]
+
+    def clear(self):
+        self.entries.clear()
+        if self.keys is not None:
+            self.keys.clear()
+
+    def get(self, key):
+        """Return the ids of the documents with the ``key``, in the order of
+        their insertion."""
+        ids = self.entries.get(key)
+        return sorted(ids) if ids else []
+
+    def find(self, prefix=(), after=None, upto=None, reverse=False):
+        """Return the ids of the documents whose key starts with ``prefix``,
+        in the order of the keys.
+
+        Args:
+            prefix (tuple): the first values of the keys.
+            after (tuple, optional): only the keys greater than it.
+            upto (tuple, optional): only the keys lower than, or equal
+                to it.
+            reverse (bool): in the descending order of the keys.
+        """
+        start = bisect_left(self.keys, prefix)
+        if after is not None:
+            start = max(start, bisect_right(self.keys, after))
+        stop = bisect_left(self.keys, prefix + (MAX,))
+        if upto is not None:
+            stop = min(stop, bisect_right(self.keys, upto))
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        return [id_ for position in positions for id_ in sorted(self.entries[self.keys[position]])]
+
+
+class TextIndex:
+    """A text index on all the strings of the documents, as a MongoDB
+    wildcard text index, mapping the stems of their words to the ids of
+    the documents and the number of occurrences."""
+
+    def __init__(self, name):
+        self.name = name
+        self.entries = {}
+        # the number of words of every document
+        self.lengths = {}
+
+    def check(self, document, id_):
+        pass
+
+    def add(self, document, id_):
+        words = stems('\n'.join(text_values(document)))
+        self.lengths[id_] = len(words)
+        for word, occurrences in Counter(words).items():
+            self.entries.setdefault(word, {})[id_] = occurrences
+
+    def remove(self, document, id_):
+        del self.lengths[id_]
+        for word in set(stems('\n'.join(text_values(document)))):
+            ids = self.entries[word]
+            del ids[id_]
+            if not ids:
+                del self.entries[word]
+
+    def clear(self):
+        self.entries.clear()
+        self.lengths.clear()
+
+    def get(self, word):
+        """Return the ids of the documents with the stem ``word``, mapped
+        to its number of occurrences."""
+        return self.entries.get(word, {})
+
+
+class Table:
+    """The documents of a table, and its indexes.
+
+    The documents are copied when they are stored, so that the table is
+    not changed by the objects of the caller.
+    """
+
+    def __init__(self, name, indexes=()):
+        self.name = name
+        self.documents = {}
+        self.indexes = {}
+        self.text_index = None
+        self._ids = count()
+        for fields, options in indexes:
+            if options.get('text'):
+                self.text_index = TextIndex(options['name'])
+            else:
+                self.indexes[options['name']] = Index(fields, **options)
+
+    def _all_indexes(self):
+        if self.text_index is None:
+            return self.indexes.values()
+        return [*self.indexes.values(), self.text_index]
+
+    def insert(self, document):
+        """Store ``document``, returning its id."""
+        id_ = next(self._ids)
+        document = copy(document)
+        for index in self.indexes.values():
+            index.check(document, id_)
+        self.documents[id_] = document
+        for index in self._all_indexes():
+            index.add(document, id_)
+        return id_
+
+    def replace(self, id_, document):
+        """Replace the document ``id_`` by ``document``, which keeps its
+        position in the table."""
+        document = copy(document)
+        for index in self.indexes.values():
+            index.check(document, id_)
+        for index in self._all_indexes():
+            index.remove(self.documents[id_], id_)
+        self.documents[id_] = document
+        for index in self._all_indexes():
+            index.add(document, id_)
+
+    def upsert(self, index, key, document):
+        """Replace the first document with the ``key`` in ``index`` by
+        ``document``, or store it if there is none."""
+        ids = self.indexes[index].get(key)
+        if ids:
+            self.replace(ids[0], document)
+        else:
+            self.insert(document)
+
+    def delete(self, id_):
+        document = self.documents.pop(id_)
+        for index in self._all_indexes():
+            index.remove(document, id_)
+
+    def clear(self):
+        self.documents.clear()
+        for index in self._all_indexes():
+            index.clear()
+
+    def read(self, ids):
+        """Return a copy of the documents ``ids``."""
+        return [copy(self.documents[id_]) for id_ in ids]
+
+    def find(self, index, key):
+        """Return a copy of the documents with the ``key`` in ``index``."""
+        return self.read(self.indexes[index].get(key))
+
+    def find_one(self, index, key):
+        ids = self.indexes[index].get(key)
+        return copy(self.documents[ids[0]]) if ids else None
+
+    def scan(self):
+        """Return the ids of all the documents, in the order of their
+        insertion."""
+        return list(self.documents)
+
+
+class Database:
+    """The tables of an in-memory database.
+
+    As MongoDB creates the collections on their first use, the tables are
+    created when they are first accessed. The queries are serialized by
+    the ``lock`` of the database.
+    """
+
+    def __init__(self, name, indexes):
+        self.name = name
+        self.lock = RLock()
+        self.tables = {}
+        self._indexes = indexes
+
+    def __getitem__(self, name):
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = Table(name, self._indexes.get(name, ()))
+        return table
@@ -7,6 +7,8 @@ import logging
 from ssl import CERT_REQUIRED
 
 import pymongo
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
 
 from bigchaindb.backend.connection import Connection
 from bigchaindb.backend.exceptions import (DuplicateKeyError,
@@ -18,17 +20,27 @@ from bigchaindb.utils import Lazy
 
 logger = logging.getLogger(__name__)
 
+# the code of the errors raised by MongoDB on a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
 
 class LocalMongoDBConnection(Connection):
 
     def __init__(self, replicaset=None, ssl=None, login=None, password=None,
                  ca_cert=None, certfile=None, keyfile=None,
-                 keyfile_passphrase=None, crlfile=None, **kwargs):
+                 keyfile_passphrase=None, crlfile=None, durability=None,
+                 durability_profiles=None, **kwargs):
         """Create a new Connection instance.
 
         Args:
             replicaset (str, optional): the name of the replica set to
                                         connect to.
+            durability (str, optional): the name of the durability profile
+                the collections are used with. If None, they are used
+                with the write and read concerns of the server.
+            durability_profiles (dict, optional): the durability profiles,
+                mapping the names of the collections, or ``default``, to
+                their write concern and ``read_concern`` level.
             **kwargs: arbitrary keyword arguments provided by the
                 configuration's ``database`` settings
         """
@@ -43,6 +55,14 @@ class LocalMongoDBConnection(Connection):
         self.keyfile = keyfile or get_bigchaindb_config_value('keyfile')
         self.keyfile_passphrase = keyfile_passphrase or get_bigchaindb_config_value('keyfile_passphrase')
         self.crlfile = crlfile or get_bigchaindb_config_value('crlfile')
+        self.durability = durability or get_bigchaindb_config_value('durability')
+        durability_profiles = durability_profiles or get_bigchaindb_config_value('durability_profiles', {})
+        if self.durability is None:
+            self.collection_options = {}
+        elif self.durability in durability_profiles:
+            self.collection_options = collection_options(durability_profiles[self.durability])
+        else:
+            raise ConfigurationError('Durability profile `{}` is not defined'.format(self.durability))
 
     @property
     def db(self):
@@ -54,10 +74,14 @@ class LocalMongoDBConnection(Connection):
     def collection(self, name):
         """Return a lazy object that can be used to compose a query.
 
+        The collection is used with the write and read concerns of the
+        durability profile.
+
         Args:
             name (str): the name of the collection to query.
         """
-        return self.query()[self.dbname][name]
+        options = self.collection_options.get(name, self.collection_options.get('default', {}))
+        return self.query()[self.dbname].get_collection(name, **options)
 
     def run(self, query):
         try:
@@ -71,6 +95,11 @@ class LocalMongoDBConnection(Connection):
             raise ConnectionError from exc
         except pymongo.errors.DuplicateKeyError as exc:
             raise DuplicateKeyError from exc
+        except pymongo.errors.BulkWriteError as exc:
+            if all(error['code'] == DUPLICATE_KEY_ERROR
+                   for error in exc.details['writeErrors']):
+                raise DuplicateKeyError from exc
+            raise OperationError from exc
         except pymongo.errors.OperationFailure as exc:
             print(f'DETAILS: {exc.details}')
             raise OperationError from exc
@@ -131,6 +160,35 @@ class LocalMongoDBConnection(Connection):
             raise ConfigurationError from exc
 
 
+def collection_options(profile):
+    """Return the options of the collections for a durability ``profile``.
+
+    Args:
+        profile (dict): the names of the collections, or ``default``,
+            mapped to the options of a :class:`~pymongo.write_concern.WriteConcern`
+            (``w``, ``j``, ``wtimeout``), and an optional ``read_concern``
+            level.
+
+    Raises:
+        :exc:`~ConfigurationError`: If a write concern is invalid.
+    """
+    options = {}
+    for name, concern in profile.items():
+        concern = dict(concern)
+        read_concern = concern.pop('read_concern', None)
+        # NOTE: the settings read from the environment are strings, while a
+        #       string `w` is the name of a tag set
+        if isinstance(concern.get('w'), str) and concern['w'].isdigit():
+            concern['w'] = int(concern['w'])
+        try:
+            options[name] = {'write_concern': WriteConcern(**concern)}
+        except (TypeError, ValueError, pymongo.errors.ConfigurationError) as exc:
+            raise ConfigurationError('Invalid write concern for `{}`: {}'.format(name, exc)) from exc
+        if read_concern is not None:
+            options[name]['read_concern'] = ReadConcern(read_concern)
+    return options
+
+
 MONGO_OPTS = {
     'socketTimeoutMS': 20000,
 }
@@ -5,7 +5,8 @@
 
 """Query implementation for MongoDB"""
 
-from pymongo import DESCENDING
+from pymongo import (ASCENDING, DESCENDING, DeleteMany, DeleteOne, ReplaceOne,
+                     UpdateMany, UpdateOne)
 
 from bigchaindb import backend
 from bigchaindb.backend.exceptions import DuplicateKeyError
@@ -40,6 +41,45 @@ def get_transactions(conn, transaction_ids):
         pass
 
 
+@register_query(LocalMongoDBConnection)
+def get_transaction_ids(conn):
+    cursor = conn.run(
+        conn.collection('transactions')
+        .find({}, projection={'_id': False, 'id': True}))
+    return (transaction['id'] for transaction in cursor)
+
+
+@register_query(LocalMongoDBConnection)
+def get_full_transactions(conn, transaction_ids):
+    # NOTE: the asset of a `CREATE` transaction and the metadata of every
+    #       transaction are stored apart, with the id of the transaction
+    cursor = conn.run(
+        conn.collection('transactions')
+        .aggregate([
+            {'$match': {'id': {'$in': transaction_ids}}},
+            {'$lookup': {'from': 'assets', 'localField': 'id',
+                         'foreignField': 'id', 'as': '_assets'}},
+            {'$lookup': {'from': 'metadata', 'localField': 'id',
+                         'foreignField': 'id', 'as': '_metadata'}},
+            {'$project': {'_id': False,
+                          '_assets._id': False, '_assets.id': False,
+                          '_metadata._id': False}},
+        ]))
+
+    transactions = {}
+    for transaction in cursor:
+        assets = transaction.pop('_assets')
+        metadata = transaction.pop('_metadata')
+        if assets:
+            transaction['asset'] = assets[0]
+        if 'metadata' not in transaction:
+            transaction['metadata'] = metadata[0].get('metadata') if metadata else None
+        transactions[transaction['id']] = transaction
+
+    return [transactions[transaction_id] for transaction_id in transaction_ids
+            if transaction_id in transactions]
+
+
 @register_query(LocalMongoDBConnection)
 def store_metadatas(conn, metadata):
     return conn.run(
@@ -92,14 +132,21 @@ def get_assets(conn, asset_ids):
 
 @register_query(LocalMongoDBConnection)
 def get_spent(conn, transaction_id, output):
-    query = {'inputs':
-             {'$elemMatch':
-              {'$and': [{'fulfills.transaction_id': transaction_id},
-                        {'fulfills.output_index': output}]}}}
+    return _get_spending_transactions(
+        conn, {'transaction_id': transaction_id, 'output_index': output})
+
 
+def _get_spending_transactions(conn, match):
     return conn.run(
-        conn.collection('transactions')
-            .find(query, {'_id': 0}))
+        conn.collection('spent_outputs')
+        .aggregate([
+            {'$match': match},
+            {'$lookup': {'from': 'transactions', 'localField': 'spent_by',
+                         'foreignField': 'id', 'as': 'transaction'}},
+            {'$unwind': '$transaction'},
+            {'$replaceRoot': {'newRoot': '$transaction'}},
+            {'$project': {'_id': False}},
+        ]))
 
 
 @register_query(LocalMongoDBConnection)
@@ -122,19 +169,71 @@ def store_block(conn, block):
 
 @register_query(LocalMongoDBConnection)
 def get_txids_filtered(conn, asset_id, operation=None, last_tx=None):
+    # NOTE: an asset has a single `CREATE` transaction, its first one
+    if last_tx and operation != Transaction.CREATE:
+        cursor = _get_asset_history(conn, asset_id, operation,
+                                    direction=DESCENDING).limit(1)
+    else:
+        cursor = _get_asset_history(conn, asset_id, operation)
+        if last_tx:
+            cursor = cursor.limit(1)
+
+    return (elem['transaction_id'] for elem in cursor)
+
+
+@register_query(LocalMongoDBConnection)
+def get_asset_history(conn, asset_id, operation=None, after=None, limit=0):
+    return _get_asset_history(conn, asset_id, operation, after).limit(limit)
+
+
+def _get_asset_history(conn, asset_id, operation=None, after=None,
+                       direction=ASCENDING):
+    query = {'asset_id': asset_id}
+    if operation:
+        query['operation'] = operation
+    if after:
+        height, position, transaction_id = after
+        query['$or'] = [
+            {'height': {'$gt': height}},
+            {'height': height, 'position': {'$gt': position}},
+            {'height': height, 'position': position,
+             'transaction_id': {'$gt': transaction_id}},
+        ]
+    return conn.run(
+        conn.collection('asset_history')
+        .find(query, {'_id': 0})
+        .sort([('asset_id', direction), ('height', direction),
+               ('position', direction), ('transaction_id', direction)]))
 
-    match = {
-        Transaction.CREATE: {'operation': 'CREATE', 'id': asset_id},
-        Transaction.TRANSFER: {'operation': 'TRANSFER', 'asset.id': asset_id},
-        None: {'$or': [{'asset.id': asset_id}, {'id': asset_id}]},
-    }[operation]
 
-    cursor = conn.run(conn.collection('transactions').find(match))
+@register_query(LocalMongoDBConnection)
+def store_asset_history(conn, asset_history):
+    operations = [
+        UpdateOne({'transaction_id': record['transaction_id']},
+                  {'$setOnInsert': record}, upsert=True)
+        for record in asset_history
+    ]
+    if operations:
+        return conn.run(
+            conn.collection('asset_history')
+            .bulk_write(operations, ordered=False))
+
 
-    if last_tx:
-        cursor = cursor.sort([('$natural', DESCENDING)]).limit(1)
+@register_query(LocalMongoDBConnection)
+def delete_all_asset_history(conn):
+    return conn.run(conn.collection('asset_history').delete_many({}))
 
-    return (elem['id'] for elem in cursor)
+
+@register_query(LocalMongoDBConnection)
+def get_block_transaction_ids(conn):
+    return conn.run(
+        conn.collection('blocks')
+        .aggregate([
+            {'$unwind': {'path': '$transactions',
+                         'includeArrayIndex': 'position'}},
+            {'$project': {'_id': False, 'height': True, 'position': True,
+                          'transaction_id': '$transactions'}},
+        ]))
 
 
 @register_query(LocalMongoDBConnection)
@@ -174,19 +273,12 @@ def get_owned_ids(conn, owner):
 
 @register_query(LocalMongoDBConnection)
 def get_spending_transactions(conn, inputs):
-    transaction_ids = [i['transaction_id'] for i in inputs]
-    output_indexes = [i['output_index'] for i in inputs]
-    query = {'inputs':
-             {'$elemMatch':
-              {'$and':
-               [
-                   {'fulfills.transaction_id': {'$in': transaction_ids}},
-                   {'fulfills.output_index': {'$in': output_indexes}}
-               ]}}}
-
-    cursor = conn.run(
-        conn.collection('transactions').find(query, {'_id': False}))
-    return cursor
+    if not inputs:
+        return []
+    return _get_spending_transactions(
+        conn, {'$or': [{'transaction_id': input_['transaction_id'],
+                        'output_index': input_['output_index']}
+                       for input_ in inputs]})
 
 
 @register_query(LocalMongoDBConnection)
@@ -210,6 +302,20 @@ def delete_transactions(conn, txn_ids):
     conn.run(conn.collection('assets').delete_many({'id': {'$in': txn_ids}}))
     conn.run(conn.collection('metadata').delete_many({'id': {'$in': txn_ids}}))
     conn.run(conn.collection('transactions').delete_many({'id': {'$in': txn_ids}}))
+    conn.run(conn.collection('asset_history').delete_many({'transaction_id': {'$in': txn_ids}}))
+
+    spent_outputs = list(conn.run(
+        conn.collection('spent_outputs')
+        .find({'spent_by': {'$in': txn_ids}}, {'_id': 0})))
+    operations = [DeleteMany({'transaction_id': {'$in': txn_ids}})]
+    operations.extend(
+        UpdateMany({'transaction_id': spent_output['transaction_id'],
+                    'output_index': spent_output['output_index']},
+                   {'$set': {'spent': False}})
+        for spent_output in spent_outputs
+    )
+    conn.run(conn.collection('owner_outputs').bulk_write(operations))
+    conn.run(conn.collection('spent_outputs').delete_many({'spent_by': {'$in': txn_ids}}))
 
 
 @register_query(LocalMongoDBConnection)
@@ -242,6 +348,181 @@ def delete_unspent_outputs(conn, *unspent_outputs):
         )
 
 
+@register_query(LocalMongoDBConnection)
+def update_unspent_outputs(conn, spent_outputs, unspent_outputs):
+    operations = [
+        DeleteOne({'transaction_id': spent_output['transaction_id'],
+                   'output_index': spent_output['output_index']})
+        for spent_output in spent_outputs
+    ]
+    operations.extend(
+        ReplaceOne({'transaction_id': unspent_output['transaction_id'],
+                    'output_index': unspent_output['output_index']},
+                   unspent_output, upsert=True)
+        for unspent_output in unspent_outputs
+    )
+    if operations:
+        return conn.run(
+            conn.collection('utxos')
+            .bulk_write(operations, ordered=False))
+
+
+@register_query(LocalMongoDBConnection)
+def delete_all_unspent_outputs(conn):
+    return conn.run(conn.collection('utxos').delete_many({}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_unspent_output(conn, transaction_id, output_index):
+    return conn.run(
+        conn.collection('utxos')
+        .find_one({'transaction_id': transaction_id,
+                   'output_index': output_index},
+                  {'_id': 0}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_unspent_outputs_by_links(conn, links):
+    if not links:
+        return []
+    return conn.run(
+        conn.collection('utxos')
+        .find({'$or': [{'transaction_id': transaction_id,
+                        'output_index': output_index}
+                       for transaction_id, output_index in links]},
+              {'_id': 0}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_transaction_outputs(conn, transaction_ids):
+    return conn.run(
+        conn.collection('transactions')
+        .find({'id': {'$in': list(transaction_ids)}},
+              projection={'_id': False, 'id': True, 'operation': True,
+                          'asset.id': True, 'outputs.amount': True,
+                          'outputs.condition.uri': True}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_spent_outputs(conn, links):
+    if not links:
+        return []
+    return conn.run(
+        conn.collection('spent_outputs')
+        .find({'$or': [{'transaction_id': transaction_id,
+                        'output_index': output_index}
+                       for transaction_id, output_index in links]},
+              {'_id': 0}))
+
+
+@register_query(LocalMongoDBConnection)
+def store_spent_outputs(conn, spent_outputs):
+    # NOTE: storing the spent outputs of a block again is a no-op, while
+    #       storing an output spent by another transaction violates the
+    #       unique index on `(transaction_id, output_index)`
+    operations = [
+        UpdateOne({'transaction_id': spent_output['transaction_id'],
+                   'output_index': spent_output['output_index'],
+                   'spent_by': spent_output['spent_by']},
+                  {'$setOnInsert': {'height': spent_output['height']}}, upsert=True)
+        for spent_output in spent_outputs
+    ]
+    if not operations:
+        return
+    try:
+        return conn.run(
+            conn.collection('spent_outputs')
+            .bulk_write(operations))
+    except DuplicateKeyError as exc:
+        # NOTE: the ordered writes stop at the first conflict, the records
+        #       stored before it are removed so that none are left behind
+        upserted = [upsert['_id'] for upsert in exc.__cause__.details.get('upserted', [])]
+        if upserted:
+            conn.run(
+                conn.collection('spent_outputs')
+                .delete_many({'_id': {'$in': upserted}}))
+        raise
+
+
+@register_query(LocalMongoDBConnection)
+def delete_all_spent_outputs(conn):
+    return conn.run(conn.collection('spent_outputs').delete_many({}))
+
+
+@register_query(LocalMongoDBConnection)
+def store_owner_outputs(conn, owner_outputs, spent_outputs):
+    # NOTE: the operations are ordered, so that the outputs created and
+    #       spent by the same block are stored as spent
+    operations = [
+        UpdateOne({'public_key': owner_output['public_key'],
+                   'transaction_id': owner_output['transaction_id'],
+                   'output_index': owner_output['output_index']},
+                  {'$setOnInsert': owner_output}, upsert=True)
+        for owner_output in owner_outputs
+    ]
+    operations.extend(
+        UpdateMany({'transaction_id': spent_output['transaction_id'],
+                    'output_index': spent_output['output_index']},
+                   {'$set': {'spent': True}})
+        for spent_output in spent_outputs
+    )
+    if operations:
+        return conn.run(
+            conn.collection('owner_outputs')
+            .bulk_write(operations))
+
+
+@register_query(LocalMongoDBConnection)
+def get_owner_outputs(conn, public_keys, spent=None):
+    query = {'public_key': {'$in': list(public_keys)}}
+    if spent is not None:
+        query['spent'] = spent
+    return conn.run(
+        conn.collection('owner_outputs')
+        .find(query, {'_id': 0})
+        .sort([('_id', ASCENDING)]))
+
+
+@register_query(LocalMongoDBConnection)
+def delete_all_owner_outputs(conn):
+    return conn.run(conn.collection('owner_outputs').delete_many({}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_inputs_and_outputs(conn):
+    return conn.run(
+        conn.collection('transactions')
+        .find({}, projection={'_id': False, 'id': True, 'operation': True,
+                              'asset': True, 'inputs.fulfills': True,
+                              'outputs.amount': True,
+                              'outputs.public_keys': True,
+                              'outputs.condition': True}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_utxo_tree_nodes(conn, paths):
+    return conn.run(
+        conn.collection('utxo_tree')
+        .find({'path': {'$in': paths}},
+              projection={'_id': False}))
+
+
+@register_query(LocalMongoDBConnection)
+def update_utxo_tree_nodes(conn, nodes, deleted_paths):
+    operations = [DeleteOne({'path': path}) for path in deleted_paths]
+    operations.extend(ReplaceOne({'path': node['path']}, node, upsert=True)
+                      for node in nodes)
+    if operations:
+        return conn.run(
+            conn.collection('utxo_tree')
+            .bulk_write(operations, ordered=False))
+
+
+@register_query(LocalMongoDBConnection)
+def delete_utxo_tree(conn):
+    return conn.run(conn.collection('utxo_tree').delete_many({}))
+
+
 @register_query(LocalMongoDBConnection)
 def get_unspent_outputs(conn, *, query=None):
     if query is None:
@@ -263,6 +544,20 @@ def get_pre_commit_state(conn):
     return conn.run(conn.collection('pre_commit').find_one())
 
 
+@register_query(LocalMongoDBConnection)
+def store_schema_version(conn, version):
+    return conn.run(
+        conn.collection('schema_version')
+        .replace_one({}, {'version': version}, upsert=True)
+    )
+
+
+@register_query(LocalMongoDBConnection)
+def get_schema_version(conn):
+    schema_version = conn.run(conn.collection('schema_version').find_one())
+    return schema_version['version'] if schema_version else None
+
+
 @register_query(LocalMongoDBConnection)
 def store_validator_set(conn, validators_update):
     height = validators_update['height']
@@ -33,6 +33,8 @@ INDEXES = {
     ],
     'blocks': [
         ([('height', DESCENDING)], dict(name='height', unique=True)),
+        # a multikey index, with an entry per transaction of each block
+        ('transactions', dict(name='transactions')),
     ],
     'metadata': [
         ('id', dict(name='transaction_id', unique=True)),
@@ -42,6 +44,27 @@ INDEXES = {
         ([('transaction_id', ASCENDING),
           ('output_index', ASCENDING)], dict(name='utxo', unique=True)),
     ],
+    'spent_outputs': [
+        ([('transaction_id', ASCENDING),
+          ('output_index', ASCENDING)], dict(name='spent_output', unique=True)),
+        ('spent_by', dict(name='spent_by')),
+    ],
+    'owner_outputs': [
+        ([('public_key', ASCENDING), ('_id', ASCENDING)], dict(name='public_key')),
+        ([('transaction_id', ASCENDING),
+          ('output_index', ASCENDING),
+          ('public_key', ASCENDING)], dict(name='owner_output', unique=True)),
+    ],
+    'asset_history': [
+        ([('asset_id', ASCENDING),
+          ('height', ASCENDING),
+          ('position', ASCENDING),
+          ('transaction_id', ASCENDING)], dict(name='asset_history', unique=True)),
+        ('transaction_id', dict(name='transaction_id', unique=True)),
+    ],
+    'utxo_tree': [
+        ('path', dict(name='path', unique=True)),
+    ],
     'pre_commit': [
         ('height', dict(name='height', unique=True)),
     ],
@@ -56,13 +79,16 @@ INDEXES = {
         ('height', dict(name='height', unique=True)),
         ('chain_id', dict(name='chain_id', unique=True)),
     ],
+    'schema_version': [],
 }
 
 
 @register_schema(LocalMongoDBConnection)
 def create_database(conn, dbname):
     logger.info('Create database `%s`.', dbname)
-    # TODO: read and write concerns can be declared here
+    # NOTE: the write and read concerns are not stored by MongoDB, the
+    #       collections are used with those of the durability profile by
+    #       `LocalMongoDBConnection.collection`
     conn.conn.get_database(dbname)
 
 
@@ -70,7 +96,6 @@ def create_database(conn, dbname):
 def create_tables(conn, dbname):
     for table_name in backend.schema.TABLES:
         # create the table
-        # TODO: read and write concerns can be declared here
         try:
             logger.info(f'Create `{table_name}` table.')
             conn.conn[dbname].create_collection(table_name)
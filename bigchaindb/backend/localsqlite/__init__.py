@@ -0,0 +1,27 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""SQLite backend implementation.
+
+Contains a SQLite-specific implementation of the
+:mod:`~bigchaindb.backend.schema` and :mod:`~bigchaindb.backend.query` interfaces.
+
+The database is a single file, embedded in the BigchainDB process: there is
+no database server to run. You can specify BigchainDB to use SQLite as its
+database backend by either setting ``database.backend`` to ``'localsqlite'``
+in your configuration file, or setting the ``BIGCHAINDB_DATABASE_BACKEND``
+environment variable to ``'localsqlite'``.
+
+If configured to use SQLite, BigchainDB will automatically return instances
+of :class:`~bigchaindb.backend.localsqlite.connection.LocalSQLiteConnection` for
+:func:`~bigchaindb.backend.connection.connect` and dispatch calls of the
+generic backend interfaces to the implementations in this module.
+"""
+
+# Register the single dispatched modules on import.
+from bigchaindb.backend.localsqlite import schema, query # noqa
+
+# LocalSQLiteConnection should always be accessed via
+# ``bigchaindb.backend.connect()``.
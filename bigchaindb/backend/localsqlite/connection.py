@@ -0,0 +1,152 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+from threading import RLock
+
+from bigchaindb.backend.connection import Connection
+from bigchaindb.backend.exceptions import (DuplicateKeyError,
+                                           OperationError,
+                                           ConnectionError)
+from bigchaindb.backend.utils import get_bigchaindb_config_value
+
+logger = logging.getLogger(__name__)
+
+# the number of rows read at a time when iterating over a query
+FETCH_SIZE = 1000
+
+
+class LocalSQLiteConnection(Connection):
+    """A connection to a database stored in a SQLite file.
+
+    The database is the file ``<name>.sqlite`` in the ``directory`` of the
+    configuration. It is opened in WAL mode, so that the HTTP API reads
+    while the ABCI application writes.
+
+    A single :class:`sqlite3.Connection` is shared by the threads of the
+    process, its use being serialized by a lock.
+    """
+
+    def __init__(self, directory=None, **kwargs):
+        """Create a new Connection instance.
+
+        Args:
+            directory (str, optional): the directory of the database file.
+            **kwargs: arbitrary keyword arguments provided by the
+                configuration's ``database`` settings
+        """
+
+        super().__init__(**kwargs)
+        self.directory = directory or get_bigchaindb_config_value('directory', '.')
+        self.lock = RLock()
+        # the depth of the nested calls to `transaction`
+        self._transaction_depth = 0
+
+    @property
+    def path(self):
+        return os.path.join(os.path.expanduser(self.directory),
+                            '{}.sqlite'.format(self.dbname))
+
+    def run(self, query):
+        """Run ``query``, a function of the :class:`sqlite3.Connection`."""
+
+        with self.lock:
+            try:
+                return query(self.conn)
+            except sqlite3.IntegrityError as exc:
+                if 'UNIQUE constraint failed' in str(exc):
+                    raise DuplicateKeyError(str(exc)) from exc
+                raise OperationError(str(exc)) from exc
+            except sqlite3.Error as exc:
+                raise OperationError(str(exc)) from exc
+
+    def execute(self, sql, parameters=()):
+        """Execute a statement, returning all the rows it selects."""
+
+        return self.run(lambda conn: conn.execute(sql, parameters).fetchall())
+
+    def executemany(self, sql, seq_of_parameters):
+        """Execute a statement for each item of ``seq_of_parameters``."""
+
+        return self.run(lambda conn: conn.executemany(sql, seq_of_parameters).rowcount)
+
+    def iterate(self, sql, parameters=()):
+        """Execute a statement, yielding the rows it selects.
+
+        The rows are fetched :data:`FETCH_SIZE` at a time, so that large
+        tables are scanned without being loaded in memory.
+        """
+
+        cursor = self.run(lambda conn: conn.execute(sql, parameters))
+        while True:
+            rows = self.run(lambda conn: cursor.fetchmany(FETCH_SIZE))
+            if not rows:
+                break
+            yield from rows
+
+    @contextmanager
+    def transaction(self):
+        """Run the queries of the block in a single transaction.
+
+        The transactions nest: only the outermost one commits, and an
+        exception raised by any of them rolls all of them back.
+        """
+
+        with self.lock:
+            if self._transaction_depth == 0:
+                self.run(lambda conn: conn.execute('BEGIN IMMEDIATE'))
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0 and self.conn.in_transaction:
+                    self.run(lambda conn: conn.execute('ROLLBACK'))
+                raise
+            else:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.run(lambda conn: conn.execute('COMMIT'))
+
+    def close(self):
+        """Close the database file."""
+
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self):
+        """Try to open the database file.
+
+        Raises:
+            :exc:`~ConnectionError`: If the file can't be opened.
+        """
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # NOTE: the transactions are managed explicitly, see
+            #       `transaction`
+            conn = sqlite3.connect(self.path,
+                                   timeout=self.connection_timeout / 1000,
+                                   isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            # with WAL, a crash can't corrupt the database, it can only lose
+            # the last transactions, which Tendermint replays on restart
+            conn.execute('PRAGMA synchronous=NORMAL')
+            # as MongoDB creates the collections on their first use, the
+            # tables are created when the file is opened
+            from bigchaindb.backend.localsqlite.schema import STATEMENTS
+            for statements in STATEMENTS.values():
+                for statement in statements:
+                    conn.execute(statement)
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.info('Exception in _connect(): {}'.format(exc))
+            raise ConnectionError(str(exc)) from exc
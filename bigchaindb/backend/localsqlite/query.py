@@ -0,0 +1,636 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Query implementation for SQLite"""
+
+import rapidjson
+
+from bigchaindb import backend
+from bigchaindb.backend.exceptions import DuplicateKeyError
+from bigchaindb.backend.utils import (module_dispatch_registrar, parse_text_search,
+                                      project, text_values)
+from bigchaindb.backend.localsqlite.connection import LocalSQLiteConnection
+from bigchaindb.common.transaction import Transaction
+
+register_query = module_dispatch_registrar(backend.query)
+
+# NOTE: the lists of values are passed as a single JSON array, so that they
+#       are not limited by the number of parameters of a statement
+IN_VALUES = 'IN (SELECT value FROM json_each(?))'
+IN_LINKS = ('IN (SELECT json_extract(value, \'$[0]\'), json_extract(value, \'$[1]\') '
+            'FROM json_each(?))')
+
+
+def _dumps(value):
+    return rapidjson.dumps(value)
+
+
+def _docs(rows):
+    return [rapidjson.loads(doc) for doc, *_ in rows]
+
+
+def _doc(rows):
+    return rapidjson.loads(rows[0][0]) if rows else None
+
+
+@register_query(LocalSQLiteConnection)
+def store_transactions(conn, signed_transactions):
+    with conn.transaction():
+        conn.executemany(
+            'INSERT INTO transactions (id, asset_id, doc) VALUES (?, ?, ?)',
+            [(transaction['id'], (transaction.get('asset') or {}).get('id'),
+              _dumps(transaction))
+             for transaction in signed_transactions])
+        conn.executemany(
+            'INSERT OR IGNORE INTO transaction_public_keys (public_key, transaction_id) VALUES (?, ?)',
+            [(public_key, transaction['id'])
+             for transaction in signed_transactions
+             for output in transaction['outputs']
+             for public_key in output['public_keys']])
+
+
+@register_query(LocalSQLiteConnection)
+def get_transaction(conn, transaction_id):
+    return _doc(conn.execute('SELECT doc FROM transactions WHERE id = ?',
+                             (transaction_id,)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_transactions(conn, transaction_ids):
+    return _docs(conn.execute(
+        'SELECT doc FROM transactions WHERE id {} ORDER BY rowid'.format(IN_VALUES),
+        (_dumps(list(transaction_ids)),)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_transaction_ids(conn):
+    return (transaction_id for transaction_id, in conn.iterate('SELECT id FROM transactions'))
+
+
+@register_query(LocalSQLiteConnection)
+def get_full_transactions(conn, transaction_ids):
+    # NOTE: the asset of a `CREATE` transaction and the metadata of every
+    #       transaction are stored apart, with the id of the transaction
+    rows = conn.execute(
+        'SELECT transactions.doc, assets.doc, metadata.doc FROM transactions '
+        'LEFT JOIN assets ON assets.id = transactions.id '
+        'LEFT JOIN metadata ON metadata.id = transactions.id '
+        'WHERE transactions.id {}'.format(IN_VALUES),
+        (_dumps(list(transaction_ids)),))
+
+    transactions = {}
+    for transaction, asset, metadata in rows:
+        transaction = rapidjson.loads(transaction)
+        if asset is not None:
+            transaction['asset'] = rapidjson.loads(asset)
+            transaction['asset'].pop('id', None)
+        if 'metadata' not in transaction:
+            transaction['metadata'] = rapidjson.loads(metadata).get('metadata') if metadata else None
+        transactions[transaction['id']] = transaction
+
+    return [transactions[transaction_id] for transaction_id in transaction_ids
+            if transaction_id in transactions]
+
+
+def _store_documents(conn, table, documents):
+    """Insert ``documents`` in ``table``, and in its text index, skipping
+    the ones whose ``id`` is already stored.
+
+    Returns:
+        int: the number of documents skipped.
+    """
+    duplicates = 0
+    with conn.transaction():
+        for document in documents:
+            inserted = conn.run(lambda c: c.execute(
+                'INSERT OR IGNORE INTO {} (id, doc) VALUES (?, ?)'.format(table),
+                (document['id'], _dumps(document))).rowcount)
+            if inserted:
+                conn.execute('INSERT INTO {}_text (id, text) VALUES (?, ?)'.format(table),
+                             (document['id'], '\n'.join(text_values(document))))
+            else:
+                duplicates += 1
+    return duplicates
+
+
+@register_query(LocalSQLiteConnection)
+def store_metadatas(conn, metadata):
+    # NOTE: as an unordered bulk insert, all the new documents are stored
+    #       before the error is raised
+    if _store_documents(conn, 'metadata', metadata):
+        raise DuplicateKeyError('metadata already stored')
+
+
+@register_query(LocalSQLiteConnection)
+def get_metadata(conn, transaction_ids):
+    return _docs(conn.execute(
+        'SELECT doc FROM metadata WHERE id {} ORDER BY rowid'.format(IN_VALUES),
+        (_dumps(list(transaction_ids)),)))
+
+
+@register_query(LocalSQLiteConnection)
+def store_asset(conn, asset):
+    _store_documents(conn, 'assets', [asset])
+
+
+@register_query(LocalSQLiteConnection)
+def store_assets(conn, assets):
+    if _store_documents(conn, 'assets', assets):
+        raise DuplicateKeyError('asset already stored')
+
+
+@register_query(LocalSQLiteConnection)
+def get_asset(conn, asset_id):
+    asset = _doc(conn.execute('SELECT doc FROM assets WHERE id = ?', (asset_id,)))
+    if asset is not None:
+        asset.pop('id', None)
+    return asset
+
+
+@register_query(LocalSQLiteConnection)
+def get_assets(conn, asset_ids):
+    return _docs(conn.execute(
+        'SELECT doc FROM assets WHERE id {} ORDER BY rowid'.format(IN_VALUES),
+        (_dumps(list(asset_ids)),)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_spent(conn, transaction_id, output):
+    return _docs(conn.execute(
+        'SELECT transactions.doc FROM spent_outputs '
+        'JOIN transactions ON transactions.id = spent_outputs.spent_by '
+        'WHERE spent_outputs.transaction_id = ? AND spent_outputs.output_index = ?',
+        (transaction_id, output)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_spending_transactions(conn, inputs):
+    if not inputs:
+        return []
+    return _docs(conn.execute(
+        'SELECT transactions.doc FROM spent_outputs '
+        'JOIN transactions ON transactions.id = spent_outputs.spent_by '
+        'WHERE (spent_outputs.transaction_id, spent_outputs.output_index) {}'.format(IN_LINKS),
+        (_dumps([(input_['transaction_id'], input_['output_index'])
+                 for input_ in inputs]),)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_latest_block(conn):
+    return _doc(conn.execute('SELECT doc FROM blocks ORDER BY height DESC LIMIT 1'))
+
+
+@register_query(LocalSQLiteConnection)
+def store_block(conn, block):
+    with conn.transaction():
+        inserted = conn.run(lambda c: c.execute(
+            'INSERT OR IGNORE INTO blocks (height, doc) VALUES (?, ?)',
+            (block['height'], _dumps(block))).rowcount)
+        if inserted:
+            conn.executemany(
+                'INSERT OR IGNORE INTO block_transactions (transaction_id, height, position) '
+                'VALUES (?, ?, ?)',
+                [(transaction_id, block['height'], position)
+                 for position, transaction_id in enumerate(block['transactions'])])
+
+
+@register_query(LocalSQLiteConnection)
+def get_txids_filtered(conn, asset_id, operation=None, last_tx=None):
+    # NOTE: an asset has a single `CREATE` transaction, its first one
+    descending = last_tx and operation != Transaction.CREATE
+    rows = _get_asset_history(conn, asset_id, operation, limit=1 if last_tx else 0,
+                              descending=descending)
+    return (record['transaction_id'] for record in rows)
+
+
+@register_query(LocalSQLiteConnection)
+def get_asset_history(conn, asset_id, operation=None, after=None, limit=0):
+    return _get_asset_history(conn, asset_id, operation, after, limit)
+
+
+def _get_asset_history(conn, asset_id, operation=None, after=None, limit=0,
+                       descending=False):
+    sql = ('SELECT asset_id, height, position, transaction_id, operation '
+           'FROM asset_history WHERE asset_id = ?')
+    parameters = [asset_id]
+    if operation:
+        sql += ' AND operation = ?'
+        parameters.append(operation)
+    if after:
+        sql += ' AND (height, position, transaction_id) > (?, ?, ?)'
+        parameters.extend(after)
+    direction = 'DESC' if descending else 'ASC'
+    sql += ' ORDER BY height {0}, position {0}, transaction_id {0}'.format(direction)
+    if limit:
+        sql += ' LIMIT ?'
+        parameters.append(limit)
+
+    return [dict(zip(('asset_id', 'height', 'position', 'transaction_id', 'operation'), row))
+            for row in conn.execute(sql, parameters)]
+
+
+@register_query(LocalSQLiteConnection)
+def store_asset_history(conn, asset_history):
+    conn.executemany(
+        'INSERT OR IGNORE INTO asset_history '
+        '(asset_id, height, position, transaction_id, operation) VALUES (?, ?, ?, ?, ?)',
+        [(record['asset_id'], record['height'], record['position'],
+          record['transaction_id'], record['operation'])
+         for record in asset_history])
+
+
+@register_query(LocalSQLiteConnection)
+def delete_all_asset_history(conn):
+    conn.execute('DELETE FROM asset_history')
+
+
+@register_query(LocalSQLiteConnection)
+def get_block_transaction_ids(conn):
+    return ({'height': height, 'position': position, 'transaction_id': transaction_id}
+            for height, position, transaction_id in conn.iterate(
+                'SELECT height, position, transaction_id FROM block_transactions '
+                'ORDER BY height, position'))
+
+
+def _text_query(search):
+    """Translate a MongoDB ``$search`` string into an FTS5 query."""
+    phrases, positive, negated = parse_text_search(search)
+
+    def quote(text):
+        return '"{}"'.format(text.replace('"', '""'))
+
+    if phrases:
+        query = ' AND '.join(quote(phrase) for phrase in phrases)
+    elif positive:
+        query = ' OR '.join(quote(term) for term in positive)
+    else:
+        return None, []
+    if negated:
+        query = '({}) NOT ({})'.format(query, ' OR '.join(quote(term) for term in negated))
+    return query, phrases or positive
+
+
+@register_query(LocalSQLiteConnection)
+def text_search(conn, search, *, language='english', case_sensitive=False,
+                diacritic_sensitive=False, text_score=False, limit=0, table='assets'):
+    # NOTE: the text index stems the English words, and ignores the case
+    #       and the diacritics, the sensitive searches filter its results
+    query, terms = _text_query(search)
+    if query is None:
+        return []
+
+    rows = conn.execute(
+        'SELECT {0}.doc, -bm25({0}_text), {0}_text.text FROM {0}_text '
+        'JOIN {0} ON {0}.id = {0}_text.id '
+        'WHERE {0}_text MATCH ? ORDER BY bm25({0}_text)'.format(table),
+        (query,))
+
+    results = []
+    for doc, score, text in rows:
+        if case_sensitive or diacritic_sensitive:
+            if not case_sensitive:
+                text, terms = text.lower(), [term.lower() for term in terms]
+            if not any(term in text for term in terms):
+                continue
+        doc = rapidjson.loads(doc)
+        if text_score:
+            doc['score'] = score
+        results.append(doc)
+        if len(results) == limit:
+            break
+    return results
+
+
+@register_query(LocalSQLiteConnection)
+def get_owned_ids(conn, owner):
+    return _docs(conn.execute(
+        'SELECT transactions.doc FROM transaction_public_keys '
+        'JOIN transactions ON transactions.id = transaction_public_keys.transaction_id '
+        'WHERE transaction_public_keys.public_key = ? ORDER BY transactions.rowid',
+        (owner,)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_block(conn, block_id):
+    return _doc(conn.execute('SELECT doc FROM blocks WHERE height = ?', (block_id,)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_block_with_transaction(conn, txid):
+    return [{'height': height} for height, in conn.execute(
+        'SELECT height FROM block_transactions WHERE transaction_id = ? ORDER BY height',
+        (txid,))]
+
+
+@register_query(LocalSQLiteConnection)
+def delete_transactions(conn, txn_ids):
+    txn_ids = (_dumps(list(txn_ids)),)
+    with conn.transaction():
+        for table in ('assets', 'assets_text', 'metadata', 'metadata_text', 'transactions'):
+            conn.execute('DELETE FROM {} WHERE id {}'.format(table, IN_VALUES), txn_ids)
+        for table in ('transaction_public_keys', 'asset_history', 'owner_outputs'):
+            conn.execute('DELETE FROM {} WHERE transaction_id {}'.format(table, IN_VALUES), txn_ids)
+        conn.execute(
+            'UPDATE owner_outputs SET spent = 0, doc = json_set(doc, \'$.spent\', json(\'false\')) '
+            'WHERE (transaction_id, output_index) IN '
+            '(SELECT transaction_id, output_index FROM spent_outputs WHERE spent_by {})'.format(IN_VALUES),
+            txn_ids)
+        conn.execute('DELETE FROM spent_outputs WHERE spent_by {}'.format(IN_VALUES), txn_ids)
+
+
+@register_query(LocalSQLiteConnection)
+def store_unspent_outputs(conn, *unspent_outputs):
+    if unspent_outputs:
+        conn.executemany(
+            'INSERT OR IGNORE INTO utxos (transaction_id, output_index, doc) VALUES (?, ?, ?)',
+            [(unspent_output['transaction_id'], unspent_output['output_index'],
+              _dumps(unspent_output))
+             for unspent_output in unspent_outputs])
+
+
+@register_query(LocalSQLiteConnection)
+def delete_unspent_outputs(conn, *unspent_outputs):
+    if unspent_outputs:
+        conn.executemany(
+            'DELETE FROM utxos WHERE transaction_id = ? AND output_index = ?',
+            [(unspent_output['transaction_id'], unspent_output['output_index'])
+             for unspent_output in unspent_outputs])
+
+
+@register_query(LocalSQLiteConnection)
+def update_unspent_outputs(conn, spent_outputs, unspent_outputs):
+    with conn.transaction():
+        delete_unspent_outputs(conn, *spent_outputs)
+        conn.executemany(
+            'INSERT INTO utxos (transaction_id, output_index, doc) VALUES (?, ?, ?) '
+            'ON CONFLICT (transaction_id, output_index) DO UPDATE SET doc = excluded.doc',
+            [(unspent_output['transaction_id'], unspent_output['output_index'],
+              _dumps(unspent_output))
+             for unspent_output in unspent_outputs])
+
+
+@register_query(LocalSQLiteConnection)
+def delete_all_unspent_outputs(conn):
+    conn.execute('DELETE FROM utxos')
+
+
+@register_query(LocalSQLiteConnection)
+def get_unspent_output(conn, transaction_id, output_index):
+    return _doc(conn.execute(
+        'SELECT doc FROM utxos WHERE transaction_id = ? AND output_index = ?',
+        (transaction_id, output_index)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_unspent_outputs_by_links(conn, links):
+    if not links:
+        return []
+    return _docs(conn.execute(
+        'SELECT doc FROM utxos WHERE (transaction_id, output_index) {}'.format(IN_LINKS),
+        (_dumps([list(link) for link in links]),)))
+
+
+TRANSACTION_OUTPUTS = {
+    'id': None,
+    'operation': None,
+    'asset': {'id': None},
+    'outputs': {'amount': None, 'condition': {'uri': None}},
+}
+
+INPUTS_AND_OUTPUTS = {
+    'id': None,
+    'operation': None,
+    'asset': None,
+    'inputs': {'fulfills': None},
+    'outputs': {'amount': None, 'public_keys': None, 'condition': None},
+}
+
+
+@register_query(LocalSQLiteConnection)
+def get_transaction_outputs(conn, transaction_ids):
+    return [project(transaction, TRANSACTION_OUTPUTS)
+            for transaction in get_transactions(conn, list(transaction_ids))]
+
+
+@register_query(LocalSQLiteConnection)
+def get_spent_outputs(conn, links):
+    if not links:
+        return []
+    return [{'transaction_id': transaction_id, 'output_index': output_index,
+             'spent_by': spent_by, 'height': height}
+            for transaction_id, output_index, spent_by, height in conn.execute(
+                'SELECT transaction_id, output_index, spent_by, height FROM spent_outputs '
+                'WHERE (transaction_id, output_index) {}'.format(IN_LINKS),
+                (_dumps([list(link) for link in links]),))]
+
+
+@register_query(LocalSQLiteConnection)
+def store_spent_outputs(conn, spent_outputs):
+    # NOTE: storing the spent outputs of a block again is a no-op, while
+    #       storing an output spent by another transaction violates the
+    #       primary key on `(transaction_id, output_index)`
+    if not spent_outputs:
+        return
+    with conn.transaction():
+        conn.executemany(
+            'INSERT OR IGNORE INTO spent_outputs (transaction_id, output_index, spent_by, height) '
+            'VALUES (?, ?, ?, ?)',
+            [(spent_output['transaction_id'], spent_output['output_index'],
+              spent_output['spent_by'], spent_output['height'])
+             for spent_output in spent_outputs])
+        spent_by = {(spent_output['transaction_id'], spent_output['output_index']): spent_output['spent_by']
+                    for spent_output in spent_outputs}
+        for stored in get_spent_outputs(conn, list(spent_by)):
+            if stored['spent_by'] != spent_by[stored['transaction_id'], stored['output_index']]:
+                raise DuplicateKeyError('output {transaction_id}:{output_index} already spent'
+                                        .format(**stored))
+
+
+@register_query(LocalSQLiteConnection)
+def delete_all_spent_outputs(conn):
+    conn.execute('DELETE FROM spent_outputs')
+
+
+@register_query(LocalSQLiteConnection)
+def store_owner_outputs(conn, owner_outputs, spent_outputs):
+    # NOTE: the outputs created and spent by the same block are stored
+    #       first, and flagged as spent after
+    with conn.transaction():
+        conn.executemany(
+            'INSERT OR IGNORE INTO owner_outputs '
+            '(public_key, transaction_id, output_index, spent, doc) VALUES (?, ?, ?, ?, ?)',
+            [(owner_output['public_key'], owner_output['transaction_id'],
+              owner_output['output_index'], owner_output['spent'], _dumps(owner_output))
+             for owner_output in owner_outputs])
+        conn.executemany(
+            'UPDATE owner_outputs SET spent = 1, doc = json_set(doc, \'$.spent\', json(\'true\')) '
+            'WHERE transaction_id = ? AND output_index = ?',
+            [(spent_output['transaction_id'], spent_output['output_index'])
+             for spent_output in spent_outputs])
+
+
+@register_query(LocalSQLiteConnection)
+def get_owner_outputs(conn, public_keys, spent=None):
+    sql = 'SELECT doc FROM owner_outputs WHERE public_key {}'.format(IN_VALUES)
+    parameters = [_dumps(list(public_keys))]
+    if spent is not None:
+        sql += ' AND spent = ?'
+        parameters.append(spent)
+    return _docs(conn.execute(sql + ' ORDER BY seq', parameters))
+
+
+@register_query(LocalSQLiteConnection)
+def delete_all_owner_outputs(conn):
+    conn.execute('DELETE FROM owner_outputs')
+
+
+@register_query(LocalSQLiteConnection)
+def get_inputs_and_outputs(conn):
+    return (project(rapidjson.loads(doc), INPUTS_AND_OUTPUTS)
+            for doc, in conn.iterate('SELECT doc FROM transactions ORDER BY rowid'))
+
+
+@register_query(LocalSQLiteConnection)
+def get_utxo_tree_nodes(conn, paths):
+    nodes = []
+    for path, hash_, key in conn.execute(
+            'SELECT path, hash, key FROM utxo_tree WHERE path {}'.format(IN_VALUES),
+            (_dumps(list(paths)),)):
+        node = {'path': path, 'hash': hash_}
+        if key is not None:
+            node['key'] = key
+        nodes.append(node)
+    return nodes
+
+
+@register_query(LocalSQLiteConnection)
+def update_utxo_tree_nodes(conn, nodes, deleted_paths):
+    with conn.transaction():
+        conn.executemany('DELETE FROM utxo_tree WHERE path = ?',
+                         [(path,) for path in deleted_paths])
+        conn.executemany(
+            'INSERT OR REPLACE INTO utxo_tree (path, hash, key) VALUES (?, ?, ?)',
+            [(node['path'], node['hash'], node.get('key')) for node in nodes])
+
+
+@register_query(LocalSQLiteConnection)
+def delete_utxo_tree(conn):
+    conn.execute('DELETE FROM utxo_tree')
+
+
+@register_query(LocalSQLiteConnection)
+def get_unspent_outputs(conn, *, query=None):
+    unspent_outputs = (rapidjson.loads(doc)
+                       for doc, in conn.iterate('SELECT doc FROM utxos ORDER BY rowid'))
+    if not query:
+        return unspent_outputs
+    return (unspent_output for unspent_output in unspent_outputs
+            if all(unspent_output.get(key) == value for key, value in query.items()))
+
+
+@register_query(LocalSQLiteConnection)
+def store_pre_commit_state(conn, state):
+    with conn.transaction():
+        conn.execute('DELETE FROM pre_commit')
+        conn.execute('INSERT INTO pre_commit (height, doc) VALUES (?, ?)',
+                     (state['height'], _dumps(state)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_pre_commit_state(conn):
+    return _doc(conn.execute('SELECT doc FROM pre_commit LIMIT 1'))
+
+
+@register_query(LocalSQLiteConnection)
+def store_schema_version(conn, version):
+    with conn.transaction():
+        conn.execute('DELETE FROM schema_version')
+        conn.execute('INSERT INTO schema_version (version) VALUES (?)', (version,))
+
+
+@register_query(LocalSQLiteConnection)
+def get_schema_version(conn):
+    rows = conn.execute('SELECT version FROM schema_version LIMIT 1')
+    return rows[0][0] if rows else None
+
+
+@register_query(LocalSQLiteConnection)
+def store_validator_set(conn, validators_update):
+    conn.execute(
+        'INSERT INTO validators (height, doc) VALUES (?, ?) '
+        'ON CONFLICT (height) DO UPDATE SET doc = excluded.doc',
+        (validators_update['height'], _dumps(validators_update)))
+
+
+@register_query(LocalSQLiteConnection)
+def delete_validator_set(conn, height):
+    conn.execute('DELETE FROM validators WHERE height = ?', (height,))
+
+
+@register_query(LocalSQLiteConnection)
+def store_election(conn, election_id, height, is_concluded):
+    conn.execute(
+        'INSERT INTO elections (election_id, height, doc) VALUES (?, ?, ?) '
+        'ON CONFLICT (height, election_id) DO UPDATE SET doc = excluded.doc',
+        (election_id, height, _dumps({'election_id': election_id,
+                                      'height': height,
+                                      'is_concluded': is_concluded})))
+
+
+@register_query(LocalSQLiteConnection)
+def store_elections(conn, elections):
+    conn.executemany(
+        'INSERT INTO elections (election_id, height, doc) VALUES (?, ?, ?)',
+        [(election['election_id'], election['height'], _dumps(election))
+         for election in elections])
+
+
+@register_query(LocalSQLiteConnection)
+def delete_elections(conn, height):
+    conn.execute('DELETE FROM elections WHERE height = ?', (height,))
+
+
+@register_query(LocalSQLiteConnection)
+def get_validator_set(conn, height=None):
+    if height is None:
+        return _doc(conn.execute('SELECT doc FROM validators ORDER BY height DESC LIMIT 1'))
+    return _doc(conn.execute(
+        'SELECT doc FROM validators WHERE height <= ? ORDER BY height DESC LIMIT 1',
+        (height,)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_election(conn, election_id):
+    return _doc(conn.execute(
+        'SELECT doc FROM elections WHERE election_id = ? ORDER BY height DESC LIMIT 1',
+        (election_id,)))
+
+
+@register_query(LocalSQLiteConnection)
+def get_asset_tokens_for_public_key(conn, asset_id, public_key):
+    transactions = _docs(conn.execute(
+        'SELECT doc FROM transactions WHERE asset_id = ? ORDER BY rowid', (asset_id,)))
+    return [transaction for transaction in transactions
+            if any(output['public_keys'] == [public_key]
+                   for output in transaction['outputs'])]
+
+
+@register_query(LocalSQLiteConnection)
+def store_abci_chain(conn, height, chain_id, is_synced=True):
+    conn.execute(
+        'INSERT INTO abci_chains (height, chain_id, doc) VALUES (?, ?, ?) '
+        'ON CONFLICT (height) DO UPDATE SET chain_id = excluded.chain_id, doc = excluded.doc',
+        (height, chain_id, _dumps({'height': height, 'chain_id': chain_id,
+                                   'is_synced': is_synced})))
+
+
+@register_query(LocalSQLiteConnection)
+def delete_abci_chain(conn, height):
+    conn.execute('DELETE FROM abci_chains WHERE height = ?', (height,))
+
+
+@register_query(LocalSQLiteConnection)
+def get_latest_abci_chain(conn):
+    return _doc(conn.execute('SELECT doc FROM abci_chains ORDER BY height DESC LIMIT 1'))
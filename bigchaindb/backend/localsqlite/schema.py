@@ -0,0 +1,164 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Utils to initialize and drop the database."""
+
+import logging
+import os
+
+from bigchaindb import backend
+from bigchaindb.backend.utils import module_dispatch_registrar
+from bigchaindb.backend.localsqlite.connection import LocalSQLiteConnection
+from bigchaindb.common.exceptions import DatabaseDoesNotExist
+
+
+logger = logging.getLogger(__name__)
+register_schema = module_dispatch_registrar(backend.schema)
+
+
+# NOTE: the tables store their documents as JSON in the `doc` column, the
+#       other columns hold the fields the indexes are built on, mirroring
+#       the indexes of the MongoDB backend
+STATEMENTS = {
+    'transactions': [
+        '''CREATE TABLE IF NOT EXISTS transactions (
+               id NOT NULL PRIMARY KEY,
+               asset_id TEXT,
+               doc TEXT NOT NULL)''',
+        'CREATE INDEX IF NOT EXISTS transactions_asset_id ON transactions (asset_id)',
+        # the public keys of the outputs of every transaction
+        '''CREATE TABLE IF NOT EXISTS transaction_public_keys (
+               public_key TEXT NOT NULL,
+               transaction_id TEXT NOT NULL,
+               PRIMARY KEY (public_key, transaction_id)) WITHOUT ROWID''',
+        '''CREATE INDEX IF NOT EXISTS transaction_public_keys_transaction_id
+               ON transaction_public_keys (transaction_id)''',
+    ],
+    'assets': [
+        '''CREATE TABLE IF NOT EXISTS assets (
+               id NOT NULL PRIMARY KEY,
+               doc TEXT NOT NULL)''',
+        '''CREATE VIRTUAL TABLE IF NOT EXISTS assets_text USING fts5 (
+               id UNINDEXED, text,
+               tokenize = 'porter unicode61 remove_diacritics 2')''',
+    ],
+    'blocks': [
+        '''CREATE TABLE IF NOT EXISTS blocks (
+               height INTEGER NOT NULL PRIMARY KEY,
+               doc TEXT NOT NULL)''',
+        # a row per transaction of each block
+        '''CREATE TABLE IF NOT EXISTS block_transactions (
+               transaction_id TEXT NOT NULL,
+               height INTEGER NOT NULL,
+               position INTEGER NOT NULL,
+               PRIMARY KEY (transaction_id, height)) WITHOUT ROWID''',
+    ],
+    'metadata': [
+        '''CREATE TABLE IF NOT EXISTS metadata (
+               id NOT NULL PRIMARY KEY,
+               doc TEXT NOT NULL)''',
+        '''CREATE VIRTUAL TABLE IF NOT EXISTS metadata_text USING fts5 (
+               id UNINDEXED, text,
+               tokenize = 'porter unicode61 remove_diacritics 2')''',
+    ],
+    'utxos': [
+        '''CREATE TABLE IF NOT EXISTS utxos (
+               transaction_id TEXT NOT NULL,
+               output_index INTEGER NOT NULL,
+               doc TEXT NOT NULL,
+               PRIMARY KEY (transaction_id, output_index))''',
+    ],
+    'spent_outputs': [
+        '''CREATE TABLE IF NOT EXISTS spent_outputs (
+               transaction_id TEXT NOT NULL,
+               output_index INTEGER NOT NULL,
+               spent_by TEXT NOT NULL,
+               height INTEGER,
+               PRIMARY KEY (transaction_id, output_index))''',
+        'CREATE INDEX IF NOT EXISTS spent_outputs_spent_by ON spent_outputs (spent_by)',
+    ],
+    'owner_outputs': [
+        '''CREATE TABLE IF NOT EXISTS owner_outputs (
+               seq INTEGER PRIMARY KEY AUTOINCREMENT,
+               public_key TEXT NOT NULL,
+               transaction_id TEXT NOT NULL,
+               output_index INTEGER NOT NULL,
+               spent INTEGER NOT NULL,
+               doc TEXT NOT NULL,
+               UNIQUE (transaction_id, output_index, public_key))''',
+        'CREATE INDEX IF NOT EXISTS owner_outputs_public_key ON owner_outputs (public_key, seq)',
+    ],
+    'asset_history': [
+        '''CREATE TABLE IF NOT EXISTS asset_history (
+               asset_id TEXT NOT NULL,
+               height INTEGER NOT NULL,
+               position INTEGER NOT NULL,
+               transaction_id TEXT NOT NULL UNIQUE,
+               operation TEXT NOT NULL,
+               PRIMARY KEY (asset_id, height, position, transaction_id))''',
+    ],
+    'utxo_tree': [
+        # the hashes and keys of the nodes are bytes
+        '''CREATE TABLE IF NOT EXISTS utxo_tree (
+               path TEXT NOT NULL PRIMARY KEY,
+               hash BLOB NOT NULL,
+               key BLOB)''',
+    ],
+    'pre_commit': [
+        '''CREATE TABLE IF NOT EXISTS pre_commit (
+               height INTEGER NOT NULL UNIQUE,
+               doc TEXT NOT NULL)''',
+    ],
+    'elections': [
+        '''CREATE TABLE IF NOT EXISTS elections (
+               election_id TEXT NOT NULL,
+               height INTEGER NOT NULL,
+               doc TEXT NOT NULL,
+               PRIMARY KEY (height, election_id))''',
+        'CREATE INDEX IF NOT EXISTS elections_election_id ON elections (election_id, height)',
+    ],
+    'validators': [
+        '''CREATE TABLE IF NOT EXISTS validators (
+               height INTEGER NOT NULL PRIMARY KEY,
+               doc TEXT NOT NULL)''',
+    ],
+    'abci_chains': [
+        '''CREATE TABLE IF NOT EXISTS abci_chains (
+               height INTEGER NOT NULL PRIMARY KEY,
+               chain_id TEXT NOT NULL UNIQUE,
+               doc TEXT NOT NULL)''',
+    ],
+    'schema_version': [
+        'CREATE TABLE IF NOT EXISTS schema_version (version INTEGER)',
+    ],
+}
+
+
+@register_schema(LocalSQLiteConnection)
+def create_database(conn, dbname):
+    logger.info('Create database `%s`.', dbname)
+    # opening the file creates it
+    conn.conn
+
+
+@register_schema(LocalSQLiteConnection)
+def create_tables(conn, dbname):
+    with conn.transaction():
+        for table_name in backend.schema.TABLES:
+            logger.info(f'Create `{table_name}` table.')
+            for statement in STATEMENTS[table_name]:
+                conn.execute(statement)
+
+
+@register_schema(LocalSQLiteConnection)
+def drop_database(conn, dbname):
+    conn.close()
+    if not os.path.exists(conn.path):
+        raise DatabaseDoesNotExist('Database `{}` does not exist'.format(dbname))
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(conn.path + suffix)
+        except FileNotFoundError:
+            pass
@@ -87,6 +87,33 @@ def get_transactions(connection, transaction_ids):
     raise NotImplementedError
 
 
+@singledispatch
+def get_transaction_ids(connection):
+    """Get the ids of all the transactions of the transactions table.
+
+    Returns:
+        An iterator of transaction ids.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_full_transactions(connection, transaction_ids):
+    """Get transactions, with their asset and metadata, from the
+    transactions, assets and metadata tables.
+
+    Args:
+        transaction_ids (list): list of transaction ids to fetch
+
+    Returns:
+        list: the transactions found, in the order of ``transaction_ids``,
+        as they were before being stored.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_asset(connection, asset_id):
     """Get a transaction from the transactions table.
@@ -125,11 +152,10 @@ def get_spending_transactions(connection, inputs):
     """Return transactions which spend given inputs
 
     Args:
-        inputs (list): list of {txid, output}
+        inputs (list): list of ``{'transaction_id', 'output_index'}``
 
     Returns:
-        Iterator of (block_ids, transaction) for transactions that
-        spend given inputs.
+        Iterator of the transactions that spend given inputs.
     """
     raise NotImplementedError
 
@@ -203,12 +229,71 @@ def get_assets(connection, asset_ids):
 
 
 @singledispatch
-def get_txids_filtered(connection, asset_id, operation=None):
+def get_txids_filtered(connection, asset_id, operation=None, last_tx=None):
     """Return all transactions for a particular asset id and optional operation.
 
+    The transactions are read from the ``asset_history`` table, in the
+    order they were committed.
+
+    Args:
+        asset_id (str): ID of transaction that defined the asset
+        operation (str) (optional): Operation to filter on
+        last_tx (bool) (optional): Return only the last transaction
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_asset_history(connection, asset_id, operation=None, after=None, limit=0):
+    """Return a page of the history of an asset.
+
     Args:
         asset_id (str): ID of transaction that defined the asset
         operation (str) (optional): Operation to filter on
+        after (tuple) (optional): the ``(height, position, transaction_id)``
+            of the record the page starts after.
+        limit (int) (optional): the size of the page, ``0`` for no limit.
+
+    Returns:
+        An iterator of the ``asset_history`` records, ordered by
+        ``height``, ``position`` and ``transaction_id``, see
+        :func:`store_asset_history`.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def store_asset_history(connection, asset_history):
+    """Store the transactions of a block in the ``asset_history`` table.
+
+    Storing the same records again is a no-op.
+
+    Args:
+        asset_history (:obj:`list` of :obj:`dict`): one record per
+            transaction, with ``asset_id``, ``height``, the ``position`` of
+            the transaction in its block, ``transaction_id`` and
+            ``operation``.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def delete_all_asset_history(connection):
+    """Delete all the records of the ``asset_history`` table."""
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_block_transaction_ids(connection):
+    """Get the ids of the transactions of all the stored blocks.
+
+    Returns:
+        An iterator of dicts with the ``height`` of a block, the
+        ``position`` of a transaction in it and its ``transaction_id``.
     """
 
     raise NotImplementedError
@@ -282,9 +367,220 @@ def delete_unspent_outputs(connection, unspent_outputs):
     raise NotImplementedError
 
 
+@singledispatch
+def update_unspent_outputs(connection, spent_outputs, unspent_outputs):
+    """Apply a block to the ``utxos`` table in a single bulk write.
+
+    Both operations are idempotent, so that the same block can be applied
+    again after a crash.
+
+    Args:
+        spent_outputs (:obj:`list` of :obj:`dict`): the outputs to delete,
+            identified by ``transaction_id`` and ``output_index``.
+        unspent_outputs (:obj:`list` of :obj:`dict`): the outputs to
+            insert, replacing existing records with the same key.
+
+    Returns:
+        The result of the operation.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def delete_all_unspent_outputs(connection):
+    """Delete all the records of the ``utxos`` table."""
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_unspent_output(connection, transaction_id, output_index):
+    """Get an unspent output.
+
+    Args:
+        transaction_id (str): the id of the transaction creating the output.
+        output_index (int): the index of the output in the transaction.
+
+    Returns:
+        The UTXO record or ``None`` if the output does not exist or has
+        been spent.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_unspent_outputs_by_links(connection, links):
+    """Get the unspent outputs at the given positions.
+
+    Args:
+        links (list): list of ``(transaction_id, output_index)`` pairs.
+
+    Returns:
+        An iterator of the UTXO records found.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_transaction_outputs(connection, transaction_ids):
+    """Get the outputs of transactions, without their asset data and
+    metadata.
+
+    Args:
+        transaction_ids (list): list of transaction ids.
+
+    Returns:
+        An iterator of the transactions found, projected on ``id``,
+        ``operation``, ``asset.id``, ``outputs.amount`` and
+        ``outputs.condition.uri``.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_spent_outputs(connection, links):
+    """Find which of the given outputs are spent by stored transactions.
+
+    Args:
+        links (list): list of ``(transaction_id, output_index)`` pairs.
+
+    Returns:
+        An iterator of the ``spent_outputs`` records of the outputs of
+        ``links`` which are spent, see :func:`store_spent_outputs`.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def store_spent_outputs(connection, spent_outputs):
+    """Store the outputs spent by a block in the ``spent_outputs`` table.
+
+    Storing the same records again is a no-op.
+
+    Args:
+        spent_outputs (:obj:`list` of :obj:`dict`): the spent outputs,
+            identified by ``transaction_id`` and ``output_index``, with
+            the id of the spending transaction (``spent_by``) and the
+            ``height`` of its block.
+
+    Raises:
+        :exc:`~bigchaindb.backend.exceptions.DuplicateKeyError`: if one of
+            the outputs is already spent by another transaction. None of
+            the records are stored then.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def delete_all_spent_outputs(connection):
+    """Delete all the records of the ``spent_outputs`` table."""
+
+    raise NotImplementedError
+
+
+@singledispatch
+def store_owner_outputs(connection, owner_outputs, spent_outputs):
+    """Update the ``owner_outputs`` table with the outputs created and
+    spent by a block.
+
+    Storing the same records again is a no-op.
+
+    Args:
+        owner_outputs (:obj:`list` of :obj:`dict`): the outputs created,
+            once per owner, with ``public_key``, ``transaction_id``,
+            ``output_index``, ``amount``, ``asset_id`` and ``spent``.
+        spent_outputs (:obj:`list` of :obj:`dict`): the outputs spent,
+            identified by ``transaction_id`` and ``output_index``.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_owner_outputs(connection, public_keys, spent=None):
+    """Get the outputs owned by some public keys.
+
+    Args:
+        public_keys (list): the base58 encoded public keys.
+        spent (bool): If ``True`` return only the spent outputs, if
+            ``False`` only the unspent ones, and all of them if ``None``.
+
+    Returns:
+        An iterator of the ``owner_outputs`` records of the outputs, in
+        the order they were stored, see :func:`store_owner_outputs`.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def delete_all_owner_outputs(connection):
+    """Delete all the records of the ``owner_outputs`` table."""
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_inputs_and_outputs(connection):
+    """Get the inputs and outputs of all the stored transactions.
+
+    Returns:
+        An iterator of transactions, projected on ``id``, ``operation``,
+        ``asset``, ``inputs.fulfills``, ``outputs.amount``,
+        ``outputs.public_keys`` and ``outputs.condition``.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_utxo_tree_nodes(connection, paths):
+    """Get nodes of the Merkle tree of the UTXO set.
+
+    Args:
+        paths (:obj:`list` of :obj:`str`): the paths of the nodes.
+
+    Returns:
+        An iterator of the nodes found.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def update_utxo_tree_nodes(connection, nodes, deleted_paths):
+    """Store and delete nodes of the Merkle tree of the UTXO set in a
+    single bulk write.
+
+    Args:
+        nodes (:obj:`list` of :obj:`dict`): the nodes to store, replacing
+            the nodes with the same ``path``.
+        deleted_paths (:obj:`list` of :obj:`str`): the paths of the nodes
+            to delete.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def delete_utxo_tree(connection):
+    """Delete all the nodes of the Merkle tree of the UTXO set."""
+
+    raise NotImplementedError
+
+
 @singledispatch
 def delete_transactions(conn, txn_ids):
-    """Delete transactions from database
+    """Delete transactions from database, along with their records in the
+    ``asset_history`` table, the outputs they spend from the
+    ``spent_outputs`` table and their outputs from the
+    ``owner_outputs`` table. The outputs they spend are unspent again.
 
     Args:
         txn_ids (list): list of transaction ids
@@ -338,6 +634,32 @@ def get_pre_commit_state(connection):
     raise NotImplementedError
 
 
+@singledispatch
+def store_schema_version(connection, version):
+    """Store the version of the tables derived from the stored
+    transactions (see :data:`bigchaindb.backend.schema.SCHEMA_VERSION`).
+
+    Args:
+        version (int): the version, or ``None`` while the tables are
+            being rebuilt.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_schema_version(connection):
+    """Get the version of the tables derived from the stored
+    transactions.
+
+    Returns:
+        int: the version, or ``None`` if it was never stored, or if the
+        tables are being rebuilt.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def store_validator_set(conn, validator_update):
     """Store updated validator set"""
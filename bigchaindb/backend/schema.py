@@ -17,7 +17,15 @@ logger = logging.getLogger(__name__)
 
 # Tables/collections that every backend database must create
 TABLES = ('transactions', 'blocks', 'assets', 'metadata',
-          'validators', 'elections', 'pre_commit', 'utxos', 'abci_chains')
+          'validators', 'elections', 'pre_commit', 'utxos', 'utxo_tree',
+          'spent_outputs', 'owner_outputs', 'asset_history', 'abci_chains',
+          'schema_version')
+
+# The version of the tables derived from the stored transactions: `utxos`,
+# `utxo_tree`, `spent_outputs`, `owner_outputs` and `asset_history`. The
+# tables of a database with an older version, e.g. written by an older
+# release of BigchainDB, are rebuilt before the node starts.
+SCHEMA_VERSION = 1
 
 VALID_LANGUAGES = ('danish', 'dutch', 'english', 'finnish', 'french', 'german',
                    'hungarian', 'italian', 'norwegian', 'portuguese', 'romanian',
@@ -97,14 +105,13 @@ def validate_language_key(obj, key):
         Raises:
             ValidationError: will raise exception in case language is not valid.
     """
-    backend = bigchaindb.config['database']['backend']
-
-    if backend == 'localmongodb':
-        data = obj.get(key, {})
-        if isinstance(data, dict):
-            validate_all_values_for_key_in_obj(data, 'language', validate_language)
-        elif isinstance(data, list):
-            validate_all_values_for_key_in_list(data, 'language', validate_language)
+    # NOTE: the languages are restricted whatever the database backend of
+    #       the node, see `bigchaindb.common.utils.validate_txn_obj`
+    data = obj.get(key, {})
+    if isinstance(data, dict):
+        validate_all_values_for_key_in_obj(data, 'language', validate_language)
+    elif isinstance(data, list):
+        validate_all_values_for_key_in_list(data, 'language', validate_language)
 
 
 def validate_language(value):
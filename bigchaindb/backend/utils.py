@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
+import re
+
 import bigchaindb
 
 
@@ -37,3 +39,46 @@ def get_bigchaindb_config_value(key, default_value=None):
 
 def get_bigchaindb_config_value_or_key_error(key):
     return bigchaindb.config['database'][key]
+
+
+def project(value, fields):
+    """Return the ``fields`` of ``value``, as a MongoDB projection does.
+
+    Args:
+        value: a document, or a list of documents.
+        fields (dict): the projected fields, mapped to the projection of
+            their subfields, or to ``None`` to keep the whole value.
+    """
+    if fields is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, fields) for item in value
+                if isinstance(item, (dict, list))]
+    return {key: project(value[key], subfields)
+            for key, subfields in fields.items()
+            if key in value and (subfields is None or isinstance(value[key], (dict, list)))}
+
+
+def text_values(value):
+    """Return the strings of ``value``, the content of its text index."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return []
+    return [text for item in value for text in text_values(item)]
+
+
+def parse_text_search(search):
+    """Split a MongoDB ``$search`` string into its ``"phrases"``, its terms
+    and its ``-negated`` terms.
+
+    As with MongoDB, the documents match any of the terms, or all the
+    phrases if any, and none of the negated terms.
+    """
+    phrases = re.findall(r'"([^"]*)"', search)
+    terms = re.sub(r'"[^"]*"', ' ', search).split()
+    positive = [term for term in terms if not term.startswith('-')]
+    negated = [term[1:] for term in terms if term.startswith('-') and len(term) > 1]
+    return phrases, positive, negated
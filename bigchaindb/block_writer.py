@@ -0,0 +1,102 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Writing of the committed blocks to the database."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from bigchaindb.lib import BigchainDB
+from bigchaindb.overlay import BlockOverlay
+
+
+class BlockWriter:
+    """Writes the transactions, the UTXO set changes and the block of every
+    committed block.
+
+    By default the writes are done when :meth:`write` is called. With
+    ``write_behind``, they are done by a background thread instead, so that
+    the ABCI application can reply to the ``Commit`` request at once, and
+    validate the next block while the previous one is written:
+
+    * the state kept in memory by the application (the latest block and
+      the filter of the committed transactions) is updated right away;
+    * the transactions of the latest block are kept in :attr:`transactions`,
+      for the validation of the next block to see them whether they are
+      written or not;
+    * :meth:`wait` must be called before reading anything else the block
+      writes, e.g. in ``end_block``, before the pre-commit state of the next
+      block is stored. Hence at most one block is written at a time, and the
+      pre-commit state is still at most one block ahead of the stored
+      blocks: a crash is recovered from by :func:`bigchaindb.core.rollback`,
+      as when the writes are interrupted in the middle of a ``Commit``.
+
+    The writes of a block overlap the reads of the next one only if the
+    backend serves them concurrently: the SQLite and in-memory backends
+    serialize the queries of a block.
+
+    Args:
+        bigchaindb (:class:`~bigchaindb.lib.BigchainDB`): the instance of
+            the application.
+        write_behind (bool): write the blocks in the background.
+    """
+
+    def __init__(self, bigchaindb, write_behind=False):
+        self.bigchaindb = bigchaindb
+        self.transactions = BlockOverlay()
+        self._pending = None
+        if write_behind:
+            # NOTE: the background thread has its own instance, which keeps
+            #       no state in memory and its own view of the Merkle tree
+            self._writer = BigchainDB(bigchaindb.connection)
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix='bigchaindb_block_writer')
+        else:
+            self._writer = bigchaindb
+            self._executor = None
+
+    def write(self, block, transactions, callback=None):
+        """Write a committed block.
+
+        Args:
+            block (dict): the block.
+            transactions (:obj:`list` of :obj:`~bigchaindb.models.Transaction`):
+                the transactions of the block.
+            callback (callable, optional): a function called without
+                arguments once the block is written.
+        """
+        if self._executor is None:
+            self._write(block, transactions, callback)
+            return
+
+        self.wait()
+        self.transactions = BlockOverlay(transactions)
+        self.bigchaindb.cache_block(block, transactions)
+        self._pending = self._executor.submit(self._write, block, transactions, callback)
+
+    def _write(self, block, transactions, callback):
+        writer = self._writer
+        # NOTE: the backends supporting transactions store the block
+        # atomically, the others rely on the crash recovery
+        with writer.connection.transaction():
+            # register a new block only when new transactions are received
+            if transactions:
+                writer.store_bulk_transactions(transactions, block['height'])
+                writer.update_utxoset(*transactions)
+            # NOTE: storing the block should be the last operation during commit
+            # this effects crash recovery. Refer BEP#8 for details
+            writer.store_block(block)
+
+        if callback:
+            callback()
+
+    def wait(self):
+        """Wait until the latest block is written.
+
+        Raises:
+            Exception: the exception raised by the writes of the block.
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
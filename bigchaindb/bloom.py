@@ -0,0 +1,241 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""In-memory Bloom filter of the ids of the committed transactions."""
+
+import logging
+import math
+import os
+from hashlib import blake2b
+
+import rapidjson
+
+from bigchaindb import backend
+
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """A set of strings answering membership queries with false positives,
+    but no false negatives.
+
+    Args:
+        capacity (int): the number of keys the filter is sized for.
+        error_rate (float): the probability of a false positive once the
+            filter holds ``capacity`` keys.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # NOTE: the positions are derived from two hashes (Kirsch and
+        #       Mitzenmacher), which is as good as ``hashes`` hashes
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+
+
+class ScalableBloomFilter:
+    """A Bloom filter growing with the number of keys.
+
+    When its latest filter is full, a new filter twice as large, with half
+    its error rate, is added, so that the overall error rate stays below
+    twice the initial ``error_rate`` (Almeida et al., 2007).
+
+    Args:
+        capacity (int): the capacity of the first filter.
+        error_rate (float): the error rate of the first filter.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.filters = [BloomFilter(capacity, error_rate)]
+
+    def __len__(self):
+        return sum(bloom_filter.count for bloom_filter in self.filters)
+
+    def add(self, key):
+        latest = self.filters[-1]
+        if latest.count >= latest.capacity:
+            latest = BloomFilter(latest.capacity * 2, latest.error_rate / 2)
+            self.filters.append(latest)
+        latest.add(key)
+
+    def __contains__(self, key):
+        return any(key in bloom_filter for bloom_filter in self.filters)
+
+    def dump(self, header, path):
+        """Write the filter to the file ``path``, after the JSON ``header``.
+
+        The file is replaced atomically.
+        """
+        header = dict(header, filters=[
+            {'capacity': bloom_filter.capacity, 'error_rate': bloom_filter.error_rate,
+             'count': bloom_filter.count}
+            for bloom_filter in self.filters])
+        tmp_path = '{}.tmp'.format(path)
+        with open(tmp_path, 'wb') as snapshot:
+            snapshot.write(rapidjson.dumps(header).encode() + b'\n')
+            for bloom_filter in self.filters:
+                snapshot.write(bloom_filter.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a filter written by :meth:`dump`.
+
+        Returns:
+            tuple: the header and the filter.
+
+        Raises:
+            OSError: if the file can't be read.
+            ValueError: if the file is not a valid snapshot.
+        """
+        with open(path, 'rb') as snapshot:
+            header = rapidjson.loads(snapshot.readline())
+            filters = []
+            for options in header.pop('filters'):
+                bloom_filter = BloomFilter(options['capacity'], options['error_rate'])
+                bloom_filter.count = options['count']
+                bloom_filter.bits[:] = snapshot.read(len(bloom_filter.bits))
+                if len(bloom_filter.bits) * 8 < bloom_filter.size:
+                    raise ValueError('the snapshot {} is truncated'.format(path))
+                filters.append(bloom_filter)
+        if not filters:
+            raise ValueError('the snapshot {} holds no filter'.format(path))
+
+        scalable_filter = cls.__new__(cls)
+        scalable_filter.filters = filters
+        return scalable_filter, header
+
+
+class CommittedTransactions:
+    """The ids of the committed transactions, to avoid looking up the
+    database for the ids of new transactions.
+
+    The ids are kept in a :class:`ScalableBloomFilter`: if an id is not in
+    the filter, the transaction is not committed, otherwise it may be. Only
+    the process storing the blocks, i.e. the ABCI application, may keep
+    the filter, as other processes would not see the new transactions.
+
+    The filter is loaded on first use, from its snapshot file if there is
+    one, then from the blocks stored after the snapshot. Without a valid
+    snapshot it is built by reading the ids of all the stored
+    transactions. It is written to the snapshot file every
+    ``snapshot_interval`` blocks.
+
+    Args:
+        connection (:class:`~bigchaindb.backend.connection.Connection`):
+            A connection to the database.
+        capacity (int): the initial capacity of the filter.
+        error_rate (float): the initial false positive rate of the filter.
+        snapshot (str, optional): the path of the snapshot file. Defaults
+            to no snapshot.
+        snapshot_interval (int): the number of blocks between two
+            snapshots.
+    """
+
+    def __init__(self, connection, capacity, error_rate, snapshot=None,
+                 snapshot_interval=1000):
+        self.connection = connection
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.snapshot = snapshot
+        self.snapshot_interval = snapshot_interval
+        self.filter = None
+        # the height of the latest snapshot
+        self.snapshot_height = None
+
+    def __contains__(self, transaction_id):
+        """Return ``False`` if the transaction ``transaction_id`` is not
+        committed, ``True`` if it may be."""
+        if self.filter is None:
+            self.load()
+        return transaction_id in self.filter
+
+    def add(self, transaction_ids):
+        # NOTE: the filter is loaded first, as the transactions may not be
+        #       written to the database yet, see `BlockWriter`
+        if self.filter is None:
+            self.load()
+        for transaction_id in transaction_ids:
+            self.filter.add(transaction_id)
+
+    def store_block(self, block):
+        """Write a snapshot of the filter if ``block`` is
+        ``snapshot_interval`` blocks after the latest snapshot."""
+        if self.filter is None or not self.snapshot:
+            return
+        if self.snapshot_height is None or \
+                block['height'] - self.snapshot_height >= self.snapshot_interval:
+            self._dump(block)
+
+    def reset(self):
+        """Drop the filter, e.g. after a rollback, to load it again on
+        first use."""
+        self.filter = None
+        self.snapshot_height = None
+
+    def load(self):
+        latest_block = backend.query.get_latest_block(self.connection)
+        if self.snapshot and self._load_snapshot(latest_block):
+            return
+
+        self.filter = ScalableBloomFilter(self.capacity, self.error_rate)
+        for transaction_id in backend.query.get_transaction_ids(self.connection):
+            self.filter.add(transaction_id)
+        logger.info('Loaded the ids of %s committed transactions', len(self.filter))
+        if self.snapshot and latest_block:
+            self._dump(latest_block)
+
+    def _load_snapshot(self, latest_block):
+        try:
+            bloom_filter, header = ScalableBloomFilter.load(self.snapshot)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning('Ignoring the snapshot %s: %s', self.snapshot, exc)
+            return False
+
+        # NOTE: the snapshot must belong to the chain stored in the
+        #       database, e.g. not to a database dropped since
+        block = backend.query.get_block(self.connection, header['height'])
+        if not block or block['app_hash'] != header['app_hash'] or not latest_block:
+            logger.warning('Ignoring the snapshot %s of the block %s, which is not stored',
+                           self.snapshot, header['height'])
+            return False
+
+        for height in range(header['height'] + 1, latest_block['height'] + 1):
+            block = backend.query.get_block(self.connection, height)
+            for transaction_id in block['transactions'] if block else []:
+                bloom_filter.add(transaction_id)
+        self.filter = bloom_filter
+        self.snapshot_height = header['height']
+        return True
+
+    def _dump(self, block):
+        try:
+            self.filter.dump({'height': block['height'], 'app_hash': block['app_hash']},
+                             self.snapshot)
+        except OSError as exc:
+            logger.warning('Could not write the snapshot %s: %s', self.snapshot, exc)
+            return
+        self.snapshot_height = block['height']
@@ -0,0 +1,94 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""In-memory copy of the chain metadata written by the ABCI application."""
+
+import copy
+
+
+# marks a value which has not been loaded from the database yet
+MISSING = object()
+
+
+class ChainState:
+    """The latest block, the latest validator sets and the latest ABCI chain.
+
+    The ABCI application is the only writer of these records, so instead
+    of querying them over and over it can keep them in memory, updating
+    them as it writes them. Values are ``MISSING`` until they are loaded
+    from the database, and go back to ``MISSING`` when a write can't be
+    applied to the cached value (e.g. a rollback).
+
+    The validator sets are kept as a list of consecutive records, oldest
+    first: each record holds the validators from its height up to the
+    height of the next one. Only the latest record is loaded from the
+    database, the list then grows as new validator sets are stored.
+
+    Stored records are copied, so that callers can't change them.
+    """
+
+    def __init__(self):
+        self.latest_block = MISSING
+        self.abci_chain = MISSING
+        self.validator_sets = MISSING
+
+    def store_block(self, block):
+        if self.latest_block is MISSING:
+            return
+        if self.latest_block is None or \
+                block['height'] >= self.latest_block['height']:
+            self.latest_block = copy.deepcopy(block)
+
+    def store_abci_chain(self, abci_chain):
+        if self.abci_chain is MISSING:
+            return
+        if self.abci_chain is None or \
+                abci_chain['height'] >= self.abci_chain['height']:
+            self.abci_chain = copy.deepcopy(abci_chain)
+
+    def delete_abci_chain(self, height):
+        if self.abci_chain is MISSING or self.abci_chain is None:
+            return
+        if self.abci_chain['height'] == height:
+            self.abci_chain = MISSING
+
+    def get_validator_set(self, height=None):
+        """Return the validator set at ``height``, like
+        :func:`bigchaindb.backend.query.get_validator_set`, or ``MISSING``
+        if it is not cached."""
+        if self.validator_sets is MISSING:
+            return MISSING
+        if not self.validator_sets:
+            return None
+        if height is None:
+            return self.validator_sets[-1]
+        for validator_set in reversed(self.validator_sets):
+            if validator_set['height'] <= height:
+                return validator_set
+        return MISSING
+
+    def store_validator_set(self, validator_set):
+        if self.validator_sets is MISSING:
+            return
+        height = validator_set['height']
+        latest = self.validator_sets[-1] if self.validator_sets else None
+        if latest is None or height > latest['height']:
+            self.validator_sets.append(copy.deepcopy(validator_set))
+        elif height == latest['height']:
+            self.validator_sets[-1] = copy.deepcopy(validator_set)
+        else:
+            self.validator_sets = MISSING
+
+    def delete_validator_set(self, height):
+        if self.validator_sets is MISSING or not self.validator_sets:
+            return
+        latest = self.validator_sets[-1]
+        if height == latest['height']:
+            self.validator_sets.pop()
+            if not self.validator_sets:
+                # older validator sets may still be in the database
+                self.validator_sets = MISSING
+        elif height < latest['height']:
+            self.validator_sets = MISSING
@@ -0,0 +1,217 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Parallel ``check_tx`` for the mempool connection of Tendermint.
+
+NOTE: importing this module imports ``gevent``, see
+:mod:`bigchaindb.start`.
+"""
+
+import logging
+import math
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+
+try:
+    from hashlib import sha3_256
+except ImportError:
+    # NOTE: needed for Python < 3.6
+    from sha3 import sha3_256
+
+from abci.encoding import read_messages, write_message
+from abci.server import ABCIServer
+from gevent import get_hub
+from gevent.select import select
+from gevent.server import StreamServer
+
+from bigchaindb.common.exceptions import InvalidSignature, ValidationError
+from bigchaindb.common.signatures import SignatureBatch
+from bigchaindb.core import CodeTypeError
+from bigchaindb.models import Transaction
+from bigchaindb.parallel_validation import VALID, error_code
+
+
+logger = logging.getLogger(__name__)
+
+# the verification of the transactions found in the validation cache of the
+# application, which are not sent to the pool again
+VERIFIED = Future()
+VERIFIED.set_result([VALID])
+
+
+def verify_transactions(raw_transactions):
+    """Run the checks of ``check_tx`` which don't depend on the state of
+    the chain: schema, id and signatures.
+
+    The signatures of all the transactions are verified in a single
+    :class:`~bigchaindb.common.signatures.SignatureBatch`.
+
+    Args:
+        raw_transactions (:obj:`list` of :obj:`bytes`): the transactions,
+            as sent by Tendermint.
+
+    Returns:
+        :obj:`list` of :obj:`int`: the error code of each transaction, see
+        :mod:`bigchaindb.parallel_validation`.
+    """
+    codes = [VALID] * len(raw_transactions)
+    transactions = {}
+    batch = SignatureBatch()
+    for index, raw_transaction in enumerate(raw_transactions):
+        try:
+            transaction = Transaction.from_json(raw_transaction)
+        except ValidationError as e:
+            logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
+            codes[index] = error_code(type(e))
+        else:
+            transactions[index] = transaction
+            batch.add(transaction)
+
+    batch.verify()
+    for index, transaction in transactions.items():
+        if not transaction.signatures_verified and \
+                not transaction.signatures_valid():
+            logger.warning('Invalid transaction (InvalidSignature): %s', transaction.id)
+            codes[index] = error_code(InvalidSignature)
+    return codes
+
+
+class CheckTxServer(ABCIServer):
+    """ABCI server running the state independent part of ``check_tx`` on a
+    pool of processes.
+
+    Tendermint sends the ``check_tx`` requests of the mempool connection
+    without waiting for their responses. The transactions read together
+    are split in batches, one per process, and submitted to the pool. The
+    responses are sent in the order of the requests, as soon as they are
+    ready. The checks depending on the state of the chain are then run by
+    the application, one transaction at a time, in the same order. The
+    transactions already found valid by the application, e.g. when the
+    mempool is rechecked after a block, are not verified again.
+
+    Only the mempool connection, i.e. the connection sending ``check_tx``
+    requests, is served that way: the requests of the other connections
+    are processed one at a time, as by :class:`~abci.server.ABCIServer`.
+
+    At most ``queue_depth`` requests wait for their response: when the
+    queue is full, new transactions are rejected straight away, so that a
+    burst of transactions sheds load instead of stalling Tendermint.
+    """
+
+    def __init__(self, port=26658, app=None, concurrency=None,
+                 queue_depth=1024):
+        super().__init__(port, app)
+        self.concurrency = concurrency or os.cpu_count()
+        self.queue_depth = queue_depth
+        self.executor = ProcessPoolExecutor(self.concurrency)
+        self.server = StreamServer(('0.0.0.0', port),
+                                   handle=self.handle_connection)
+
+    def handle_connection(self, socket, address):
+        logger.info(' ... connection from Tendermint: %s:%s ...', *address[:2])
+        data = BytesIO()
+        last_pos = 0
+        # the `check_tx` requests waiting for their response
+        pending = deque()
+        # whether this is the mempool connection
+        mempool = False
+
+        while True:
+            # Create a new buffer every time there is the possibility.
+            # This avoids having a never ending buffer.
+            if last_pos == data.tell():
+                data = BytesIO()
+                last_pos = 0
+
+            if mempool:
+                # Wait for the pending results only when Tendermint has
+                # nothing more to send
+                readable, _, _ = select([socket], [], [], 0)
+                self.answer(socket, pending, wait=not readable)
+
+            inbound = socket.recv(1024 * 8)  # 8KB
+            data.write(inbound)
+
+            if not len(inbound):
+                break
+
+            # Before reading the messages from the buffer, position the
+            # cursor at the end of the last read message.
+            data.seek(last_pos)
+            messages = read_messages(data, self.app.abci.Request)
+
+            batch = []
+            for message in messages:
+                req_type = message.WhichOneof('value')
+                if req_type == 'check_tx':
+                    mempool = True
+                    batch.append(message.check_tx.tx)
+                else:
+                    if mempool:
+                        self.submit(batch, pending)
+                        batch = []
+                        self.answer(socket, pending, wait=True)
+                    socket.sendall(self.protocol.process(req_type, message))
+                last_pos = data.tell()
+            if mempool:
+                self.submit(batch, pending)
+
+        socket.close()
+
+    def submit(self, raw_transactions, pending):
+        """Submit a batch of transactions to the pool, adding them to the
+        ``pending`` requests."""
+        accepted = max(0, min(len(raw_transactions), self.queue_depth - len(pending)))
+        if accepted < len(raw_transactions):
+            logger.debug('check_tx: queue full, %s transactions rejected',
+                         len(raw_transactions) - accepted)
+
+        # NOTE: the transactions rechecked after a block were verified when
+        #       they entered the mempool
+        verified = self.app.verified_transactions
+        unverified = [raw_transaction for raw_transaction in raw_transactions[:accepted]
+                      if sha3_256(raw_transaction).digest() not in verified]
+        verifications = {}
+        size = max(1, math.ceil(len(unverified) / self.concurrency))
+        for start in range(0, len(unverified), size):
+            chunk = unverified[start:start + size]
+            future = self.executor.submit(verify_transactions, chunk)
+            verifications.update((raw_transaction, (future, index))
+                                 for index, raw_transaction in enumerate(chunk))
+        pending.extend((raw_transaction, *verifications.get(raw_transaction, (VERIFIED, 0)))
+                       for raw_transaction in raw_transactions[:accepted])
+        pending.extend((raw_transaction, None, None)
+                       for raw_transaction in raw_transactions[accepted:])
+
+    def answer(self, socket, pending, wait):
+        """Send the responses of the ``pending`` requests, in order.
+
+        If ``wait`` is ``False``, only the responses which are ready are
+        sent.
+        """
+        responses = []
+        while pending:
+            raw_transaction, future, index = pending[0]
+            if future is None:
+                result = self.app.abci.ResponseCheckTx(
+                    code=CodeTypeError, log='check_tx queue is full')
+            elif wait or future.done():
+                if not future.done():
+                    # NOTE: waiting on the future would block the hub, and
+                    #       the other connections with it
+                    get_hub().threadpool.spawn(future.result).get()
+                if future.result()[index] == VALID:
+                    result = self.app.check_tx(raw_transaction, verified=True)
+                else:
+                    result = self.app.abci.ResponseCheckTx(code=CodeTypeError)
+            else:
+                break
+            pending.popleft()
+            responses.append(write_message(self.app.abci.Response(check_tx=result)))
+
+        if responses:
+            socket.sendall(b''.join(responses))
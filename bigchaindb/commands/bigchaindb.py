@@ -269,8 +269,20 @@ def run_drop(args):
         print("Cannot drop '{name}'. The database does not exist.".format(name=dbname), file=sys.stderr)
 
 
+@configure_bigchaindb
+def run_rebuild_utxoset(args):
+    """Rebuild the UTXO set from the stored transactions"""
+    b = BigchainDB()
+    count = b.rebuild_utxoset()
+    print('Rebuilt the UTXO set with {} unspent outputs.'.format(count),
+          file=sys.stderr)
+
+
 def run_recover(b):
     rollback(b)
+    # NOTE: the tables derived from the transactions are rebuilt if they
+    #       were written by an older release
+    b.migrate()
 
 
 @configure_bigchaindb
@@ -318,12 +330,12 @@ def create_parser():
                                           help='Prepare the config file.')
 
     config_parser.add_argument('backend',
-                               choices=['localmongodb'],
+                               choices=['localmongodb', 'localsqlite', 'inmemory'],
                                default='localmongodb',
                                const='localmongodb',
                                nargs='?',
-                               help='The backend to use. It can only be '
-                               '"localmongodb", currently.')
+                               help='The backend to use: "localmongodb" '
+                               '(default), "localsqlite" or "inmemory".')
 
     # parser for managing elections
     election_parser = subparsers.add_parser('election',
@@ -372,6 +384,9 @@ def create_parser():
     subparsers.add_parser('drop',
                           help='Drop the database')
 
+    subparsers.add_parser('rebuild-utxoset',
+                          help='Rebuild the UTXO set')
+
     # parser for starting BigchainDB
     start_parser = subparsers.add_parser('start',
                                          help='Start BigchainDB')
@@ -0,0 +1,212 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Bounded in-memory caches.
+
+The caches shared by a process are registered by name (see
+:func:`get_cache`), so that their statistics can be read together with
+:func:`stats`. Their budgets are the ``cache.*`` settings of the
+configuration.
+"""
+
+import sys
+from collections import OrderedDict
+from threading import RLock
+
+import bigchaindb
+
+
+# Rough per-entry bookkeeping cost of the underlying ``OrderedDict``
+# (hash table slot, linked list node and the ``(value, size)`` tuple).
+ENTRY_OVERHEAD = 120
+
+
+def sizeof(key, value):
+    """Return the approximate number of bytes used by a cache entry."""
+    return sys.getsizeof(key) + sys.getsizeof(value) + ENTRY_OVERHEAD
+
+
+def deep_sizeof(obj):
+    """Return the approximate number of bytes used by ``obj``, including
+    the dicts, lists, tuples and strings it contains."""
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size
+
+
+def deep_sizeof_entry(key, value):
+    """Return the approximate number of bytes used by a cache entry, whose
+    key and value are made of dicts, lists, tuples and scalars."""
+    return deep_sizeof(key) + deep_sizeof(value) + ENTRY_OVERHEAD
+
+
+class LRUCache:
+    """A least recently used cache bounded by an approximate byte budget.
+
+    The cache counts hits, misses and evictions, so that the budget can be
+    tuned by looking at :meth:`stats`. It can be shared by the threads of
+    a process, e.g. with a :class:`~bigchaindb.block_writer.BlockWriter`.
+
+    Args:
+        max_bytes (int): the memory budget of the cache. Entries are
+            evicted, least recently used first, when the budget is exceeded.
+        sizeof (callable, optional): a function taking a key and a value
+            and returning the number of bytes accounted for the entry.
+            Defaults to a shallow estimate based on ``sys.getsizeof``.
+    """
+
+    def __init__(self, max_bytes, sizeof=sizeof):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = RLock()
+        self.clear()
+
+    def clear(self):
+        """Remove all the entries, keeping the counters."""
+        with self._lock:
+            self._entries = OrderedDict()
+            self.size = 0
+
+    def reset(self):
+        """Remove all the entries, and reset the counters."""
+        with self._lock:
+            self.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def resize(self, max_bytes):
+        """Change the memory budget, evicting entries if needed."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Return the value cached for ``key``, or ``default``."""
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Cache ``value`` for ``key``, evicting old entries if needed."""
+        size = self.sizeof(key, value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self.discard(key)
+            self._entries[key] = (value, size)
+            self.size += size
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        """Remove ``key`` and return its value, or ``default``.
+
+        A successful pop counts as a hit.
+        """
+        with self._lock:
+            value = self.get(key, default)
+            self.discard(key)
+            return value
+
+    def discard(self, key):
+        """Remove ``key`` without touching the counters."""
+        with self._lock:
+            try:
+                _, size = self._entries.pop(key)
+            except KeyError:
+                return
+            self.size -= size
+
+    def stats(self):
+        """Return the size and the counters of the cache.
+
+        The ``hit_rate`` is the ratio of the lookups that were hits, or
+        ``None`` before the first lookup.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'evictions': self.evictions,
+            }
+
+
+# the caches of the process, by name
+_caches = {}
+
+
+def get_cache(name, sizeof=sizeof):
+    """Return the cache registered as ``name``.
+
+    The first time, the cache is created with the budget of the
+    ``cache.<name>`` setting and the given ``sizeof``.
+    """
+    try:
+        return _caches[name]
+    except KeyError:
+        return register(name, LRUCache(bigchaindb.config['cache'][name], sizeof))
+
+
+def register(name, cache):
+    """Register ``cache`` as ``name``, replacing the previous cache of that
+    name, and return it."""
+    _caches[name] = cache
+    return cache
+
+
+def configure(budgets):
+    """Apply the budgets of the ``cache`` configuration to the registered
+    caches."""
+    for name, cache in _caches.items():
+        if name in budgets:
+            cache.resize(budgets[name])
+
+
+def stats():
+    """Return the :meth:`~LRUCache.stats` of the registered caches, by
+    name."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def reset():
+    """:meth:`~LRUCache.reset` the registered caches."""
+    for cache in _caches.values():
+        cache.reset()
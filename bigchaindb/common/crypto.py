@@ -4,7 +4,9 @@
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
 # Separate all crypto code so that we can easily test several implementations
-from collections import namedtuple
+import secrets
+from collections import defaultdict, namedtuple
+from hashlib import sha512
 
 try:
     from hashlib import sha3_256
@@ -12,10 +14,18 @@ except ImportError:
     from sha3 import sha3_256
 
 from cryptoconditions import crypto
+from nacl.bindings import (crypto_core_ed25519_add,
+                           crypto_scalarmult_ed25519_base_noclamp,
+                           crypto_scalarmult_ed25519_noclamp,
+                           crypto_sign_open)
+from nacl.exceptions import BadSignatureError, RuntimeError as NaclRuntimeError
 
 
 CryptoKeypair = namedtuple('CryptoKeypair', ('private_key', 'public_key'))
 
+# the order of the prime order subgroup of Ed25519
+GROUP_ORDER = 2 ** 252 + 27742317777372353535851937790883648493
+
 
 def hash_data(data):
     """Hash the provided data using SHA3-256"""
@@ -53,3 +63,93 @@ def public_key_from_ed25519_key(hex_public_key):
     """Generate base58 public key from hex encoded public key"""
     public_key = crypto.Ed25519VerifyingKey(bytes.fromhex(hex_public_key), encoding='bytes')
     return public_key.encode(encoding='base58').decode('utf-8')
+
+
+def verify_signature(public_key, message, signature):
+    """Verify an Ed25519 signature, as bytes."""
+    try:
+        crypto_sign_open(signature + message, public_key)
+    except (BadSignatureError, ValueError):
+        return False
+    return True
+
+
+def _scalar(value):
+    return (value % GROUP_ORDER).to_bytes(32, 'little')
+
+
+def verify_batch(signatures):
+    """Verify that all the Ed25519 signatures of a batch are valid, with a
+    single equation.
+
+    The verification equations ``s * B = R + h * A`` of the signatures
+    are combined with random 128 bits coefficients ``z``:
+    ``(sum z * s) * B = sum z * R + sum (z * h) * A``, where the terms of
+    the same public key are grouped. A batch with an invalid signature
+    passes with a probability of at most 2^-128.
+
+    The points are multiplied by libsodium, which rejects the points that
+    are not in the prime order subgroup. Hence, as in
+    :func:`verify_signature`, a signature has to satisfy its own
+    equation, not only the one multiplied by the cofactor: a signature
+    that passes the batch passes ``crypto_sign_open`` as well.
+
+    Args:
+        signatures (:obj:`list` of :obj:`tuple`): the
+            ``(public_key, message, signature)`` triples to verify, as
+            bytes.
+
+    Returns:
+        bool: whether all the signatures are valid. ``False`` doesn't tell
+        which ones are not.
+    """
+    base_scalar = 0
+    key_scalars = defaultdict(int)
+    terms = []
+    try:
+        for public_key, message, signature in signatures:
+            if len(public_key) != 32 or len(signature) != 64:
+                return False
+            s = int.from_bytes(signature[32:], 'little')
+            if s >= GROUP_ORDER:
+                return False
+            z = secrets.randbits(128) | 1
+            h = int.from_bytes(sha512(signature[:32] + public_key + message).digest(), 'little')
+            base_scalar += z * s
+            key_scalars[public_key] += z * h
+            terms.append(crypto_scalarmult_ed25519_noclamp(_scalar(z), signature[:32]))
+        terms.extend(crypto_scalarmult_ed25519_noclamp(_scalar(scalar), public_key)
+                     for public_key, scalar in key_scalars.items())
+        expected = crypto_scalarmult_ed25519_base_noclamp(_scalar(base_scalar))
+    except NaclRuntimeError:
+        # a point of small order, or out of the prime order subgroup, or a
+        # null scalar
+        return False
+
+    total = terms[0]
+    for term in terms[1:]:
+        total = crypto_core_ed25519_add(total, term)
+    return total == expected
+
+
+def verify_signatures(signatures):
+    """Verify a batch of Ed25519 signatures.
+
+    The batch is verified with :func:`verify_batch`. If it fails, its
+    halves are verified in turn, down to the single signatures verified
+    with :func:`verify_signature`, to find the invalid ones.
+
+    Args:
+        signatures (:obj:`list` of :obj:`tuple`): the
+            ``(public_key, message, signature)`` triples to verify, as
+            bytes.
+
+    Returns:
+        :obj:`list` of :obj:`bool`: the validity of each signature.
+    """
+    if len(signatures) == 1:
+        return [verify_signature(*signatures[0])]
+    if not signatures or verify_batch(signatures):
+        return [True] * len(signatures)
+    middle = len(signatures) // 2
+    return verify_signatures(signatures[:middle]) + verify_signatures(signatures[middle:])
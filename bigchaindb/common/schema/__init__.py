@@ -44,8 +44,13 @@ _, TX_SCHEMA_CHAIN_MIGRATION_ELECTION = _load_schema('transaction_chain_migratio
 _, TX_SCHEMA_VOTE = _load_schema('transaction_vote_' + TX_SCHEMA_VERSION)
 
 
-def _validate_schema(schema, body):
-    """Validate data against a schema"""
+def _validate_schema(schema, body, serialized=None):
+    """Validate data against a schema
+
+    The JSON serialization of ``body`` can be passed as ``serialized``, to
+    validate the same data against several schemas without serializing it
+    for each of them.
+    """
 
     # Note
     #
@@ -59,7 +64,7 @@ def _validate_schema(schema, body):
     # a helpful error message.
 
     try:
-        schema[1](rapidjson.dumps(body))
+        schema[1](serialized if serialized is not None else rapidjson.dumps(body))
     except ValueError as exc:
         try:
             jsonschema.validate(body, schema[0])
@@ -69,14 +74,20 @@ def _validate_schema(schema, body):
         raise SchemaValidationError(str(exc)) from exc
 
 
-def validate_transaction_schema(tx):
+def validate_transaction_schema(tx, serialized=None):
     """Validate a transaction dict.
 
     TX_SCHEMA_COMMON contains properties that are common to all types of
     transaction. TX_SCHEMA_[TRANSFER|CREATE] add additional constraints on top.
+
+    The JSON serialization the transaction was parsed from, e.g. the raw
+    bytes of an ABCI request, can be passed as ``serialized`` so that it is
+    validated as is.
     """
-    _validate_schema(TX_SCHEMA_COMMON, tx)
+    if serialized is None:
+        serialized = rapidjson.dumps(tx)
+    _validate_schema(TX_SCHEMA_COMMON, tx, serialized)
     if tx['operation'] == 'TRANSFER':
-        _validate_schema(TX_SCHEMA_TRANSFER, tx)
+        _validate_schema(TX_SCHEMA_TRANSFER, tx, serialized)
     else:
-        _validate_schema(TX_SCHEMA_CREATE, tx)
+        _validate_schema(TX_SCHEMA_CREATE, tx, serialized)
@@ -0,0 +1,99 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Verification of the signatures of many transactions at once."""
+
+from cryptoconditions import Ed25519Sha256, ThresholdSha256
+from cryptoconditions.types.threshold import FULFILLMENT
+
+from bigchaindb.common.crypto import verify_signatures
+
+
+def ed25519_signatures(fulfillment):
+    """Return the ``(public_key, signature)`` pairs of the Ed25519
+    fulfillments in a fulfillment tree.
+
+    Returns ``None`` if the validity of the tree doesn't only depend on
+    these signatures, i.e. if it holds fulfillments of other types, or
+    threshold fulfillments without the required number of subfulfillments.
+    """
+    if isinstance(fulfillment, Ed25519Sha256):
+        if fulfillment.public_key is None or fulfillment.signature is None:
+            return None
+        return [(fulfillment.public_key, fulfillment.signature)]
+
+    if isinstance(fulfillment, ThresholdSha256):
+        subfulfillments = [subcondition['body']
+                           for subcondition in fulfillment.subconditions
+                           if subcondition['type'] == FULFILLMENT]
+        if len(subfulfillments) != fulfillment.threshold:
+            return None
+        signatures = []
+        for subfulfillment in subfulfillments:
+            subsignatures = ed25519_signatures(subfulfillment)
+            if subsignatures is None:
+                return None
+            signatures.extend(subsignatures)
+        return signatures
+
+    return None
+
+
+class SignatureBatch:
+    """Collect the signatures of the Inputs of many transactions, and
+    verify them all together.
+
+    The Ed25519 signatures of every Input, including the ones nested in
+    threshold fulfillments, are verified with a single call to
+    :func:`~bigchaindb.common.crypto.verify_signatures`, each distinct
+    signature once: a single batch equation is checked when they are all
+    valid. The transactions whose signatures are all valid are
+    marked as :attr:`~bigchaindb.common.transaction.Transaction.signatures_verified`,
+    so that their validation only checks the conditions they fulfill.
+
+    The other transactions are left as they are: validating them checks
+    their Inputs one by one, finding the invalid one.
+    """
+
+    def __init__(self):
+        # the transactions added, with the signatures of their Inputs, or
+        # `None` if they can't be verified in a batch
+        self.transactions = []
+
+    def add(self, transaction):
+        signatures = []
+        message = transaction._fulfillment_message()
+        for input_ in transaction.inputs:
+            input_signatures = ed25519_signatures(input_.fulfillment)
+            if input_signatures is None:
+                signatures = None
+                break
+            digest = transaction._input_message_digest(input_, message)
+            signatures.extend((public_key, digest, signature)
+                              for public_key, signature in input_signatures)
+        self.transactions.append((transaction, signatures))
+
+    def verify(self):
+        """Verify the signatures of the transactions added.
+
+        Returns:
+            :obj:`list` of :class:`~bigchaindb.common.transaction.Transaction`:
+            the transactions which have not been verified.
+        """
+        signatures = list({signature
+                           for _, transaction_signatures in self.transactions
+                           if transaction_signatures
+                           for signature in transaction_signatures})
+        valid = dict(zip(signatures, verify_signatures(signatures)))
+
+        unverified = []
+        for transaction, transaction_signatures in self.transactions:
+            if transaction_signatures is not None and \
+                    all(valid[signature] for signature in transaction_signatures):
+                transaction.signatures_verified = True
+            else:
+                unverified.append(transaction)
+        self.transactions = []
+        return unverified
@@ -13,8 +13,7 @@ Attributes:
 """
 from collections import namedtuple
 from copy import deepcopy
-from functools import reduce, lru_cache
-import rapidjson
+from functools import reduce
 
 import base58
 from cryptoconditions import Fulfillment, ThresholdSha256, Ed25519Sha256
@@ -25,14 +24,16 @@ try:
 except ImportError:
     from sha3 import sha3_256
 
+from bigchaindb.common.cache import (ENTRY_OVERHEAD, deep_sizeof,
+                                     deep_sizeof_entry, get_cache)
 from bigchaindb.common.crypto import PrivateKey, hash_data
 from bigchaindb.common.exceptions import (KeypairMismatchException,
                                           InputDoesNotExist, DoubleSpend,
                                           InvalidHash, InvalidSignature,
                                           AmountError, AssetIdMismatch,
                                           ThresholdTooDeep)
-from bigchaindb.common.utils import serialize
-from .memoize import memoize_from_dict, memoize_to_dict
+from bigchaindb.common.utils import deserialize, serialize
+from bigchaindb.overlay import BlockOverlay
 
 
 UnspentOutput = namedtuple(
@@ -61,8 +62,14 @@ class Input(object):
             fulfills (:class:`~bigchaindb.common.transaction. TransactionLink`,
                 optional): A link representing the input of a `TRANSFER`
                 Transaction.
+
+        Note:
+            An Input can keep its fulfillment as a URI, only parsing it when
+            :attr:`fulfillment` is accessed (see :meth:`from_dict`).
     """
 
+    __slots__ = ('_fulfillment', '_fulfillment_uri', 'fulfills', 'owners_before')
+
     def __init__(self, fulfillment, owners_before, fulfills=None):
         """Create an instance of an :class:`~.Input`.
 
@@ -84,6 +91,35 @@ class Input(object):
         self.fulfills = fulfills
         self.owners_before = owners_before
 
+    @property
+    def fulfillment(self):
+        """:class:`cryptoconditions.Fulfillment`: The fulfillment of the
+        Input, parsed from its URI on first access.
+
+            Raises:
+                InvalidSignature: If the URI couldn't be parsed.
+        """
+        if self._fulfillment is None and self._fulfillment_uri is not None:
+            self._fulfillment = _fulfillment_from_uri(self._fulfillment_uri)
+        return self._fulfillment
+
+    @fulfillment.setter
+    def fulfillment(self, fulfillment):
+        self._fulfillment = fulfillment
+        self._fulfillment_uri = None
+
+    @property
+    def fulfillment_uri(self):
+        """str: The URI of the fulfillment of the Input.
+
+            Raises:
+                TypeError: If the fulfillment can't be serialized, e.g. as
+                    it isn't signed yet.
+        """
+        if self._fulfillment_uri is not None:
+            return self._fulfillment_uri
+        return self._fulfillment.serialize_uri()
+
     def __eq__(self, other):
         # TODO: If `other !== Fulfillment` return `False`
         return self.to_dict() == other.to_dict()
@@ -91,7 +127,7 @@ class Input(object):
     # NOTE: This function is used to provide a unique key for a given
     # Input to suppliment memoization
     def __hash__(self):
-        return hash((self.fulfillment, self.fulfills))
+        return hash((self._fulfillment_uri or self._fulfillment, self.fulfills))
 
     def to_dict(self):
         """Transforms the object to a Python dictionary.
@@ -104,7 +140,7 @@ class Input(object):
                 dict: The Input as an alternative serialization format.
         """
         try:
-            fulfillment = self.fulfillment.serialize_uri()
+            fulfillment = self.fulfillment_uri
         except (TypeError, AttributeError, ASN1EncodeError, ASN1DecodeError):
             fulfillment = _fulfillment_to_details(self.fulfillment)
 
@@ -130,7 +166,7 @@ class Input(object):
         return cls(output.fulfillment, public_keys)
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, lazy=False):
         """Transforms a Python dictionary to an Input object.
 
             Note:
@@ -139,6 +175,8 @@ class Input(object):
 
             Args:
                 data (dict): The Input to be transformed.
+                lazy (bool): If ``True``, a fulfillment URI is only parsed
+                    when the fulfillment is accessed.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Input`
@@ -147,21 +185,36 @@ class Input(object):
                 InvalidSignature: If an Input's URI couldn't be parsed.
         """
         fulfillment = data['fulfillment']
+        fulfills = TransactionLink.from_dict(data['fulfills'])
+        if lazy and isinstance(fulfillment, str):
+            input_ = cls(None, data['owners_before'], fulfills)
+            input_._fulfillment_uri = fulfillment
+            return input_
+
         if not isinstance(fulfillment, (Fulfillment, type(None))):
             try:
-                fulfillment = Fulfillment.from_uri(data['fulfillment'])
-            except ASN1DecodeError:
-                # TODO Remove as it is legacy code, and simply fall back on
-                # ASN1DecodeError
-                raise InvalidSignature("Fulfillment URI couldn't been parsed")
+                fulfillment = _fulfillment_from_uri(fulfillment)
             except TypeError:
                 # NOTE: See comment about this special case in
                 #       `Input.to_dict`
-                fulfillment = _fulfillment_from_details(data['fulfillment'])
-        fulfills = TransactionLink.from_dict(data['fulfills'])
+                fulfillment = _fulfillment_from_details(fulfillment)
         return cls(fulfillment, data['owners_before'], fulfills)
 
 
+def _fulfillment_from_uri(uri):
+    """Parse a fulfillment URI
+
+    Args:
+        uri (str): the URI of a Crypto-conditions Fulfillment
+    """
+    try:
+        return Fulfillment.from_uri(uri)
+    except ASN1DecodeError:
+        # TODO Remove as it is legacy code, and simply fall back on
+        # ASN1DecodeError
+        raise InvalidSignature("Fulfillment URI couldn't been parsed")
+
+
 def _fulfillment_to_details(fulfillment):
     """Encode a fulfillment as a details dictionary
 
@@ -221,6 +274,8 @@ class TransactionLink(object):
             `txid`.
     """
 
+    __slots__ = ('txid', 'output')
+
     def __init__(self, txid=None, output=None):
         """Create an instance of a :class:`~.TransactionLink`.
 
@@ -295,8 +350,15 @@ class Output(object):
                 to extract a Condition from.
             public_keys (:obj:`list` of :obj:`str`, optional): A list of
                 owners before a Transaction was confirmed.
+
+        Note:
+            An Output can keep its condition as a dict, only loading the
+            fulfillment when :attr:`fulfillment` is accessed (see
+            :meth:`from_dict`).
     """
 
+    __slots__ = ('_fulfillment', '_condition', 'amount', 'public_keys')
+
     MAX_AMOUNT = 9 * 10 ** 18
 
     def __init__(self, fulfillment, public_keys=None, amount=1):
@@ -326,6 +388,21 @@ class Output(object):
         self.amount = amount
         self.public_keys = public_keys
 
+    @property
+    def fulfillment(self):
+        """:class:`cryptoconditions.Fulfillment`: The fulfillment the
+        condition of the Output is extracted from, loaded from the
+        condition details on first access. It is the condition URI for a
+        hashlock condition."""
+        if self._fulfillment is None and self._condition is not None:
+            self._fulfillment = _fulfillment_from_condition(self._condition)
+        return self._fulfillment
+
+    @fulfillment.setter
+    def fulfillment(self, fulfillment):
+        self._fulfillment = fulfillment
+        self._condition = None
+
     def __eq__(self, other):
         # TODO: If `other !== Condition` return `False`
         return self.to_dict() == other.to_dict()
@@ -342,16 +419,19 @@ class Output(object):
         """
         # TODO FOR CC: It must be able to recognize a hashlock condition
         #              and fulfillment!
-        condition = {}
-        try:
-            condition['details'] = _fulfillment_to_details(self.fulfillment)
-        except AttributeError:
-            pass
+        if self._condition is not None:
+            condition = dict(self._condition)
+        else:
+            condition = {}
+            try:
+                condition['details'] = _fulfillment_to_details(self.fulfillment)
+            except AttributeError:
+                pass
 
-        try:
-            condition['uri'] = self.fulfillment.condition_uri
-        except AttributeError:
-            condition['uri'] = self.fulfillment
+            try:
+                condition['uri'] = self.fulfillment.condition_uri
+            except AttributeError:
+                condition['uri'] = self.fulfillment
 
         output = {
             'public_keys': self.public_keys,
@@ -455,7 +535,7 @@ class Output(object):
         return initial
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, lazy=False):
         """Transforms a Python dictionary to an Output object.
 
             Note:
@@ -466,22 +546,44 @@ class Output(object):
 
             Args:
                 data (dict): The dict to be transformed.
+                lazy (bool): If ``True``, the fulfillment is only loaded from
+                    the condition when it is accessed, and the condition is
+                    kept as it is.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Output`
         """
-        try:
-            fulfillment = _fulfillment_from_details(data['condition']['details'])
-        except KeyError:
-            # NOTE: Hashlock condition case
-            fulfillment = data['condition']['uri']
         try:
             amount = int(data['amount'])
         except ValueError:
             raise AmountError('Invalid amount: %s' % data['amount'])
+        if lazy:
+            output = cls(None, data['public_keys'], amount)
+            output._condition = data['condition']
+            return output
+        fulfillment = _fulfillment_from_condition(data['condition'])
         return cls(fulfillment, data['public_keys'], amount)
 
 
+def _fulfillment_from_condition(condition):
+    """Load the fulfillment of an output condition
+
+    Args:
+        condition: tx.output[].condition dictionary
+    """
+    try:
+        return _fulfillment_from_details(condition['details'])
+    except KeyError:
+        # NOTE: Hashlock condition case
+        return condition['uri']
+
+
+def _sizeof_transaction(key, transaction):
+    """Return the approximate number of bytes used by a cached
+    Transaction: its dictionary, and about as much for its objects."""
+    return 2 * deep_sizeof(transaction.tx_dict) + ENTRY_OVERHEAD
+
+
 class Transaction(object):
     """A Transaction is used to create and transfer assets.
 
@@ -565,6 +667,13 @@ class Transaction(object):
         self.metadata = metadata
         self._id = hash_id
         self.tx_dict = tx_dict
+        # NOTE: set when the fulfillments are known to be valid signatures
+        #       of this transaction, e.g. because they were verified by a
+        #       previous `check_tx` of the same bytes
+        self.signatures_verified = False
+        # NOTE: the serializations of the Transaction, cached per id (see
+        #       `_serialization`)
+        self._serializations = {}
 
     @property
     def unspent_outputs(self):
@@ -597,7 +706,27 @@ class Transaction(object):
 
     @property
     def serialized(self):
-        return Transaction._to_str(self.to_dict())
+        """str: The canonical serialization of the Transaction."""
+        return self._serialization(
+            'full', lambda: Transaction._to_str(self.to_dict()))
+
+    def _serialization(self, name, serialize):
+        """Returns the serialization ``name`` of the Transaction, computed
+        with ``serialize``.
+
+            Note:
+                Like :meth:`to_dict`, a Transaction with an id is considered
+                immutable: its serializations are computed once, and reused
+                until its id changes.
+        """
+        cached = self._serializations.get(name)
+        if cached is not None and cached[0] == self._id:
+            return cached[1]
+
+        serialized = serialize()
+        if self._id is not None:
+            self._serializations[name] = (self._id, serialized)
+        return serialized
 
     def _hash(self):
         self._id = hash_data(self.serialized)
@@ -1003,10 +1132,14 @@ class Transaction(object):
             raise ValueError('Inputs and '
                              'output_condition_uris must have the same count')
 
-        tx_dict = self.tx_dict if self.tx_dict else self.to_dict()
-        tx_dict = Transaction._remove_signatures(tx_dict)
-        tx_dict['id'] = None
-        tx_serialized = Transaction._to_str(tx_dict)
+        if self.signatures_verified:
+            # NOTE: Only the conditions fulfilled by the inputs are left to
+            #       be checked, as they depend on the outputs being spent.
+            return self.operation == self.CREATE or all(
+                input_.fulfillment.condition_uri == cond
+                for input_, cond in zip(self.inputs, output_condition_uris))
+
+        tx_serialized = self._fulfillment_message()
 
         def validate(i, output_condition_uri=None):
             """Validate input against output condition URI"""
@@ -1016,7 +1149,48 @@ class Transaction(object):
         return all(validate(i, cond)
                    for i, cond in enumerate(output_condition_uris))
 
-    @lru_cache(maxsize=16384)
+    def signatures_valid(self):
+        """Validates the signatures of the Inputs, without checking the
+        Outputs they fulfill.
+
+            Note:
+                As only the Transaction itself is needed, the check can run
+                before, or apart from, the checks depending on the state
+                of the chain. These then only have to compare the
+                conditions fulfilled by the Inputs with the ones of the
+                Outputs they spend (see :attr:`signatures_verified`).
+
+            Returns:
+                bool: If all signatures are valid.
+        """
+        tx_serialized = self._fulfillment_message()
+
+        # NOTE: the Output is never checked for a `CREATE` operation
+        return all(self._input_valid(input_, self.CREATE, tx_serialized)
+                   for input_ in self.inputs)
+
+    def _fulfillment_message(self):
+        """Returns the Transaction serialized without its signatures and
+        its id, which is what the Inputs sign (see
+        :meth:`_input_message_digest`)."""
+        def serialize():
+            tx_dict = self.tx_dict if self.tx_dict else self.to_dict()
+            tx_dict = Transaction._remove_signatures(tx_dict)
+            tx_dict['id'] = None
+            return Transaction._to_str(tx_dict)
+
+        return self._serialization('fulfillment_message', serialize)
+
+    @staticmethod
+    def _input_message_digest(input_, message):
+        """Returns the digest signed by an Input, given the
+        :meth:`_fulfillment_message` of its Transaction."""
+        message = sha3_256(message.encode())
+        if input_.fulfills:
+            message.update('{}{}'.format(
+                input_.fulfills.txid, input_.fulfills.output).encode())
+        return message.digest()
+
     def _input_valid(self, input_, operation, message, output_condition_uri=None):
         """Validates a single Input against a single Output.
 
@@ -1024,6 +1198,10 @@ class Transaction(object):
                 In case of a `CREATE` Transaction, this method
                 does not validate against `output_condition_uri`.
 
+            Note:
+                The results are cached in the ``inputs`` cache, by
+                fulfillment, signed digest and Output.
+
             Args:
                 input_ (:class:`~bigchaindb.common.transaction.
                     Input`) The Input to be signed.
@@ -1035,9 +1213,31 @@ class Transaction(object):
             Returns:
                 bool: If the Input is valid.
         """
-        ccffill = input_.fulfillment
         try:
-            parsed_ffill = Fulfillment.from_uri(ccffill.serialize_uri())
+            fulfillment_uri = input_.fulfillment_uri
+        except (TypeError, ValueError,
+                ParsingError, ASN1DecodeError, ASN1EncodeError):
+            return False
+
+        digest = self._input_message_digest(input_, message)
+        if operation == self.CREATE:
+            output_condition_uri = None
+        key = (fulfillment_uri, digest, output_condition_uri)
+
+        inputs = get_cache('inputs', deep_sizeof_entry)
+        valid = inputs.get(key)
+        if valid is None:
+            valid = self._fulfillment_valid(fulfillment_uri, digest,
+                                            operation, output_condition_uri)
+            inputs.put(key, valid)
+        return valid
+
+    def _fulfillment_valid(self, fulfillment_uri, digest, operation,
+                           output_condition_uri):
+        """Validates the fulfillment of an Input, given the digest it signs,
+        against an Output (see :meth:`_input_valid`)."""
+        try:
+            parsed_ffill = Fulfillment.from_uri(fulfillment_uri)
         except (TypeError, ValueError,
                 ParsingError, ASN1DecodeError, ASN1EncodeError):
             return False
@@ -1047,32 +1247,40 @@ class Transaction(object):
             #       output is always valid.
             output_valid = True
         else:
-            output_valid = output_condition_uri == ccffill.condition_uri
-
-        message = sha3_256(message.encode())
-        if input_.fulfills:
-            message.update('{}{}'.format(
-                input_.fulfills.txid, input_.fulfills.output).encode())
+            output_valid = output_condition_uri == parsed_ffill.condition_uri
 
         # NOTE: We pass a timestamp to `.validate`, as in case of a timeout
         #       condition we'll have to validate against it
 
         # cryptoconditions makes no assumptions of the encoding of the
         # message to sign or verify. It only accepts bytestrings
-        ffill_valid = parsed_ffill.validate(message=message.digest())
+        ffill_valid = parsed_ffill.validate(message=digest)
         return output_valid and ffill_valid
 
-    # This function is required by `lru_cache` to create a key for memoization
     def __hash__(self):
         return hash(self.id)
 
-    @memoize_to_dict
     def to_dict(self):
         """Transforms the object to a Python dictionary.
 
+            Note:
+                The dictionaries of the Transactions with an id are cached
+                in the ``transaction_dicts`` cache, by id.
+
             Returns:
                 dict: The Transaction as an alternative serialization format.
         """
+        if not self._id:
+            return self._to_dict()
+
+        transaction_dicts = get_cache('transaction_dicts', deep_sizeof_entry)
+        tx_dict = transaction_dicts.get(self._id)
+        if tx_dict is None:
+            tx_dict = self._to_dict()
+            transaction_dicts.put(self._id, tx_dict)
+        return tx_dict
+
+    def _to_dict(self):
         return {
             'inputs': [input_.to_dict() for input_ in self.inputs],
             'outputs': [output.to_dict() for output in self.outputs],
@@ -1096,14 +1304,15 @@ class Transaction(object):
 
         """
         # NOTE: We remove the reference since we need `tx_dict` only for the
-        #       transaction's hash
-        tx_dict = deepcopy(tx_dict)
-        for input_ in tx_dict['inputs']:
-            # NOTE: Not all Cryptoconditions return a `signature` key (e.g.
-            #       ThresholdSha256), so setting it to `None` in any
-            #       case could yield incorrect signatures. This is why we only
-            #       set it to `None` if it's set in the dict.
-            input_['fulfillment'] = None
+        #       transaction's hash. Only the dicts which are changed are
+        #       copied: the rest of the transaction is shared with `tx_dict`.
+        tx_dict = dict(tx_dict)
+        # NOTE: Not all Cryptoconditions return a `signature` key (e.g.
+        #       ThresholdSha256), so setting it to `None` in any
+        #       case could yield incorrect signatures. This is why we only
+        #       set it to `None` if it's set in the dict.
+        tx_dict['inputs'] = [dict(input_, fulfillment=None)
+                             for input_ in tx_dict['inputs']]
         return tx_dict
 
     @staticmethod
@@ -1168,16 +1377,13 @@ class Transaction(object):
             Args:
                 tx_body (dict): The Transaction to be transformed.
         """
-        # NOTE: Remove reference to avoid side effects
-        # tx_body = deepcopy(tx_body)
-        tx_body = rapidjson.loads(rapidjson.dumps(tx_body))
-
         try:
             proposed_tx_id = tx_body['id']
         except KeyError:
             raise InvalidHash('No transaction id found!')
 
-        tx_body['id'] = None
+        # NOTE: Copy the top level dict only, to avoid side effects
+        tx_body = dict(tx_body, id=None)
 
         tx_body_serialized = Transaction._to_str(tx_body)
         valid_tx_id = Transaction._to_hash(tx_body_serialized)
@@ -1188,33 +1394,76 @@ class Transaction(object):
             raise InvalidHash(err_msg.format(proposed_tx_id))
 
     @classmethod
-    @memoize_from_dict
-    def from_dict(cls, tx, skip_schema_validation=True):
+    def from_dict(cls, tx, skip_schema_validation=True, serialized=None):
         """Transforms a Python dictionary to a Transaction object.
 
+            Note:
+                The Transactions with an id are cached in the
+                ``transactions`` cache, by class, id and validation.
+
             Args:
                 tx_body (dict): The Transaction to be transformed.
+                serialized (str|bytes, optional): The JSON serialization
+                    ``tx_body`` was parsed from, validated against the
+                    schemas instead of serializing ``tx_body`` again.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Transaction`
         """
+        tx_id = tx.get('id') if isinstance(tx, dict) else None
+        if not tx_id:
+            return cls._from_dict(tx, skip_schema_validation, serialized)
+
+        transactions = get_cache('transactions', _sizeof_transaction)
+        key = (cls, tx_id, skip_schema_validation)
+        transaction = transactions.get(key)
+        # NOTE: the id of a transaction which isn't validated yet can't be
+        #       trusted, so the cached transaction must be the same
+        if transaction is None or transaction.tx_dict != tx:
+            transaction = cls._from_dict(tx, skip_schema_validation, serialized)
+            transactions.put(key, transaction)
+        return transaction
+
+    @classmethod
+    def from_json(cls, raw, skip_schema_validation=True):
+        """Parse a Transaction from its JSON serialization, e.g. the raw
+        bytes of an ABCI request.
+
+            The serialization is parsed once, and validated as is against
+            the schemas.
+
+            Args:
+                raw (str|bytes): The JSON serialization of the Transaction.
+
+            Returns:
+                :class:`~bigchaindb.common.transaction.Transaction`
+        """
+        return cls.from_dict(deserialize(raw), skip_schema_validation, raw)
+
+    @classmethod
+    def _from_dict(cls, tx, skip_schema_validation, serialized=None):
         operation = tx.get('operation', Transaction.CREATE) if isinstance(tx, dict) else Transaction.CREATE
         cls = Transaction.resolve_class(operation)
 
         if not skip_schema_validation:
             cls.validate_id(tx)
-            cls.validate_schema(tx)
+            cls.validate_schema(tx, serialized)
 
-        inputs = [Input.from_dict(input_) for input_ in tx['inputs']]
-        outputs = [Output.from_dict(output) for output in tx['outputs']]
+        # NOTE: the fulfillments of a transaction known to be valid, e.g.
+        #       read from the database, are only parsed if they are used
+        lazy = skip_schema_validation
+        inputs = [Input.from_dict(input_, lazy) for input_ in tx['inputs']]
+        outputs = [Output.from_dict(output, lazy) for output in tx['outputs']]
         return cls(tx['operation'], tx['asset'], inputs, outputs,
                    tx['metadata'], tx['version'], hash_id=tx['id'], tx_dict=tx)
 
     @classmethod
     def from_db(cls, bigchain, tx_dict_list):
         """Helper method that reconstructs a transaction dict that was returned
-        from the database. It checks what asset_id to retrieve, retrieves the
-        asset from the asset table and reconstructs the transaction.
+        from the database. Only the assets and the metadata missing from the
+        dicts are retrieved, together, from the asset and metadata tables.
+        To read transactions by id, use
+        :meth:`~bigchaindb.lib.BigchainDB.get_full_transactions` instead.
 
         Args:
             bigchain (:class:`~bigchaindb.tendermint.BigchainDB`): An instance
@@ -1223,7 +1472,7 @@ class Transaction(object):
                 list of transaction dict as returned from the database.
 
         Returns:
-            :class:`~Transaction`
+            :class:`~Transaction`, or ``None`` if ``tx_dict_list`` is empty.
 
         """
         return_list = True
@@ -1231,34 +1480,28 @@ class Transaction(object):
             tx_dict_list = [tx_dict_list]
             return_list = False
 
-        tx_map = {}
-        tx_ids = []
-        for tx in tx_dict_list:
-            tx.update({'metadata': None})
-            tx_map[tx['id']] = tx
-            tx_ids.append(tx['id'])
-
-        assets = list(bigchain.get_assets(tx_ids))
-        for asset in assets:
-            if asset is not None:
-                tx = tx_map[asset['id']]
-                del asset['id']
-                tx['asset'] = asset
-
-        tx_ids = list(tx_map.keys())
-        metadata_list = list(bigchain.get_metadata(tx_ids))
-        for metadata in metadata_list:
-            tx = tx_map[metadata['id']]
-            tx.update({'metadata': metadata.get('metadata')})
+        # NOTE: the dicts given may be shared, e.g. cached
+        tx_map = {tx['id']: dict(tx) for tx in tx_dict_list}
+
+        asset_ids = [tx_id for tx_id, tx in tx_map.items() if 'asset' not in tx]
+        if asset_ids:
+            for asset in bigchain.get_assets(asset_ids):
+                tx_map[asset['id']]['asset'] = {key: value for key, value in asset.items()
+                                                if key != 'id'}
 
+        metadata_ids = [tx_id for tx_id, tx in tx_map.items() if 'metadata' not in tx]
+        if metadata_ids:
+            for tx_id in metadata_ids:
+                tx_map[tx_id]['metadata'] = None
+            for metadata in bigchain.get_metadata(metadata_ids):
+                tx_map[metadata['id']]['metadata'] = metadata.get('metadata')
+
+        # NOTE: a committed transaction is known to be valid
+        tx_list = [cls.from_dict(tx, True) for tx in tx_map.values()]
         if return_list:
-            tx_list = []
-            for tx_id, tx in tx_map.items():
-                tx_list.append(cls.from_dict(tx))
             return tx_list
         else:
-            tx = list(tx_map.values())[0]
-            return cls.from_dict(tx)
+            return tx_list[0] if tx_list else None
 
     type_registry = {}
 
@@ -1273,35 +1516,16 @@ class Transaction(object):
         return Transaction.type_registry.get(operation, create_txn_class)
 
     @classmethod
-    def validate_schema(cls, tx):
+    def validate_schema(cls, tx, serialized=None):
         pass
 
     def validate_transfer_inputs(self, bigchain, current_transactions=[]):
-        # store the inputs so that we can check if the asset ids match
-        input_txs = []
-        input_conditions = []
-        for input_ in self.inputs:
-            input_txid = input_.fulfills.txid
-            input_tx = bigchain.get_transaction(input_txid)
-
-            if input_tx is None:
-                for ctxn in current_transactions:
-                    if ctxn.id == input_txid:
-                        input_tx = ctxn
-
-            if input_tx is None:
-                raise InputDoesNotExist("input `{}` doesn't exist"
-                                        .format(input_txid))
-
-            spent = bigchain.get_spent(input_txid, input_.fulfills.output,
-                                       current_transactions)
-            if spent:
-                raise DoubleSpend('input `{}` was already spent'
-                                  .format(input_txid))
-
-            output = input_tx.outputs[input_.fulfills.output]
-            input_conditions.append(output)
-            input_txs.append(input_tx)
+        current_transactions = BlockOverlay.wrap(current_transactions)
+        # resolve the outputs spent by the inputs, so that we can check if
+        # the asset ids and the amounts match
+        input_outputs = self._get_spent_outputs(
+            bigchain, [input_.fulfills for input_ in self.inputs],
+            current_transactions)
 
         # Validate that all inputs are distinct
         links = [i.fulfills.to_uri() for i in self.inputs]
@@ -1309,13 +1533,16 @@ class Transaction(object):
             raise DoubleSpend('tx "{}" spends inputs twice'.format(self.id))
 
         # validate asset id
-        asset_id = self.get_asset_id(input_txs)
-        if asset_id != self.asset['id']:
+        asset_ids = {output.asset_id for output in input_outputs}
+        if len(asset_ids) > 1:
+            raise AssetIdMismatch(('All inputs of all transactions passed'
+                                   ' need to have the same asset id'))
+        if asset_ids.pop() != self.asset['id']:
             raise AssetIdMismatch(('The asset id of the input does not'
                                    ' match the asset id of the'
                                    ' transaction'))
 
-        input_amount = sum([input_condition.amount for input_condition in input_conditions])
+        input_amount = sum([output.amount for output in input_outputs])
         output_amount = sum([output_condition.amount for output_condition in self.outputs])
 
         if output_amount != input_amount:
@@ -1324,7 +1551,66 @@ class Transaction(object):
                                ' in the outputs `{}`')
                               .format(input_amount, output_amount))
 
-        if not self.inputs_valid(input_conditions):
+        if not self._inputs_valid([output.condition_uri
+                                   for output in input_outputs]):
             raise InvalidSignature('Transaction signature is invalid.')
 
         return True
+
+    @staticmethod
+    def _get_spent_outputs(bigchain, links, current_transactions):
+        """Resolve the outputs the inputs of a transaction want to spend.
+
+        Committed outputs are found with a single lookup in the UTXO set.
+        Outputs created in the current block, and outputs missing from the
+        UTXO set, are resolved from their transaction, which also tells
+        apart an input that doesn't exist from a double spend. The
+        transactions are read without their asset data and metadata, and
+        all the missing outputs are resolved together: at most three
+        queries are made, whatever the number of inputs.
+
+        Args:
+            bigchain (BigchainDB): an instantiated
+                :class:`bigchaindb.lib.BigchainDB` object.
+            links (:obj:`list` of :class:`~.TransactionLink`): the outputs
+                to resolve.
+            current_transactions (:class:`~.BlockOverlay`): the
+                transactions accepted so far in the current block.
+
+        Returns:
+            :obj:`list` of :class:`~.UnspentOutput`: the outputs, in the
+            order of ``links``.
+
+        Raises:
+            :exc:`~.InputDoesNotExist`: if an output does not exist.
+            :exc:`~.DoubleSpend`: if an output is already spent.
+        """
+        links = [(link.txid, link.output) for link in links]
+        for txid, output in links:
+            if current_transactions.get_spending_transactions(txid, output):
+                raise DoubleSpend('input `{}` was already spent'
+                                  .format(txid))
+
+        outputs = bigchain.get_unspent_outputs_by_links(links)
+        missing = [link for link in links if link not in outputs]
+        if missing:
+            committed = bigchain.get_transaction_outputs(
+                {txid for txid, _ in missing})
+            spent = bigchain.get_spent_outputs(missing)
+
+            for link in missing:
+                txid, output = link
+                tx_outputs = committed.get(txid)
+                if tx_outputs is None:
+                    input_tx = current_transactions.get_transaction(txid)
+                    if input_tx is None:
+                        raise InputDoesNotExist("input `{}` doesn't exist"
+                                                .format(txid))
+                    tx_outputs = list(input_tx.unspent_outputs)
+
+                if link in spent:
+                    raise DoubleSpend('input `{}` was already spent'
+                                      .format(txid))
+                outputs[link] = tx_outputs[output]
+
+        return [outputs[link] for link in links]
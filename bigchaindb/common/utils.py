@@ -7,7 +7,6 @@ import time
 import re
 import rapidjson
 
-import bigchaindb
 from bigchaindb.common.exceptions import ValidationError
 
 
@@ -56,7 +55,8 @@ def deserialize(data):
     return rapidjson.loads(data)
 
 
-def validate_txn_obj(obj_name, obj, key, validation_fun):
+def validate_txn_obj(obj_name, obj, key, validation_fun,
+                     language_validation_fun=None):
     """Validate value of `key` in `obj` using `validation_fun`.
 
         Args:
@@ -65,32 +65,44 @@ def validate_txn_obj(obj_name, obj, key, validation_fun):
             key (str): key to be validated in `obj`.
             validation_fun (function): function used to validate the value
             of `key`.
+            language_validation_fun (function, optional): function used to
+            validate the values of the (nested) "language" keys, in the
+            same walk.
 
         Returns:
             None: indicates validation successful
 
         Raises:
             ValidationError: `validation_fun` will raise exception on failure
-    """
-    backend = bigchaindb.config['database']['backend']
 
-    if backend == 'localmongodb':
-        data = obj.get(key, {})
-        if isinstance(data, dict):
-            validate_all_keys_in_obj(obj_name, data, validation_fun)
-        elif isinstance(data, list):
-            validate_all_items_in_list(obj_name, data, validation_fun)
+        Note:
+            The restrictions of MongoDB on the keys and the languages are
+            rules of the network: they apply whatever the database backend
+            of the node, so that all the nodes agree on the validity of a
+            transaction.
+    """
+    data = obj.get(key, {})
+    if isinstance(data, dict):
+        validate_all_keys_in_obj(obj_name, data, validation_fun,
+                                 language_validation_fun)
+    elif isinstance(data, list):
+        validate_all_items_in_list(obj_name, data, validation_fun,
+                                   language_validation_fun)
 
 
-def validate_all_items_in_list(obj_name, data, validation_fun):
+def validate_all_items_in_list(obj_name, data, validation_fun,
+                               language_validation_fun=None):
     for item in data:
         if isinstance(item, dict):
-            validate_all_keys_in_obj(obj_name, item, validation_fun)
+            validate_all_keys_in_obj(obj_name, item, validation_fun,
+                                     language_validation_fun)
         elif isinstance(item, list):
-            validate_all_items_in_list(obj_name, item, validation_fun)
+            validate_all_items_in_list(obj_name, item, validation_fun,
+                                       language_validation_fun)
 
 
-def validate_all_keys_in_obj(obj_name, obj, validation_fun):
+def validate_all_keys_in_obj(obj_name, obj, validation_fun,
+                             language_validation_fun=None):
     """Validate all (nested) keys in `obj` by using `validation_fun`.
 
         Args:
@@ -98,6 +110,8 @@ def validate_all_keys_in_obj(obj_name, obj, validation_fun):
             obj (dict): dictionary object.
             validation_fun (function): function used to validate the value
             of `key`.
+            language_validation_fun (function, optional): function used to
+            validate the values of the (nested) "language" keys.
 
         Returns:
             None: indicates validation successful
@@ -107,10 +121,14 @@ def validate_all_keys_in_obj(obj_name, obj, validation_fun):
     """
     for key, value in obj.items():
         validation_fun(obj_name, key)
+        if key == 'language' and language_validation_fun is not None:
+            language_validation_fun(value)
         if isinstance(value, dict):
-            validate_all_keys_in_obj(obj_name, value, validation_fun)
+            validate_all_keys_in_obj(obj_name, value, validation_fun,
+                                     language_validation_fun)
         elif isinstance(value, list):
-            validate_all_items_in_list(obj_name, value, validation_fun)
+            validate_all_items_in_list(obj_name, value, validation_fun,
+                                       language_validation_fun)
 
 
 def validate_all_values_for_key_in_obj(obj, key, validation_fun):
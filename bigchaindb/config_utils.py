@@ -25,7 +25,7 @@ from functools import lru_cache
 
 from pkg_resources import iter_entry_points, ResolutionError
 
-from bigchaindb.common import exceptions
+from bigchaindb.common import cache, exceptions
 
 import bigchaindb
 
@@ -196,6 +196,7 @@ def set_config(config):
     # Update the default config with whatever is in the passed config
     update(bigchaindb.config, update_types(config, bigchaindb.config))
     bigchaindb.config['CONFIGURED'] = True
+    cache.configure(bigchaindb.config.get('cache', {}))
 
 
 def update_config(config):
@@ -210,6 +211,7 @@ def update_config(config):
     # Update the default config with whatever is in the passed config
     update(bigchaindb.config, update_types(config, bigchaindb.config))
     bigchaindb.config['CONFIGURED'] = True
+    cache.configure(bigchaindb.config.get('cache', {}))
 
 
 def write_config(config, filename=None):
@@ -6,19 +6,29 @@
 """This module contains all the goodness to integrate BigchainDB
 with Tendermint.
 """
+import json
 import logging
 import sys
 
+try:
+    from hashlib import sha3_256
+except ImportError:
+    # NOTE: needed for Python < 3.6
+    from sha3 import sha3_256
+
 from abci.application import BaseApplication
 from abci import CodeTypeOk
 
 from bigchaindb import BigchainDB
+from bigchaindb.block_writer import BlockWriter
+from bigchaindb.common import cache
+from bigchaindb.common.cache import LRUCache
 from bigchaindb.elections.election import Election
 from bigchaindb.version import __tm_supported_versions__
 from bigchaindb.utils import tendermint_version_is_compatible
-from bigchaindb.tendermint_utils import (decode_transaction,
-                                         calculate_hash)
+from bigchaindb.tendermint_utils import calculate_hash
 from bigchaindb.lib import Block
+from bigchaindb.overlay import BlockOverlay
 import bigchaindb.upsert_validator.validator_utils as vutils
 from bigchaindb.events import EventTypes, Event
 
@@ -35,15 +45,27 @@ class App(BaseApplication):
     """
 
     def __init__(self, abci, bigchaindb=None, events_queue=None,):
+        # NOTE: `bigchaindb.config` is replaced when the node is configured
+        from bigchaindb import config
+
         super().__init__(abci)
         self.events_queue = events_queue
-        self.bigchaindb = bigchaindb or BigchainDB()
+        # NOTE: the application writes the blocks, the validator sets and
+        #       the ABCI chains, so it can keep them in memory
+        self.bigchaindb = bigchaindb or BigchainDB(cache_chain_state=True)
         self.block_txn_ids = []
         self.block_txn_hash = ''
         self.block_transactions = []
+        self.block_overlay = BlockOverlay()
         self.validators = None
         self.new_height = None
         self.chain = self.bigchaindb.get_latest_abci_chain()
+        # digests of the raw transactions whose schema, id and signatures
+        # were found valid by `check_tx`
+        self.verified_transactions = cache.register(
+            'validation', LRUCache(config['cache']['validation']))
+        self.block_writer = BlockWriter(self.bigchaindb,
+                                        config['commit']['mode'] == 'write_behind')
 
     def log_abci_migration_error(self, chain_id, validators):
         logger.error('An ABCI chain migration is in process. '
@@ -127,19 +149,37 @@ class App(BaseApplication):
             r.last_block_app_hash = b''
         return r
 
-    def check_tx(self, raw_transaction):
+    def query(self, request):
+        """Return the statistics of the caches of the application on the
+        ``/caches`` path, as JSON."""
+
+        if request.path == '/caches':
+            return self.abci.ResponseQuery(code=CodeTypeOk,
+                                           value=json.dumps(cache.stats()).encode('utf8'))
+        return super().query(request)
+
+    def check_tx(self, raw_transaction, verified=False):
         """Validate the transaction before entry into
         the mempool.
 
         Args:
             raw_tx: a raw string (in bytes) transaction.
+            verified (bool): ``True`` if the schema, the id and the
+                signatures of the transaction were already verified, e.g.
+                by a :class:`~bigchaindb.check_tx.CheckTxServer`.
         """
 
         self.abort_if_abci_chain_is_not_synced()
 
         logger.debug('check_tx: %s', raw_transaction)
-        transaction = decode_transaction(raw_transaction)
-        if self.bigchaindb.is_valid_transaction(transaction):
+        digest = sha3_256(raw_transaction).digest()
+        cached = self.verified_transactions.get(digest, False)
+        # NOTE: the transactions of the latest block may not be written yet
+        transaction = self.bigchaindb.is_valid_transaction(
+            raw_transaction, self.block_writer.transactions, verified or cached)
+        if transaction:
+            if not cached:
+                self.verified_transactions.put(digest, True)
             logger.debug('check_tx: VALID')
             return self.abci.ResponseCheckTx(code=CodeTypeOk)
         else:
@@ -161,6 +201,10 @@ class App(BaseApplication):
 
         self.block_txn_ids = []
         self.block_transactions = []
+        self.block_overlay.reset()
+        # NOTE: the transactions of the latest block may not be written yet
+        for transaction in self.block_writer.transactions:
+            self.block_overlay.add(transaction)
         return self.abci.ResponseBeginBlock()
 
     def deliver_tx(self, raw_transaction):
@@ -173,8 +217,12 @@ class App(BaseApplication):
         self.abort_if_abci_chain_is_not_synced()
 
         logger.debug('deliver_tx: %s', raw_transaction)
+        # NOTE: once delivered the transaction leaves the mempool, so it
+        #       won't be checked again
+        verified = self.verified_transactions.pop(
+            sha3_256(raw_transaction).digest(), False)
         transaction = self.bigchaindb.is_valid_transaction(
-            decode_transaction(raw_transaction), self.block_transactions)
+            raw_transaction, self.block_overlay, verified)
 
         if not transaction:
             logger.debug('deliver_tx: INVALID')
@@ -183,6 +231,7 @@ class App(BaseApplication):
             logger.debug('storing tx')
             self.block_txn_ids.append(transaction.id)
             self.block_transactions.append(transaction)
+            self.block_overlay.add(transaction)
             return self.abci.ResponseDeliverTx(code=CodeTypeOk)
 
     def end_block(self, request_end_block):
@@ -200,6 +249,10 @@ class App(BaseApplication):
         height = request_end_block.height + chain_shift
         self.new_height = height
 
+        # NOTE: the pre-commit state must not get more than one block ahead
+        #       of the stored blocks, and the elections read the database
+        self.block_writer.wait()
+
         # store pre-commit state to recover in case there is a crash during
         # `end_block` or `commit`
         logger.debug(f'Updating pre-commit state: {self.new_height}')
@@ -228,30 +281,31 @@ class App(BaseApplication):
 
         data = self.block_txn_hash.encode('utf-8')
 
-        # register a new block only when new transactions are received
-        if self.block_txn_ids:
-            self.bigchaindb.store_bulk_transactions(self.block_transactions)
-
         block = Block(app_hash=self.block_txn_hash,
                       height=self.new_height,
                       transactions=self.block_txn_ids)
-        # NOTE: storing the block should be the last operation during commit
-        # this effects crash recovery. Refer BEP#8 for details
-        self.bigchaindb.store_block(block._asdict())
+        self.block_writer.write(block._asdict(), self.block_transactions,
+                                self._block_written(self.new_height, self.block_transactions))
 
         logger.debug('Commit-ing new block with hash: apphash=%s ,'
                      'height=%s, txn ids=%s', data, self.new_height,
                      self.block_txn_ids)
-
-        if self.events_queue:
-            event = Event(EventTypes.BLOCK_VALID, {
-                'height': self.new_height,
-                'transactions': self.block_transactions
-            })
-            self.events_queue.put(event)
+        logger.debug('Caches: %s', cache.stats())
 
         return self.abci.ResponseCommit(data=data)
 
+    def _block_written(self, height, transactions):
+        """Return the callback of the :class:`~.BlockWriter` publishing the
+        block once it is written, so that the subscribers can read it."""
+        def publish():
+            if self.events_queue:
+                event = Event(EventTypes.BLOCK_VALID, {
+                    'height': height,
+                    'transactions': transactions
+                })
+                self.events_queue.put(event)
+        return publish
+
 
 def rollback(b):
     pre_commit = b.get_pre_commit_state()
@@ -268,4 +322,6 @@ def rollback(b):
     # NOTE: the pre-commit state is always at most 1 block ahead of the commited state
     if latest_block['height'] < pre_commit['height']:
         Election.rollback(b, pre_commit['height'], pre_commit['transactions'])
+        # NOTE: the UTXO set is left as is, Tendermint replays the same
+        # block and `update_utxoset` can be applied twice
         b.delete_transactions(pre_commit['transactions'])
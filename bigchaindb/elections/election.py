@@ -3,8 +3,10 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 from collections import OrderedDict
+from functools import lru_cache
 
 import base58
+import rapidjson
 from uuid import uuid4
 
 from bigchaindb import backend
@@ -17,11 +19,19 @@ from bigchaindb.common.exceptions import (InvalidSignature,
 from bigchaindb.tendermint_utils import key_from_base64, public_key_to_base64
 from bigchaindb.common.crypto import (public_key_from_ed25519_key)
 from bigchaindb.common.transaction import Transaction
+from bigchaindb.overlay import BlockOverlay
 from bigchaindb.common.schema import (_validate_schema,
                                       TX_SCHEMA_COMMON,
                                       TX_SCHEMA_CREATE)
 
 
+@lru_cache(maxsize=1024)
+def validator_public_key(public_key):
+    """Convert the base64 public key of a validator to base58."""
+    # NOTE: we assume that Tendermint encodes public key in base64
+    return public_key_from_ed25519_key(key_from_base64(public_key))
+
+
 class Election(Transaction):
     """Represents election transactions.
 
@@ -61,8 +71,7 @@ class Election(Transaction):
         """
         validators = {}
         for validator in bigchain.get_validators(height):
-            # NOTE: we assume that Tendermint encodes public key in base64
-            public_key = public_key_from_ed25519_key(key_from_base64(validator['public_key']['value']))
+            public_key = validator_public_key(validator['public_key']['value'])
             validators[public_key] = validator['voting_power']
 
         return validators
@@ -103,7 +112,7 @@ class Election(Transaction):
 
         Args:
             :param bigchain: (BigchainDB) an instantiated bigchaindb.lib.BigchainDB object.
-            :param current_transactions: (list) A list of transactions to be validated along with the election
+            :param current_transactions: (list|BlockOverlay) The transactions to be validated along with the election
 
         Returns:
             Election: a Election object or an object of the derived Election subclass.
@@ -113,7 +122,7 @@ class Election(Transaction):
         """
         input_conditions = []
 
-        duplicates = any(txn for txn in current_transactions if txn.id == self.id)
+        duplicates = self.id in BlockOverlay.wrap(current_transactions)
         if bigchain.is_committed(self.id) or duplicates:
             raise DuplicateTransaction('transaction `{}` already exists'
                                        .format(self.id))
@@ -150,14 +159,16 @@ class Election(Transaction):
         return election
 
     @classmethod
-    def validate_schema(cls, tx):
+    def validate_schema(cls, tx, serialized=None):
         """Validate the election transaction. Since `ELECTION` extends `CREATE` transaction, all the validations for
         `CREATE` transaction should be inherited
         """
-        _validate_schema(TX_SCHEMA_COMMON, tx)
-        _validate_schema(TX_SCHEMA_CREATE, tx)
+        if serialized is None:
+            serialized = rapidjson.dumps(tx)
+        _validate_schema(TX_SCHEMA_COMMON, tx, serialized)
+        _validate_schema(TX_SCHEMA_CREATE, tx, serialized)
         if cls.TX_SCHEMA_CUSTOM:
-            _validate_schema(cls.TX_SCHEMA_CUSTOM, tx)
+            _validate_schema(cls.TX_SCHEMA_CUSTOM, tx, serialized)
 
     @classmethod
     def create(cls, tx_signers, recipients, metadata=None, asset=None):
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
+import rapidjson
+
 from bigchaindb.common.transaction import Transaction
 from bigchaindb.common.schema import (_validate_schema,
                                       TX_SCHEMA_COMMON,
@@ -47,13 +49,15 @@ class Vote(Transaction):
         return election_vote
 
     @classmethod
-    def validate_schema(cls, tx):
+    def validate_schema(cls, tx, serialized=None):
         """Validate the validator election vote transaction. Since `VOTE` extends `TRANSFER`
            transaction, all the validations for `CREATE` transaction should be inherited
         """
-        _validate_schema(TX_SCHEMA_COMMON, tx)
-        _validate_schema(TX_SCHEMA_TRANSFER, tx)
-        _validate_schema(cls.TX_SCHEMA_CUSTOM, tx)
+        if serialized is None:
+            serialized = rapidjson.dumps(tx)
+        _validate_schema(TX_SCHEMA_COMMON, tx, serialized)
+        _validate_schema(TX_SCHEMA_TRANSFER, tx, serialized)
+        _validate_schema(cls.TX_SCHEMA_CUSTOM, tx, serialized)
 
     @classmethod
     def create(cls, tx_signers, recipients, metadata=None, asset=None):
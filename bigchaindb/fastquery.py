@@ -3,11 +3,42 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
-from bigchaindb.utils import condition_details_has_owner
+from bigchaindb.utils import condition_details_owners
 from bigchaindb.backend import query
 from bigchaindb.common.transaction import TransactionLink
 
 
+def owner_outputs(transaction, spent=()):
+    """Return the ``owner_outputs`` records of the outputs of a transaction.
+
+    An output is owned by the public keys of its condition details which
+    are listed in the ``public_keys`` of the outputs of the transaction.
+
+    Args:
+        transaction (dict): the transaction, or its projection returned by
+            :func:`~bigchaindb.backend.query.get_inputs_and_outputs`.
+        spent: the ``(transaction_id, output_index)`` pairs of the outputs
+            already spent.
+
+    Returns:
+        :obj:`list` of :obj:`dict`: the records, one per owner of each
+        output.
+    """
+    # NOTE: the asset of a `CREATE` transaction is its own
+    asset_id = transaction.get('asset', {}).get('id', transaction['id'])
+    public_keys = {public_key
+                   for output in transaction['outputs']
+                   for public_key in output['public_keys']}
+    return [{'public_key': public_key,
+             'transaction_id': transaction['id'],
+             'output_index': output_index,
+             'amount': int(output['amount']),
+             'asset_id': asset_id,
+             'spent': (transaction['id'], output_index) in spent}
+            for output_index, output in enumerate(transaction['outputs'])
+            for public_key in sorted(condition_details_owners(output['condition']['details']) & public_keys)]
+
+
 class FastQuery():
     """Database queries that join on block results from a single node."""
 
@@ -16,12 +47,20 @@ class FastQuery():
 
     def get_outputs_by_public_key(self, public_key):
         """Get outputs for a public key"""
-        txs = list(query.get_owned_ids(self.connection, public_key))
-        return [TransactionLink(tx['id'], index)
-                for tx in txs
-                for index, output in enumerate(tx['outputs'])
-                if condition_details_has_owner(output['condition']['details'],
-                                               public_key)]
+        return [TransactionLink(output['transaction_id'], output['output_index'])
+                for output in self.get_owner_outputs([public_key])]
+
+    def get_owner_outputs(self, public_keys, spent=None):
+        """Get the ``owner_outputs`` records of the outputs owned by some
+        public keys, in a single query.
+
+        Args:
+            public_keys (list): base58 encoded public keys.
+            spent (bool): If ``True`` return only the spent outputs, if
+                ``False`` only the unspent ones, and all of them if
+                ``None``.
+        """
+        return list(query.get_owner_outputs(self.connection, public_keys, spent))
 
     def filter_spent_outputs(self, outputs):
         """Remove outputs that have been spent
@@ -29,11 +68,7 @@ class FastQuery():
         Args:
             outputs: list of TransactionLink
         """
-        links = [o.to_dict() for o in outputs]
-        txs = list(query.get_spending_transactions(self.connection, links))
-        spends = {TransactionLink.from_dict(input_['fulfills'])
-                  for tx in txs
-                  for input_ in tx['inputs']}
+        spends = self._get_spent_outputs(outputs)
         return [ff for ff in outputs if ff not in spends]
 
     def filter_unspent_outputs(self, outputs):
@@ -42,9 +77,11 @@ class FastQuery():
         Args:
             outputs: list of TransactionLink
         """
-        links = [o.to_dict() for o in outputs]
-        txs = list(query.get_spending_transactions(self.connection, links))
-        spends = {TransactionLink.from_dict(input_['fulfills'])
-                  for tx in txs
-                  for input_ in tx['inputs']}
+        spends = self._get_spent_outputs(outputs)
         return [ff for ff in outputs if ff in spends]
+
+    def _get_spent_outputs(self, outputs):
+        links = [(o.txid, o.output) for o in outputs]
+        return {TransactionLink(spent_output['transaction_id'],
+                                spent_output['output_index'])
+                for spent_output in query.get_spent_outputs(self.connection, links)}
@@ -7,30 +7,35 @@
 MongoDB.
 
 """
+import base64
+import copy
 import logging
 from collections import namedtuple
+from itertools import islice
 from uuid import uuid4
 
 import rapidjson
-
-try:
-    from hashlib import sha3_256
-except ImportError:
-    # NOTE: needed for Python < 3.6
-    from sha3 import sha3_256
-
 import requests
 
 import bigchaindb
 from bigchaindb import backend, config_utils, fastquery
+from bigchaindb.backend.exceptions import DuplicateKeyError
+from bigchaindb.backend.schema import SCHEMA_VERSION
+from bigchaindb.bloom import CommittedTransactions
+from bigchaindb.chain_state import MISSING, ChainState
+from bigchaindb.common.cache import deep_sizeof_entry, get_cache
+from bigchaindb.common.signatures import SignatureBatch
+from bigchaindb.merkle import SparseMerkleTree, utxo_hash
 from bigchaindb.models import Transaction
+from bigchaindb.overlay import BlockOverlay
 from bigchaindb.common.exceptions import (SchemaValidationError,
                                           ValidationError,
                                           DoubleSpend)
+from bigchaindb.common.transaction import TransactionLink, UnspentOutput
 from bigchaindb.common.transaction_mode_types import (BROADCAST_TX_COMMIT,
                                                       BROADCAST_TX_ASYNC,
                                                       BROADCAST_TX_SYNC)
-from bigchaindb.tendermint_utils import encode_transaction, merkleroot
+from bigchaindb.tendermint_utils import encode_transaction
 from bigchaindb import exceptions as core_exceptions
 from bigchaindb.validation import BaseValidationRules
 
@@ -44,7 +49,10 @@ class BigchainDB(object):
     Create, read, sign, write transactions to the database
     """
 
-    def __init__(self, connection=None):
+    # number of transactions read together by `get_transactions_filtered`
+    HYDRATION_BATCH_SIZE = 1000
+
+    def __init__(self, connection=None, cache_chain_state=False):
         """Initialize the Bigchain instance
 
         A Bigchain instance has several configuration parameters (e.g. host).
@@ -59,6 +67,13 @@ class BigchainDB(object):
         Args:
             connection (:class:`~bigchaindb.backend.connection.Connection`):
                 A connection to the database.
+            cache_chain_state (bool): keep the latest block, the validator
+                sets and the latest ABCI chain in memory (see
+                :class:`~bigchaindb.chain_state.ChainState`), and a filter
+                of the ids of the committed transactions (see
+                :class:`~bigchaindb.bloom.CommittedTransactions`). Only the
+                process writing them, i.e. the ABCI application, may cache
+                them, as other processes would not see the updates.
         """
         config_utils.autoconfigure()
         self.mode_commit = BROADCAST_TX_COMMIT
@@ -77,6 +92,10 @@ class BigchainDB(object):
             self.validation = BaseValidationRules
 
         self.connection = connection if connection else backend.connect(**bigchaindb.config['database'])
+        self.utxo_tree = SparseMerkleTree(self.connection)
+        self.chain_state = ChainState() if cache_chain_state else None
+        self.committed_transactions = CommittedTransactions(
+            self.connection, **bigchaindb.config['committed_filter']) if cache_chain_state else None
 
     def post_transaction(self, transaction, mode):
         """Submit a valid transaction to the mempool."""
@@ -84,16 +103,28 @@ class BigchainDB(object):
             raise ValidationError('Mode must be one of the following {}.'
                                   .format(', '.join(self.mode_list)))
 
-        tx_dict = transaction.tx_dict if transaction.tx_dict else transaction.to_dict()
         payload = {
             'method': mode,
             'jsonrpc': '2.0',
-            'params': [encode_transaction(tx_dict)],
+            'params': [encode_transaction(transaction.serialized)],
             'id': str(uuid4())
         }
         # TODO: handle connection errors!
         return requests.post(self.endpoint, json=payload)
 
+    def get_abci_cache_stats(self):
+        """Return the statistics of the caches of the ABCI application,
+        queried through Tendermint."""
+        payload = {
+            'method': 'abci_query',
+            'jsonrpc': '2.0',
+            'params': {'path': '/caches', 'data': ''},
+            'id': str(uuid4())
+        }
+        response = requests.post(self.endpoint, json=payload, timeout=5)
+        value = response.json()['result']['response'].get('value')
+        return rapidjson.loads(base64.b64decode(value)) if value else {}
+
     def write_transaction(self, transaction, mode):
         # This method offers backward compatibility with the Web API.
         """Submit a valid transaction to the mempool."""
@@ -127,48 +158,265 @@ class BigchainDB(object):
 
         return (202, '')
 
-    def store_bulk_transactions(self, transactions):
+    def store_bulk_transactions(self, transactions, height=None):
+        """Store the transactions of a block.
+
+        The outputs the transactions spend are recorded in the
+        ``spent_outputs`` table first, whose unique index rejects any
+        output spent twice: nothing is stored then. The ``asset_history`` and ``owner_outputs``
+        tables, listing the transactions of every asset and the outputs of
+        every public key, are updated last.
+
+        Args:
+            transactions (:obj:`list` of :obj:`~bigchaindb.models.Transaction`):
+                the transactions, in the order of their block.
+            height (int): the height of their block. Defaults to the height
+                following the latest block.
+
+        Raises:
+            :exc:`~bigchaindb.exceptions.CriticalDoubleSpend`: if one of
+                the outputs is already spent by another transaction.
+
+        The documents stored are also put in the ``documents`` cache (see
+        :meth:`_read_documents`).
+        """
+        if height is None:
+            latest_block = self.get_latest_block()
+            height = latest_block['height'] + 1 if latest_block else 0
+
+        spent_outputs = [dict(spent_output, spent_by=t.id, height=height)
+                         for t in transactions
+                         for spent_output in t.spent_outputs]
+        try:
+            backend.query.store_spent_outputs(self.connection, spent_outputs)
+        except DuplicateKeyError as exc:
+            raise core_exceptions.CriticalDoubleSpend(
+                'An output was spent more than once. There is a problem'
+                ' with the chain') from exc
+
         txns = []
         assets = []
         txn_metadatas = []
-        for t in transactions:
+        owner_outputs = []
+        asset_history = []
+        documents = []
+        for position, t in enumerate(transactions):
             transaction = t.tx_dict if t.tx_dict else rapidjson.loads(rapidjson.dumps(t.to_dict()))
+            documents.append(('transactions', transaction))
+            # NOTE: the full transaction is cached, hence only a shallow copy
+            #       is split into the documents stored
+            transaction = dict(transaction)
+            owner_outputs.extend(fastquery.owner_outputs(transaction))
+            asset_history.append({
+                'asset_id': transaction['asset'].get('id', transaction['id']),
+                'height': height,
+                'position': position,
+                'transaction_id': transaction['id'],
+                'operation': transaction['operation'],
+            })
             if transaction['operation'] == t.CREATE:
-                asset = transaction.pop('asset')
-                asset['id'] = transaction['id']
+                asset = dict(transaction.pop('asset'), id=transaction['id'])
                 assets.append(asset)
+                documents.append(('assets', dict(asset)))
 
             metadata = transaction.pop('metadata')
             txn_metadatas.append({'id': transaction['id'],
                                   'metadata': metadata})
+            documents.append(('metadata', dict(txn_metadatas[-1])))
             txns.append(transaction)
 
         backend.query.store_metadatas(self.connection, txn_metadatas)
         if assets:
             backend.query.store_assets(self.connection, assets)
-        return backend.query.store_transactions(self.connection, txns)
+        result = backend.query.store_transactions(self.connection, txns)
+        backend.query.store_asset_history(self.connection, asset_history)
+        backend.query.store_owner_outputs(self.connection, owner_outputs,
+                                          spent_outputs)
+
+        cache = get_cache('documents', deep_sizeof_entry)
+        for table, document in documents:
+            cache.put((table, document['id']), document)
+        if self.committed_transactions:
+            self.committed_transactions.add(t.id for t in transactions)
+        return result
 
     def delete_transactions(self, txs):
+        """Delete the transactions ``txs``, with their asset and metadata,
+        when their block is rolled back."""
+        cache = get_cache('documents', deep_sizeof_entry)
+        for txid in txs:
+            for table in ('transactions', 'assets', 'metadata'):
+                cache.discard((table, txid))
+        if self.committed_transactions:
+            # NOTE: the ids can't be removed from the filter, it is rebuilt
+            self.committed_transactions.reset()
         return backend.query.delete_transactions(self.connection, txs)
 
-    def update_utxoset(self, transaction):
-        """Update the UTXO set given ``transaction``. That is, remove
-        the outputs that the given ``transaction`` spends, and add the
-        outputs that the given ``transaction`` creates.
+    def update_utxoset(self, *transactions):
+        """Update the UTXO set given ``transactions``. That is, remove
+        the outputs that the given ``transactions`` spend, and add the
+        outputs that the given ``transactions`` create.
+
+        The changes are applied in a single bulk write. Outputs created and
+        spent by the given ``transactions`` never reach the database.
+
+        Args:
+            *transactions (:obj:`~bigchaindb.models.Transaction`): New
+                transactions incoming into the system for which the UTXO
+                set needs to be updated, in the order they were accepted.
+        """
+        spent_outputs = {}
+        unspent_outputs = {}
+        for transaction in transactions:
+            for spent_output in transaction.spent_outputs:
+                key = (spent_output['transaction_id'],
+                       spent_output['output_index'])
+                if unspent_outputs.pop(key, None) is None:
+                    spent_outputs[key] = spent_output
+            for utxo in transaction.unspent_outputs:
+                key = (utxo.transaction_id, utxo.output_index)
+                unspent_outputs[key] = utxo._asdict()
+
+        backend.query.update_unspent_outputs(self.connection,
+                                             list(spent_outputs.values()),
+                                             list(unspent_outputs.values()))
+        self.utxo_tree.update(
+            [utxo_hash(*key) for key in unspent_outputs],
+            [utxo_hash(*key) for key in spent_outputs])
+
+    def rebuild_utxoset(self, batch_size=1000):
+        """Rebuild the UTXO set from the stored transactions.
+
+        The set, and its Merkle tree, are computed in two passes over the
+        ``transactions`` collection, the first one collecting the spent
+        outputs, which are written to the ``spent_outputs`` table again.
+        The height of the spending transactions isn't known there, and is
+        left empty. The ``owner_outputs`` table is rebuilt in the second
+        pass, and the ``asset_history`` table from the stored blocks. It
+        must not run while the node is committing blocks.
+
+        The version of the tables is cleared first, and stored once they
+        are rebuilt, so that an interrupted rebuild is run again by
+        :meth:`migrate`.
 
         Args:
-            transaction (:obj:`~bigchaindb.models.Transaction`): A new
-                transaction incoming into the system for which the UTXO
-                set needs to be updated.
+            batch_size (int): the number of outputs written at once.
+
+        Returns:
+            int: the number of unspent outputs.
         """
-        spent_outputs = [
-            spent_output for spent_output in transaction.spent_outputs
-        ]
-        if spent_outputs:
-            self.delete_unspent_outputs(*spent_outputs)
-        self.store_unspent_outputs(
-            *[utxo._asdict() for utxo in transaction.unspent_outputs]
-        )
+        spent = {
+            (input_['fulfills']['transaction_id'],
+             input_['fulfills']['output_index']): transaction['id']
+            for transaction in backend.query.get_inputs_and_outputs(self.connection)
+            for input_ in transaction['inputs'] if input_['fulfills']
+        }
+
+        backend.query.store_schema_version(self.connection, None)
+        backend.query.delete_all_spent_outputs(self.connection)
+        spent_outputs = iter(spent.items())
+        while True:
+            batch = [{'transaction_id': transaction_id,
+                      'output_index': output_index,
+                      'spent_by': spent_by,
+                      'height': None}
+                     for (transaction_id, output_index), spent_by
+                     in islice(spent_outputs, batch_size)]
+            if not batch:
+                break
+            backend.query.store_spent_outputs(self.connection, batch)
+
+        backend.query.delete_all_unspent_outputs(self.connection)
+        backend.query.delete_all_owner_outputs(self.connection)
+        self.utxo_tree.clear()
+
+        count = 0
+        batch = []
+        owner_outputs = []
+        for transaction in backend.query.get_inputs_and_outputs(self.connection):
+            owner_outputs.extend(fastquery.owner_outputs(transaction, spent))
+            if len(owner_outputs) >= batch_size:
+                backend.query.store_owner_outputs(self.connection, owner_outputs, [])
+                owner_outputs = []
+            # NOTE: the asset of a `CREATE` transaction is stored in the
+            #       `assets` collection, hence only transactions spending an
+            #       asset keep its id
+            asset_id = transaction.get('asset', {}).get('id', transaction['id'])
+            for output_index, output in enumerate(transaction['outputs']):
+                if (transaction['id'], output_index) in spent:
+                    continue
+                batch.append(UnspentOutput(
+                    transaction_id=transaction['id'],
+                    output_index=output_index,
+                    amount=int(output['amount']),
+                    asset_id=asset_id,
+                    condition_uri=output['condition']['uri'],
+                )._asdict())
+            if len(batch) >= batch_size:
+                self._store_rebuilt_unspent_outputs(batch)
+                count += len(batch)
+                batch = []
+
+        backend.query.store_owner_outputs(self.connection, owner_outputs, [])
+        self._store_rebuilt_unspent_outputs(batch)
+        self._rebuild_asset_history(batch_size)
+        backend.query.store_schema_version(self.connection, SCHEMA_VERSION)
+        return count + len(batch)
+
+    def migrate(self):
+        """Rebuild the tables derived from the stored transactions if
+        their version is older than
+        :data:`~bigchaindb.backend.schema.SCHEMA_VERSION`.
+
+        The node must not start before: the tables of a database written
+        by an older release of BigchainDB miss the transactions stored
+        then, the outputs they spend would look unspent, and the outputs
+        and the transactions of the assets would not be listed.
+
+        Returns:
+            bool: whether the tables were rebuilt.
+        """
+        version = backend.query.get_schema_version(self.connection)
+        if version is not None and version >= SCHEMA_VERSION:
+            return False
+
+        if next(iter(backend.query.get_transaction_ids(self.connection)), None) is None:
+            # a new database, the tables are maintained from its first block
+            backend.query.store_schema_version(self.connection, SCHEMA_VERSION)
+            return False
+
+        logger.info('Rebuilding the UTXO set and the indexes of the stored transactions')
+        count = self.rebuild_utxoset()
+        logger.info('Rebuilt the UTXO set with %s unspent outputs', count)
+        return True
+
+    def _rebuild_asset_history(self, batch_size):
+        backend.query.delete_all_asset_history(self.connection)
+        positions = backend.query.get_block_transaction_ids(self.connection)
+        while True:
+            batch = list(islice(positions, batch_size))
+            if not batch:
+                break
+            transactions = backend.query.get_transaction_outputs(
+                self.connection, [position['transaction_id'] for position in batch])
+            transactions = {transaction['id']: transaction for transaction in transactions}
+
+            asset_history = []
+            for position in batch:
+                transaction = transactions.get(position['transaction_id'])
+                if transaction:
+                    asset_history.append(dict(
+                        position,
+                        asset_id=transaction.get('asset', {}).get('id', transaction['id']),
+                        operation=transaction['operation']))
+            backend.query.store_asset_history(self.connection, asset_history)
+
+    def _store_rebuilt_unspent_outputs(self, unspent_outputs):
+        backend.query.update_unspent_outputs(self.connection, [], unspent_outputs)
+        self.utxo_tree.update([
+            utxo_hash(utxo['transaction_id'], utxo['output_index'])
+            for utxo in unspent_outputs
+        ])
 
     def store_unspent_outputs(self, *unspent_outputs):
         """Store the given ``unspent_outputs`` (utxos).
@@ -178,42 +426,117 @@ class BigchainDB(object):
                 length tuple or list of unspent outputs.
         """
         if unspent_outputs:
-            return backend.query.store_unspent_outputs(
+            result = backend.query.store_unspent_outputs(
                                             self.connection, *unspent_outputs)
+            self.utxo_tree.update([
+                utxo_hash(utxo['transaction_id'], utxo['output_index'])
+                for utxo in unspent_outputs
+            ])
+            return result
 
-    def get_utxoset_merkle_root(self):
-        """Returns the merkle root of the utxoset. This implies that
-        the utxoset is first put into a merkle tree.
+    def get_unspent_output(self, transaction_id, output_index):
+        """Get an output from the UTXO set.
 
-        For now, the merkle tree and its root will be computed each
-        time. This obviously is not efficient and a better approach
-        that limits the repetition of the same computation when
-        unnecesary should be sought. For instance, future optimizations
-        could simply re-compute the branches of the tree that were
-        affected by a change.
+        Returns:
+            :class:`~bigchaindb.common.transaction.UnspentOutput` or
+            ``None`` if the output is not in the UTXO set.
+        """
+        utxo = backend.query.get_unspent_output(self.connection,
+                                                transaction_id, output_index)
+        if utxo:
+            return UnspentOutput._make(utxo[field]
+                                       for field in UnspentOutput._fields)
 
-        The transaction hash (id) and output index should be sufficient
-        to uniquely identify a utxo, and consequently only that
-        information from a utxo record is needed to compute the merkle
-        root. Hence, each node of the merkle tree should contain the
-        tuple (txid, output_index).
+    def get_unspent_outputs_by_links(self, links):
+        """Get outputs from the UTXO set.
 
-        .. important:: The leaves of the tree will need to be sorted in
-            some kind of lexicographical order.
+        Args:
+            links (:obj:`list` of :obj:`tuple`): the
+                ``(transaction_id, output_index)`` pairs of the outputs.
+
+        Returns:
+            dict: the :class:`~bigchaindb.common.transaction.UnspentOutput`
+            found in the UTXO set, by ``(transaction_id, output_index)``.
+        """
+        utxos = backend.query.get_unspent_outputs_by_links(self.connection,
+                                                           list(links))
+        return {
+            (utxo['transaction_id'], utxo['output_index']):
+            UnspentOutput._make(utxo[field] for field in UnspentOutput._fields)
+            for utxo in utxos
+        }
+
+    def get_transaction_outputs(self, transaction_ids):
+        """Get the outputs of committed transactions, without reading their
+        asset data and metadata.
+
+        Args:
+            transaction_ids (:obj:`set` of :obj:`str`): the transaction ids.
+
+        Returns:
+            dict: the list of
+            :class:`~bigchaindb.common.transaction.UnspentOutput` of each
+            transaction found, by transaction id.
+        """
+        cache = get_cache('documents', deep_sizeof_entry)
+        transactions = []
+        missing = []
+        for txid in transaction_ids:
+            # NOTE: the outputs read from the database are not cached, hence
+            #       a transaction not in the cache is not counted as a miss
+            key = ('transactions', txid)
+            transaction = cache.get(key) if key in cache else None
+            if transaction is None:
+                missing.append(txid)
+            else:
+                transactions.append(transaction)
+        if missing:
+            transactions.extend(backend.query.get_transaction_outputs(self.connection, missing))
+
+        outputs = {}
+        for transaction in transactions:
+            # NOTE: the asset of a `CREATE` transaction is stored in the
+            #       `assets` collection, hence only transactions spending an
+            #       asset keep its id
+            asset_id = transaction.get('asset', {}).get('id', transaction['id'])
+            outputs[transaction['id']] = [
+                UnspentOutput(
+                    transaction_id=transaction['id'],
+                    output_index=output_index,
+                    amount=int(output['amount']),
+                    asset_id=asset_id,
+                    condition_uri=output['condition']['uri'],
+                )
+                for output_index, output in enumerate(transaction['outputs'])
+            ]
+        return outputs
+
+    def get_spent_outputs(self, links):
+        """Find which outputs are spent by committed transactions.
+
+        Args:
+            links (:obj:`list` of :obj:`tuple`): the
+                ``(transaction_id, output_index)`` pairs of the outputs.
+
+        Returns:
+            :obj:`set` of :obj:`tuple`: the pairs of the outputs spent.
+        """
+        return {(spent_output['transaction_id'], spent_output['output_index'])
+                for spent_output in backend.query.get_spent_outputs(self.connection,
+                                                                    list(links))}
+
+    def get_utxoset_merkle_root(self):
+        """Returns the merkle root of the utxoset.
+
+        The root is read from the sparse Merkle tree maintained along with
+        the utxoset, whose leaves are the hashes of the
+        ``(transaction_id, output_index)`` pairs of the unspent outputs.
+        See :class:`~bigchaindb.merkle.SparseMerkleTree`.
 
         Returns:
             str: Merkle root in hexadecimal form.
         """
-        utxoset = backend.query.get_unspent_outputs(self.connection)
-        # TODO Once ready, use the already pre-computed utxo_hash field.
-        # See common/transactions.py for details.
-        hashes = [
-            sha3_256(
-                '{}{}'.format(utxo['transaction_id'], utxo['output_index']).encode()
-            ).digest() for utxo in utxoset
-        ]
-        # TODO Notice the sorted call!
-        return merkleroot(sorted(hashes))
+        return self.utxo_tree.root
 
     def get_unspent_outputs(self):
         """Get the utxoset.
@@ -232,49 +555,95 @@ class BigchainDB(object):
                 length tuple or list of unspent outputs.
         """
         if unspent_outputs:
-            return backend.query.delete_unspent_outputs(
+            result = backend.query.delete_unspent_outputs(
                                         self.connection, *unspent_outputs)
+            self.utxo_tree.update(deleted=[
+                utxo_hash(utxo['transaction_id'], utxo['output_index'])
+                for utxo in unspent_outputs
+            ])
+            return result
 
     def is_committed(self, transaction_id):
+        # NOTE: most new transactions are not duplicates, the filter of the
+        #       committed transactions spares their lookup
+        if self.committed_transactions and transaction_id not in self.committed_transactions:
+            return False
         transaction = backend.query.get_transaction(self.connection, transaction_id)
         return bool(transaction)
 
     def get_transaction(self, transaction_id):
-        transaction = backend.query.get_transaction(self.connection, transaction_id)
-
-        if transaction:
-            asset = backend.query.get_asset(self.connection, transaction_id)
-            metadata = backend.query.get_metadata(self.connection, [transaction_id])
-            if asset:
-                transaction['asset'] = asset
-
-            if 'metadata' not in transaction:
-                metadata = metadata[0] if metadata else None
-                if metadata:
-                    metadata = metadata.get('metadata')
+        transactions = self.get_full_transactions([transaction_id])
+        return transactions[0] if transactions else None
 
-                transaction.update({'metadata': metadata})
+    def get_full_transactions(self, txn_ids):
+        """Return the transactions with the given ids, with their asset and
+        metadata, in the order of ``txn_ids``.
 
-            transaction = Transaction.from_dict(transaction)
+        Args:
+            txn_ids (:obj:`list` of :obj:`str`): the ids of the transactions.
 
-        return transaction
+        Returns:
+            :obj:`list` of :class:`~bigchaindb.models.Transaction`: the
+            transactions found.
+        """
+        transactions = self._read_documents(
+            'transactions', txn_ids,
+            lambda txn_ids: backend.query.get_full_transactions(self.connection, txn_ids))
+        # NOTE: a committed transaction is known to be valid
+        return [Transaction.from_dict(transaction, True)
+                for transaction in transactions]
 
     def get_transactions(self, txn_ids):
         return backend.query.get_transactions(self.connection, txn_ids)
 
     def get_transactions_filtered(self, asset_id, operation=None, last_tx=None):
         """Get a list of transactions filtered on some criteria
+
+        The transactions are listed in the order they were committed.
         """
         txids = backend.query.get_txids_filtered(self.connection, asset_id,
                                                  operation, last_tx)
-        for txid in txids:
-            yield self.get_transaction(txid)
+        while True:
+            batch = list(islice(txids, self.HYDRATION_BATCH_SIZE))
+            if not batch:
+                break
+            yield from self.get_full_transactions(batch)
+
+    def get_transactions_page(self, asset_id, operation=None, after=None,
+                              limit=100):
+        """Get a page of the transactions of an asset, in the order they
+        were committed.
+
+        Args:
+            asset_id (str): the id of the asset.
+            operation (str): the operation to filter on, if any.
+            after (tuple): the position of the last transaction of the
+                previous page, ``None`` for the first page.
+            limit (int): the maximum number of transactions of the page.
+
+        Returns:
+            tuple: the :obj:`list` of
+            :class:`~bigchaindb.models.Transaction` of the page, and the
+            position of its last transaction, as a ``(height, position,
+            transaction_id)`` tuple to pass as ``after`` to get the next
+            page. The position is ``None`` for the last page.
+        """
+        records = list(backend.query.get_asset_history(
+            self.connection, asset_id, operation, after, limit + 1))
+        next_after = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_after = (last['height'], last['position'], last['transaction_id'])
+        transactions = self.get_full_transactions(
+            [record['transaction_id'] for record in records])
+        return transactions, next_after
 
     def get_outputs_filtered(self, owner, spent=None):
         """Get a list of output links filtered on some criteria
 
         Args:
-            owner (str): base58 encoded public_key.
+            owner (str): base58 encoded public_key, or a list of them.
             spent (bool): If ``True`` return only the spent outputs. If
                           ``False`` return only unspent outputs. If spent is
                           not specified (``None``) return all outputs.
@@ -283,13 +652,28 @@ class BigchainDB(object):
             :obj:`list` of TransactionLink: list of ``txid`` s and ``output`` s
             pointing to another transaction's condition
         """
-        outputs = self.fastquery.get_outputs_by_public_key(owner)
-        if spent is None:
-            return outputs
-        elif spent is True:
-            return self.fastquery.filter_unspent_outputs(outputs)
-        elif spent is False:
-            return self.fastquery.filter_spent_outputs(outputs)
+        public_keys = [owner] if isinstance(owner, str) else owner
+        # NOTE: an output owned by several of the public keys is listed once
+        return list(dict.fromkeys(
+            TransactionLink(output['transaction_id'], output['output_index'])
+            for output in self.fastquery.get_owner_outputs(public_keys, spent)))
+
+    def get_owner_outputs(self, public_keys, spent=None):
+        """Get the outputs owned by some public keys, with their amount,
+        asset id and whether they are spent.
+
+        Args:
+            public_keys (list): base58 encoded public keys.
+            spent (bool): If ``True`` return only the spent outputs, if
+                ``False`` only the unspent ones, and all of them if
+                ``None``.
+
+        Returns:
+            :obj:`list` of :obj:`dict`: the outputs, once per owner, with
+            ``public_key``, ``transaction_id``, ``output_index``,
+            ``amount``, ``asset_id`` and ``spent``.
+        """
+        return self.fastquery.get_owner_outputs(public_keys, spent)
 
     def get_spent(self, txid, output, current_transactions=[]):
         transactions = backend.query.get_spent(self.connection, txid,
@@ -300,13 +684,8 @@ class BigchainDB(object):
                 '`{}` was spent more than once. There is a problem'
                 ' with the chain'.format(txid))
 
-        current_spent_transactions = []
-        for ctxn in current_transactions:
-            for ctxn_input in ctxn.inputs:
-                if ctxn_input.fulfills and\
-                   ctxn_input.fulfills.txid == txid and\
-                   ctxn_input.fulfills.output == output:
-                    current_spent_transactions.append(ctxn)
+        current_spent_transactions = BlockOverlay.wrap(current_transactions)\
+            .get_spending_transactions(txid, output)
 
         transaction = None
         if len(transactions) + len(current_spent_transactions) > 1:
@@ -321,12 +700,38 @@ class BigchainDB(object):
     def store_block(self, block):
         """Create a new block."""
 
-        return backend.query.store_block(self.connection, block)
+        result = backend.query.store_block(self.connection, block)
+        if self.chain_state:
+            self.chain_state.store_block(block)
+        if self.committed_transactions:
+            self.committed_transactions.store_block(block)
+        return result
+
+    def cache_block(self, block, transactions):
+        """Update the state kept in memory with a committed block, before
+        it is written to the database by a
+        :class:`~bigchaindb.block_writer.BlockWriter`.
+
+        Args:
+            block (dict): the block.
+            transactions (:obj:`list` of :obj:`~bigchaindb.models.Transaction`):
+                the transactions of the block.
+        """
+        if self.chain_state:
+            self.chain_state.store_block(block)
+        if self.committed_transactions:
+            self.committed_transactions.add(t.id for t in transactions)
+            self.committed_transactions.store_block(block)
 
     def get_latest_block(self):
         """Get the block with largest height."""
 
-        return backend.query.get_latest_block(self.connection)
+        if not self.chain_state:
+            return backend.query.get_latest_block(self.connection)
+
+        if self.chain_state.latest_block is MISSING:
+            self.chain_state.latest_block = backend.query.get_latest_block(self.connection)
+        return copy.deepcopy(self.chain_state.latest_block)
 
     def get_block(self, block_id):
         """Get the block with the specified `block_id`.
@@ -349,8 +754,8 @@ class BigchainDB(object):
                   'transactions': []}
 
         if block:
-            transactions = backend.query.get_transactions(self.connection, block['transactions'])
-            result['transactions'] = [t.to_dict() for t in Transaction.from_db(self, transactions)]
+            transactions = self.get_full_transactions(block['transactions'])
+            result['transactions'] = [t.to_dict() for t in transactions]
 
         return result
 
@@ -370,30 +775,52 @@ class BigchainDB(object):
 
         return [block['height'] for block in blocks]
 
-    def validate_transaction(self, tx, current_transactions=[]):
-        """Validate a transaction against the current status of the database."""
+    def validate_transaction(self, tx, current_transactions=[], verified=False):
+        """Validate a transaction against the current status of the database.
+
+        Args:
+            tx (bytes|dict|Transaction): the transaction to validate, or
+                its JSON serialization, e.g. the raw bytes of an ABCI
+                request.
+            current_transactions (:obj:`list` | :class:`~.BlockOverlay`):
+                the transactions already accepted in the current block.
+            verified (bool): ``True`` if the schema, the id and the
+                signatures of ``tx`` are already known to be valid. Only the
+                checks depending on the state of the chain are run then.
+        """
 
         transaction = tx
 
         # CLEANUP: The conditional below checks for transaction in dict format.
         # It would be better to only have a single format for the transaction
         # throught the code base.
-        if isinstance(transaction, dict):
+        if isinstance(transaction, (bytes, dict)):
             try:
-                transaction = Transaction.from_dict(tx)
+                if isinstance(transaction, bytes):
+                    transaction = Transaction.from_json(tx, verified)
+                else:
+                    transaction = Transaction.from_dict(tx, verified)
             except SchemaValidationError as e:
                 logger.warning('Invalid transaction schema: %s', e.__cause__.message)
                 return False
             except ValidationError as e:
                 logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
                 return False
-        return transaction.validate(self, current_transactions)
-
-    def is_valid_transaction(self, tx, current_transactions=[]):
+        if verified:
+            transaction.signatures_verified = True
+        elif not transaction.signatures_verified:
+            # NOTE: the signatures of all the Inputs are verified together,
+            #       the invalid ones are found by `transaction.validate`
+            batch = SignatureBatch()
+            batch.add(transaction)
+            batch.verify()
+        return transaction.validate(self, BlockOverlay.wrap(current_transactions))
+
+    def is_valid_transaction(self, tx, current_transactions=[], verified=False):
         # NOTE: the function returns the Transaction object in case
         # the transaction is valid
         try:
-            return self.validate_transaction(tx, current_transactions)
+            return self.validate_transaction(tx, current_transactions, verified)
         except ValidationError as e:
             logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
             return False
@@ -421,7 +848,9 @@ class BigchainDB(object):
         Returns:
             list: The list of assets returned from the database.
         """
-        return backend.query.get_assets(self.connection, asset_ids)
+        return self._read_documents(
+            'assets', asset_ids,
+            lambda asset_ids: backend.query.get_assets(self.connection, asset_ids))
 
     def get_metadata(self, txn_ids):
         """Return a list of metadata that match the transaction ids (txn_ids)
@@ -433,14 +862,59 @@ class BigchainDB(object):
         Returns:
             list: The list of metadata returned from the database.
         """
-        return backend.query.get_metadata(self.connection, txn_ids)
+        return self._read_documents(
+            'metadata', txn_ids,
+            lambda txn_ids: backend.query.get_metadata(self.connection, txn_ids))
+
+    def _read_documents(self, table, ids, read):
+        """Return the committed documents of ``table`` with the given ids,
+        in the order of ``ids``.
+
+        The documents are read from the ``documents`` cache of the process,
+        and the missing ones with ``read``, which are then cached. As the
+        committed documents never change, they are only removed from the
+        cache when their block is rolled back, or when the cache is full.
+        The cached documents are shared: they must not be modified.
+
+        Args:
+            table (str): ``transactions``, ``assets`` or ``metadata``.
+            ids (:obj:`list` of :obj:`str`): the ids of the documents.
+            read (callable): a function returning the documents with the
+                given ids from the database.
+        """
+        cache = get_cache('documents', deep_sizeof_entry)
+        documents = {}
+        missing = []
+        for id_ in ids:
+            document = cache.get((table, id_))
+            if document is None:
+                missing.append(id_)
+            else:
+                documents[id_] = document
+        if missing:
+            for document in read(missing):
+                documents[document['id']] = document
+                cache.put((table, document['id']), document)
+        return [documents[id_] for id_ in ids if id_ in documents]
 
     @property
     def fastquery(self):
         return fastquery.FastQuery(self.connection)
 
     def get_validator_change(self, height=None):
-        return backend.query.get_validator_set(self.connection, height)
+        if not self.chain_state:
+            return backend.query.get_validator_set(self.connection, height)
+
+        if self.chain_state.validator_sets is MISSING:
+            latest = backend.query.get_validator_set(self.connection)
+            self.chain_state.validator_sets = [latest] if latest else []
+
+        validator_set = self.chain_state.get_validator_set(height)
+        if validator_set is MISSING:
+            # NOTE: only the validator sets following the latest one loaded
+            # from the database are cached
+            return backend.query.get_validator_set(self.connection, height)
+        return copy.deepcopy(validator_set)
 
     def get_validators(self, height=None):
         result = self.get_validator_change(height)
@@ -460,21 +934,40 @@ class BigchainDB(object):
            NOTE: If the validator set already exists at that `height` then an
            exception will be raised.
         """
-        return backend.query.store_validator_set(self.connection, {'height': height,
-                                                                   'validators': validators})
+        validator_set = {'height': height, 'validators': validators}
+        result = backend.query.store_validator_set(self.connection, validator_set)
+        if self.chain_state:
+            self.chain_state.store_validator_set(validator_set)
+        return result
 
     def delete_validator_set(self, height):
-        return backend.query.delete_validator_set(self.connection, height)
+        result = backend.query.delete_validator_set(self.connection, height)
+        if self.chain_state:
+            self.chain_state.delete_validator_set(height)
+        return result
 
     def store_abci_chain(self, height, chain_id, is_synced=True):
-        return backend.query.store_abci_chain(self.connection, height,
-                                              chain_id, is_synced)
+        result = backend.query.store_abci_chain(self.connection, height,
+                                                chain_id, is_synced)
+        if self.chain_state:
+            self.chain_state.store_abci_chain({'height': height,
+                                               'chain_id': chain_id,
+                                               'is_synced': is_synced})
+        return result
 
     def delete_abci_chain(self, height):
-        return backend.query.delete_abci_chain(self.connection, height)
+        result = backend.query.delete_abci_chain(self.connection, height)
+        if self.chain_state:
+            self.chain_state.delete_abci_chain(height)
+        return result
 
     def get_latest_abci_chain(self):
-        return backend.query.get_latest_abci_chain(self.connection)
+        if not self.chain_state:
+            return backend.query.get_latest_abci_chain(self.connection)
+
+        if self.chain_state.abci_chain is MISSING:
+            self.chain_state.abci_chain = backend.query.get_latest_abci_chain(self.connection)
+        return copy.deepcopy(self.chain_state.abci_chain)
 
     def migrate_abci_chain(self):
         """Generate and record a new ABCI chain ID. New blocks are not
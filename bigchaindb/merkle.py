@@ -0,0 +1,226 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Persistent sparse Merkle tree over the UTXO set."""
+
+from binascii import hexlify
+
+try:
+    from hashlib import sha3_256
+except ImportError:
+    from sha3 import sha3_256
+
+from bigchaindb import backend
+
+
+# hash of an empty subtree
+EMPTY = bytes(32)
+
+
+def utxo_hash(transaction_id, output_index):
+    """Return the key of an unspent output in the tree."""
+    return sha3_256('{}{}'.format(transaction_id, output_index).encode()).digest()
+
+
+def leaf_hash(key):
+    return sha3_256(b'\x00' + key).digest()
+
+
+def node_hash(left, right):
+    return sha3_256(b'\x01' + left + right).digest()
+
+
+def _bits(key):
+    return format(int.from_bytes(key, 'big'), '0{}b'.format(len(key) * 8))
+
+
+def verify_proof(root, key, siblings):
+    """Check that ``key`` is in the tree with the given ``root``.
+
+    Args:
+        root (str): the root of the tree in hexadecimal form.
+        key (bytes): the key of the leaf.
+        siblings (:obj:`list` of :obj:`bytes`): the proof returned by
+            :meth:`SparseMerkleTree.get_proof`.
+
+    Returns:
+        bool: ``True`` if the proof is valid.
+    """
+    bits = _bits(key)
+    node = leaf_hash(key)
+    for depth in reversed(range(len(siblings))):
+        if bits[depth] == '0':
+            node = node_hash(node, siblings[depth])
+        else:
+            node = node_hash(siblings[depth], node)
+    return hexlify(node).decode() == root
+
+
+class SparseMerkleTree:
+    """A sparse Merkle tree keyed by :func:`utxo_hash`, stored in the
+    ``utxo_tree`` table.
+
+    Each node is stored under its ``path``, the string of bits leading to
+    it from the root. A subtree holding a single key is collapsed into a
+    leaf, so the depth of the tree is about ``log2(n)`` and updating ``k``
+    keys reads and writes ``O(k log n)`` nodes. The nodes are loaded one
+    level at a time, and all the changes are written at once. The root is
+    stored under the empty path.
+
+    Inserting a key twice, or deleting a missing key, leaves the tree
+    unchanged: the root only depends on the keys in the tree.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @property
+    def root(self):
+        """str: the root of the tree in hexadecimal form."""
+        nodes = backend.query.get_utxo_tree_nodes(self.connection, [''])
+        for node in nodes:
+            return hexlify(node['hash']).decode()
+        # NOTE: kept from the root of the previous, non persistent, tree
+        return sha3_256(b'').hexdigest()
+
+    def update(self, inserted=(), deleted=()):
+        """Insert and delete keys.
+
+        Args:
+            inserted (:obj:`iterable` of :obj:`bytes`): the keys to insert.
+            deleted (:obj:`iterable` of :obj:`bytes`): the keys to delete.
+                A key both inserted and deleted is deleted.
+        """
+        changes = {_bits(key): key for key in inserted}
+        changes.update((_bits(key), None) for key in deleted)
+        if not changes:
+            return
+
+        self._nodes = self._load(changes)
+        self._written = {}
+        self._deleted = []
+        self._place('', self._update('', sorted(changes.items())))
+
+        backend.query.update_utxo_tree_nodes(self.connection,
+                                             list(self._written.values()),
+                                             self._deleted)
+
+    def clear(self):
+        """Delete all the keys."""
+        backend.query.delete_utxo_tree(self.connection)
+
+    def get_proof(self, key):
+        """Return the hashes of the siblings along the path of ``key``.
+
+        Returns:
+            :obj:`list` of :obj:`bytes`: the proof, from the root down to
+            the leaf, or ``None`` if ``key`` is not in the tree.
+        """
+        bits = _bits(key)
+        siblings = []
+        path = ''
+        node = self._get_nodes([path]).get(path)
+        while node and 'key' not in node:
+            children = self._get_nodes([path + '0', path + '1'])
+            sibling = children.get(path + ('1' if bits[len(path)] == '0' else '0'))
+            siblings.append(sibling['hash'] if sibling else EMPTY)
+            path = bits[:len(path) + 1]
+            node = children.get(path)
+
+        if node and node['key'] == key:
+            return siblings
+
+    def _get_nodes(self, paths):
+        nodes = backend.query.get_utxo_tree_nodes(self.connection, paths)
+        return {node['path']: node for node in nodes}
+
+    def _load(self, changes):
+        """Load the nodes along the paths of the changed keys, together with
+        their siblings, one level at a time."""
+        nodes = {}
+        frontier = {'': list(changes)}
+        while frontier:
+            loaded = self._get_nodes(list(frontier))
+            nodes.update(loaded)
+            next_frontier = {}
+            for path, bits in frontier.items():
+                node = loaded.get(path)
+                if not bits or not node or 'key' in node:
+                    continue
+                depth = len(path)
+                next_frontier[path + '0'] = [b for b in bits if b[depth] == '0']
+                next_frontier[path + '1'] = [b for b in bits if b[depth] == '1']
+            frontier = next_frontier
+        return nodes
+
+    def _update(self, path, changes):
+        """Apply ``changes`` to the subtree at ``path``.
+
+        Returns the new root node of the subtree, without storing it: the
+        caller decides where it goes, as a leaf can move up.
+        """
+        node = self._nodes.get(path)
+        if node is None or 'key' in node:
+            keys = {_bits(node['key']): node['key']} if node else {}
+            for bits, key in changes:
+                if key is None:
+                    keys.pop(bits, None)
+                else:
+                    keys[bits] = key
+            return self._build(path, sorted(keys.items()))
+
+        depth = len(path)
+        children = []
+        for bit in '01':
+            child_path = path + bit
+            child_changes = [change for change in changes
+                             if change[0][depth] == bit]
+            if child_changes:
+                children.append((child_path,
+                                 self._update(child_path, child_changes), True))
+            else:
+                children.append((child_path, self._nodes.get(child_path), False))
+
+        (_, left, _), (_, right, _) = children
+        if left is None or right is None:
+            only = left or right
+            if only is None or 'key' in only:
+                # the subtree is empty or holds a single key
+                for child_path, _, _ in children:
+                    self._place(child_path, None)
+                return only
+
+        for child_path, child, changed in children:
+            if changed:
+                self._place(child_path, child)
+        return {'hash': node_hash(self._hash(left), self._hash(right))}
+
+    def _build(self, path, keys):
+        """Build the subtree at ``path`` holding the given sorted keys."""
+        if not keys:
+            return None
+        if len(keys) == 1:
+            bits, key = keys[0]
+            return {'hash': leaf_hash(key), 'key': key}
+
+        depth = len(path)
+        split = next((i for i, (bits, _) in enumerate(keys)
+                      if bits[depth] == '1'), len(keys))
+        left = self._build(path + '0', keys[:split])
+        right = self._build(path + '1', keys[split:])
+        self._place(path + '0', left)
+        self._place(path + '1', right)
+        return {'hash': node_hash(self._hash(left), self._hash(right))}
+
+    def _place(self, path, node):
+        if node is not None:
+            node = dict(node, path=path)
+            self._written[path] = node
+        elif path in self._nodes:
+            self._deleted.append(path)
+
+    @staticmethod
+    def _hash(node):
+        return node['hash'] if node else EMPTY
@@ -3,12 +3,13 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
-from bigchaindb.backend.schema import validate_language_key
+from bigchaindb.backend.schema import validate_language
 from bigchaindb.common.exceptions import (InvalidSignature,
                                           DuplicateTransaction)
 from bigchaindb.common.schema import validate_transaction_schema
 from bigchaindb.common.transaction import Transaction
 from bigchaindb.common.utils import (validate_txn_obj, validate_key)
+from bigchaindb.overlay import BlockOverlay
 
 
 class Transaction(Transaction):
@@ -20,6 +21,8 @@ class Transaction(Transaction):
         """Validate transaction spend
         Args:
             bigchain (BigchainDB): an instantiated bigchaindb.BigchainDB object.
+            current_transactions (:obj:`list` | :class:`~.BlockOverlay`):
+                the transactions already accepted in the current block.
         Returns:
             The transaction (Transaction) if the transaction is valid else it
             raises an exception describing the reason why the transaction is
@@ -28,9 +31,10 @@ class Transaction(Transaction):
             ValidationError: If the transaction is invalid
         """
         input_conditions = []
+        current_transactions = BlockOverlay.wrap(current_transactions)
 
         if self.operation == Transaction.CREATE:
-            duplicates = any(txn for txn in current_transactions if txn.id == self.id)
+            duplicates = self.id in current_transactions
             if bigchain.is_committed(self.id) or duplicates:
                 raise DuplicateTransaction('transaction `{}` already exists'
                                            .format(self.id))
@@ -44,16 +48,22 @@ class Transaction(Transaction):
         return self
 
     @classmethod
-    def from_dict(cls, tx_body):
-        return super().from_dict(tx_body, False)
+    def from_dict(cls, tx_body, skip_schema_validation=False, serialized=None):
+        return super().from_dict(tx_body, skip_schema_validation, serialized)
 
     @classmethod
-    def validate_schema(cls, tx_body):
-        validate_transaction_schema(tx_body)
-        validate_txn_obj(cls.ASSET, tx_body[cls.ASSET], cls.DATA, validate_key)
-        validate_txn_obj(cls.METADATA, tx_body, cls.METADATA, validate_key)
-        validate_language_key(tx_body[cls.ASSET], cls.DATA)
-        validate_language_key(tx_body, cls.METADATA)
+    def from_json(cls, raw, skip_schema_validation=False):
+        return super().from_json(raw, skip_schema_validation)
+
+    @classmethod
+    def validate_schema(cls, tx_body, serialized=None):
+        validate_transaction_schema(tx_body, serialized)
+        # NOTE: the names of the keys and the languages are checked in a
+        #       single walk of the asset data and of the metadata
+        validate_txn_obj(cls.ASSET, tx_body[cls.ASSET], cls.DATA, validate_key,
+                         validate_language)
+        validate_txn_obj(cls.METADATA, tx_body, cls.METADATA, validate_key,
+                         validate_language)
 
 
 class FastTransaction:
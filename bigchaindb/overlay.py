@@ -0,0 +1,82 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""In-memory view of the transactions accepted in the block being built."""
+
+from collections import defaultdict
+
+
+class BlockOverlay:
+    """Hash indexes over the transactions already accepted in a block.
+
+    While a block is being delivered, every new transaction has to be
+    validated against the transactions that precede it in the same block:
+    its id must not be a duplicate, its inputs may point to outputs created
+    earlier in the block, and those outputs must not have been spent yet.
+    The overlay answers these questions with constant time lookups instead
+    of scanning the list of block transactions, and it is reset at the
+    beginning of every block.
+
+    The overlay can be passed wherever a ``current_transactions`` list is
+    accepted. Plain lists are still supported and are wrapped on the fly
+    by :meth:`wrap`.
+    """
+
+    def __init__(self, transactions=None):
+        self.reset()
+        for transaction in transactions or []:
+            self.add(transaction)
+
+    @classmethod
+    def wrap(cls, transactions):
+        """Return ``transactions`` as a :class:`BlockOverlay`.
+
+        Args:
+            transactions (:obj:`list` | :class:`BlockOverlay`): the
+                transactions accepted so far.
+        """
+        if isinstance(transactions, cls):
+            return transactions
+        return cls(transactions)
+
+    def reset(self):
+        # maps a transaction id to the transaction
+        self.transactions = {}
+        # maps a `(transaction_id, output_index)` pair to the list of
+        # transactions spending it
+        self.spent = defaultdict(list)
+        # maps a `(transaction_id, output_index)` pair to the created output
+        self.outputs = {}
+
+    def add(self, transaction):
+        """Index a transaction that has been accepted in the block."""
+        self.transactions[transaction.id] = transaction
+        for input_ in transaction.inputs:
+            if input_.fulfills:
+                link = (input_.fulfills.txid, input_.fulfills.output)
+                self.spent[link].append(transaction)
+        for index, output in enumerate(transaction.outputs):
+            self.outputs[(transaction.id, index)] = output
+
+    def __contains__(self, transaction_id):
+        return transaction_id in self.transactions
+
+    def __len__(self):
+        return len(self.transactions)
+
+    def __iter__(self):
+        return iter(self.transactions.values())
+
+    def get_transaction(self, transaction_id):
+        """Return the transaction with the given id, if it is in the block."""
+        return self.transactions.get(transaction_id)
+
+    def get_output(self, transaction_id, output_index):
+        """Return the output created in the block at the given position."""
+        return self.outputs.get((transaction_id, output_index))
+
+    def get_spending_transactions(self, transaction_id, output_index):
+        """Return the transactions of the block spending the given output."""
+        return self.spent.get((transaction_id, output_index), [])
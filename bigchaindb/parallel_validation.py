@@ -3,22 +3,35 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
+import ctypes
+import logging
 import multiprocessing as mp
-from collections import defaultdict
+import struct
 
 from bigchaindb import App, BigchainDB
+from bigchaindb.common import exceptions
+from bigchaindb.common.signatures import SignatureBatch
+from bigchaindb.models import Transaction
+from bigchaindb.overlay import BlockOverlay
 from bigchaindb.tendermint_utils import decode_transaction
 from abci import CodeTypeOk
 
 
+logger = logging.getLogger(__name__)
+
+
 class ParallelValidationApp(App):
     def __init__(self, bigchaindb=None, events_queue=None, abci=None):
-        super().__init__(bigchaindb, events_queue, abci=abci)
+        super().__init__(abci, bigchaindb, events_queue)
         self.parallel_validator = ParallelValidator()
         self.parallel_validator.start()
 
-    def check_tx(self, raw_transaction):
-        return self.abci.ResponseCheckTx(code=CodeTypeOk)
+    def begin_block(self, req_begin_block):
+        # NOTE: the workers only see the committed transactions in the
+        #       database, so the latest block must be written before they
+        #       validate the next one
+        self.block_writer.wait()
+        return super().begin_block(req_begin_block)
 
     def deliver_tx(self, raw_transaction):
         self.parallel_validator.validate(raw_transaction)
@@ -34,49 +47,265 @@ class ParallelValidationApp(App):
         return super().end_block(request_end_block)
 
 
-RESET = 'reset'
-EXIT = 'exit'
+# control messages for the workers, sent in place of a sequence number
+RESET = -1
+EXIT = -2
+
+# size of the ring buffer carrying the raw transactions to each worker, it
+# must hold the largest transaction accepted by Tendermint
+RING_BUFFER_SIZE = 8 * 1024 * 1024
+# number of results kept in shared memory before they are read
+RESULTS_SIZE = 64 * 1024
+# maximum number of transactions validated together by a worker
+BATCH_SIZE = 256
+
+# error codes returned by the workers, an invalid transaction is reported
+# with the code of its exception, or of `ValidationError`
+VALID = 0
+VALIDATION_ERRORS = (
+    exceptions.ValidationError,
+    exceptions.DoubleSpend,
+    exceptions.InvalidHash,
+    exceptions.SchemaValidationError,
+    exceptions.InvalidSignature,
+    exceptions.AssetIdMismatch,
+    exceptions.AmountError,
+    exceptions.InputDoesNotExist,
+    exceptions.TransactionOwnerError,
+    exceptions.DuplicateTransaction,
+    exceptions.ThresholdTooDeep,
+    exceptions.MultipleValidatorOperationError,
+    exceptions.MultipleInputsError,
+    exceptions.InvalidProposer,
+    exceptions.UnequalValidatorSet,
+    exceptions.InvalidPowerChange,
+    exceptions.InvalidPublicKey,
+)
+
+
+def error_code(error_class):
+    """Return the code of a validation error."""
+    try:
+        return VALIDATION_ERRORS.index(error_class) + 1
+    except ValueError:
+        return VALIDATION_ERRORS.index(exceptions.ValidationError) + 1
+
+
+class RingBuffer:
+    """Queue of byte strings in shared memory, with a single producer and a
+    single consumer.
+
+    Every message is an integer, either a sequence number or a control
+    message, followed by a payload. Messages are copied in and out of the
+    buffer, nothing is pickled. A message must fit in the buffer, the
+    producer waits for the consumer to make room for it.
+    """
+
+    HEADER = struct.Struct('<qI')
+
+    def __init__(self, size=RING_BUFFER_SIZE):
+        self.size = size
+        self.buffer = mp.RawArray(ctypes.c_char, size)
+        # total number of bytes written to and read from the buffer
+        self.written = mp.RawValue(ctypes.c_uint64, 0)
+        self.read = mp.RawValue(ctypes.c_uint64, 0)
+        self.messages = mp.Semaphore(0)
+        self.room = mp.Condition()
+
+    def put(self, number, payload=b''):
+        message = self.HEADER.pack(number, len(payload)) + payload
+        if len(message) > self.size:
+            raise ValueError('Message of {} bytes does not fit in a ring '
+                             'buffer of {} bytes'.format(len(message), self.size))
+
+        if self.size - (self.written.value - self.read.value) < len(message):
+            with self.room:
+                while self.size - (self.written.value - self.read.value) < len(message):
+                    self.room.wait()
+
+        self._copy_in(self.written.value, message)
+        self.written.value += len(message)
+        self.messages.release()
+
+    def get(self, block=True):
+        """Return the next ``(number, payload)`` message, waiting for it if
+        ``block`` is ``True``, or ``None`` if there is none."""
+        if not self.messages.acquire(block):
+            return None
+        start = self.read.value
+        number, length = self.HEADER.unpack(self._copy_out(start, self.HEADER.size))
+        payload = self._copy_out(start + self.HEADER.size, length)
+        with self.room:
+            self.read.value = start + self.HEADER.size + length
+            self.room.notify()
+        return number, payload
+
+    def _copy_in(self, position, data):
+        start = position % self.size
+        split = min(len(data), self.size - start)
+        self.buffer[start:start + split] = data[:split]
+        self.buffer[:len(data) - split] = data[split:]
+
+    def _copy_out(self, position, length):
+        start = position % self.size
+        split = min(length, self.size - start)
+        return self.buffer[start:start + split] + self.buffer[:length - split]
+
+
+class ResultArray:
+    """Error codes of validated transactions, in shared memory.
+
+    The code of the transaction with sequence number ``n`` goes in the slot
+    ``n % size``, packed with ``n`` in a single integer so that it is never
+    read half written. The reader has to read a slot before it is reused.
+    """
+
+    def __init__(self, size=RESULTS_SIZE):
+        self.size = size
+        self.slots = mp.RawArray(ctypes.c_int64, [-1] * size)
+        self.written = mp.Semaphore(0)
+
+    def put(self, sequence, code):
+        self.slots[sequence % self.size] = sequence << 8 | code
+        self.written.release()
+
+    def get(self, sequence, timeout=None):
+        """Return the code of the transaction ``sequence``, waiting for it."""
+        slot = sequence % self.size
+        while self.slots[slot] >> 8 != sequence:
+            if not self.written.acquire(timeout=timeout):
+                raise TimeoutError('No validation result for {} seconds'.format(timeout))
+        return self.slots[slot] & 0xff
+
+    def drain(self):
+        """Forget the notifications of the results already read."""
+        while self.written.acquire(block=False):
+            pass
 
 
 class ParallelValidator:
-    def __init__(self, number_of_workers=mp.cpu_count()):
+    """Validate the transactions of a block on a pool of worker processes.
+
+    A transaction can only be validated by a worker which has seen the
+    transactions it depends on, i.e. the earlier transactions of the same
+    block creating the outputs it spends, spending the same outputs, or
+    having the same id. A valid transaction only spends outputs of its own
+    asset, so all these transactions share its asset id: transactions are
+    routed by asset, and every asset is assigned to one worker for the
+    whole block. Each worker validates its transactions in the order they
+    are delivered, so the result of a block is the same as if all its
+    transactions were validated one after the other.
+
+    Assets are assigned to the least loaded worker when they first appear
+    in a block. A transaction of an asset not seen yet, whose inputs point
+    at outputs created in the block, follows the transactions creating
+    them: it can't be valid, as it spends outputs of another asset, but
+    it is rejected for the same reason it would be by a single worker.
+
+    The raw transactions go to the workers through shared memory ring
+    buffers, and the workers only send back an error code per transaction.
+    The valid transactions are then rebuilt from the transactions decoded
+    for routing, so no transaction is ever pickled.
+    """
+
+    def __init__(self, number_of_workers=mp.cpu_count(),
+                 ring_buffer_size=RING_BUFFER_SIZE, results_size=RESULTS_SIZE):
         self.number_of_workers = number_of_workers
-        self.transaction_index = 0
-        self.routing_queues = [mp.Queue() for _ in range(self.number_of_workers)]
+        self.routing_buffers = [RingBuffer(ring_buffer_size)
+                                for _ in range(self.number_of_workers)]
         self.workers = []
-        self.results_queue = mp.Queue()
+        self.results = ResultArray(results_size)
+        # sequence number of the next transaction, it is not reset between
+        # blocks, so that a result of a past block is never taken for one
+        # of the current block
+        self.sequence = 0
+        self.reset()
 
     def start(self):
-        for routing_queue in self.routing_queues:
-            worker = ValidationWorker(routing_queue, self.results_queue)
+        for routing_buffer in self.routing_buffers:
+            worker = ValidationWorker(routing_buffer, self.results)
             process = mp.Process(target=worker.run)
             process.start()
             self.workers.append(process)
 
     def stop(self):
-        for routing_queue in self.routing_queues:
-            routing_queue.put(EXIT)
+        for routing_buffer in self.routing_buffers:
+            routing_buffer.put(EXIT)
+
+    def reset(self):
+        # sequence number of the first transaction of the current block
+        self.block_start = self.sequence
+        # the decoded transactions of the current block and their error
+        # codes, once read
+        self.transactions = []
+        self.codes = []
+        # maps the asset ids and the transaction ids seen in the current
+        # block to the index of the worker they were routed to
+        self.routes = {}
+        # number of transactions routed to each worker in the current block
+        self.loads = [0] * self.number_of_workers
+
+    def route(self, dict_transaction):
+        """Return the index of the worker validating ``dict_transaction``."""
+        transaction_id = dict_transaction.get('id')
+        asset = dict_transaction.get('asset') or {}
+        asset_id = asset.get('id', transaction_id)
+
+        if asset_id in self.routes:
+            index = self.routes[asset_id]
+        else:
+            dependencies = {self.routes[input_['fulfills']['transaction_id']]
+                            for input_ in dict_transaction.get('inputs') or []
+                            if (input_.get('fulfills') or {}).get('transaction_id') in self.routes}
+            if len(dependencies) == 1:
+                index = dependencies.pop()
+            else:
+                index = self.loads.index(min(self.loads))
+
+        self.routes[asset_id] = self.routes[transaction_id] = index
+        self.loads[index] += 1
+        return index
 
     def validate(self, raw_transaction):
         dict_transaction = decode_transaction(raw_transaction)
-        index = int(dict_transaction['id'], 16) % self.number_of_workers
-        self.routing_queues[index].put((self.transaction_index, dict_transaction))
-        self.transaction_index += 1
+        index = self.route(dict_transaction)
+
+        # the slot of this result may still hold a result of the block
+        reused = len(self.transactions) - self.results.size
+        if reused >= 0 and self.codes[reused] is None:
+            self.codes[reused] = self.results.get(self.block_start + reused)
+
+        self.transactions.append(dict_transaction)
+        self.codes.append(None)
+        self.routing_buffers[index].put(self.sequence, raw_transaction)
+        self.sequence += 1
 
     def result(self, timeout=None):
-        result_buffer = [None] * self.transaction_index
-        for _ in range(self.transaction_index):
-            index, transaction = self.results_queue.get(timeout=timeout)
-            result_buffer[index] = transaction
-        self.transaction_index = 0
-        for routing_queue in self.routing_queues:
-            routing_queue.put(RESET)
+        """Wait for the workers and return the transactions of the block, in
+        order, each one replaced by ``False`` if invalid."""
+        result_buffer = []
+        for position, dict_transaction in enumerate(self.transactions):
+            code = self.codes[position]
+            if code is None:
+                code = self.results.get(self.block_start + position, timeout)
+            if code == VALID:
+                result_buffer.append(Transaction.from_dict(dict_transaction, True))
+            else:
+                logger.debug('Transaction %s rejected (%s)', dict_transaction.get('id'),
+                             VALIDATION_ERRORS[code - 1].__name__)
+                result_buffer.append(False)
+
+        self.results.drain()
+        self.reset()
+        for routing_buffer in self.routing_buffers:
+            routing_buffer.put(RESET)
         return result_buffer
 
 
 class ValidationWorker:
     """Run validation logic in a loop. This Worker is suitable for a Process
-    life: no thrills, just a queue to get some values, and a queue to return results.
+    life: no thrills, just a ring buffer to get some raw transactions, and an
+    array to return their error codes.
 
     Note that a worker is expected to validate multiple transactions in
     multiple rounds, and it needs to keep in memory all transactions already
@@ -85,40 +314,73 @@ class ValidationWorker:
     worker is in, it expects an `EXIT` message.
     """
 
-    def __init__(self, in_queue, results_queue):
-        self.in_queue = in_queue
-        self.results_queue = results_queue
+    def __init__(self, in_buffer, results):
+        self.in_buffer = in_buffer
+        self.results = results
         self.bigchaindb = BigchainDB()
         self.reset()
 
     def reset(self):
         # We need a place to store already validated transactions,
         # in case of dependant transactions in the same block.
-        # `validated_transactions` maps an `asset_id` with the list
-        # of all other transactions sharing the same asset.
-        self.validated_transactions = defaultdict(list)
+        # `validated_transactions` indexes them by id and by the
+        # outputs they create and spend.
+        self.validated_transactions = BlockOverlay()
 
-    def validate(self, dict_transaction):
+    def validate(self, transaction):
+        """Validate a transaction and return its error code."""
         try:
-            asset_id = dict_transaction['asset']['id']
-        except KeyError:
-            asset_id = dict_transaction['id']
+            transaction = self.bigchaindb.validate_transaction(
+                    transaction,
+                    self.validated_transactions)
+        except exceptions.ValidationError as e:
+            logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
+            return error_code(type(e))
+
+        if not transaction:
+            return error_code(exceptions.ValidationError)
+        self.validated_transactions.add(transaction)
+        return VALID
+
+    def validate_batch(self, messages):
+        """Validate, in order, transactions received together, verifying
+        their signatures in a single batch."""
+        transactions = []
+        batch = SignatureBatch()
+        for sequence, raw_transaction in messages:
+            try:
+                transaction = Transaction.from_json(raw_transaction, False)
+            except exceptions.ValidationError as e:
+                logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
+                self.results.put(sequence, error_code(type(e)))
+            else:
+                transactions.append((sequence, transaction))
+                batch.add(transaction)
 
-        transaction = self.bigchaindb.is_valid_transaction(
-                dict_transaction,
-                self.validated_transactions[asset_id])
+        batch.verify()
+        for sequence, transaction in transactions:
+            self.results.put(sequence, self.validate(transaction))
 
-        if transaction:
-            self.validated_transactions[asset_id].append(transaction)
-        return transaction
+    def receive(self):
+        """Wait for a message, and return it together with the messages
+        already waiting after it, up to a control message."""
+        messages = [self.in_buffer.get()]
+        while messages[-1][0] >= 0 and len(messages) < BATCH_SIZE:
+            message = self.in_buffer.get(block=False)
+            if message is None:
+                break
+            messages.append(message)
+        return messages
 
     def run(self):
         while True:
-            message = self.in_queue.get()
-            if message == RESET:
+            messages = self.receive()
+            sequence, _ = messages[-1]
+            if sequence < 0:
+                messages.pop()
+            self.validate_batch(messages)
+
+            if sequence == RESET:
                 self.reset()
-            elif message == EXIT:
+            elif sequence == EXIT:
                 return
-            else:
-                index, transaction = message
-                self.results_queue.put((index, self.validate(transaction)))
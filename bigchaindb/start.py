@@ -64,25 +64,34 @@ def start(args):
     # because import ABCIServer will monkeypatch all sockets
     # for gevent.
     from abci.server import ABCIServer
+    from bigchaindb.check_tx import CheckTxServer
 
     setproctitle.setproctitle('bigchaindb')
 
+    if bigchaindb.config['commit']['mode'] == 'write_behind':
+        logger.warning('The committed blocks are written behind the consensus: a block lost in a '
+                       'crash is replayed by Tendermint on restart')
+
     # Start the ABCIServer
     abci = ABCI(TmVersion(bigchaindb.config['tendermint']['version']))
     if args.experimental_parallel_validation:
-        app = ABCIServer(
-            app=ParallelValidationApp(
-                abci=abci.types,
-                events_queue=exchange.get_publisher_queue(),
-            )
+        app = ParallelValidationApp(
+            abci=abci.types,
+            events_queue=exchange.get_publisher_queue(),
         )
     else:
-        app = ABCIServer(
-            app=App(
-                abci=abci.types,
-                events_queue=exchange.get_publisher_queue(),
-            )
+        app = App(
+            abci=abci.types,
+            events_queue=exchange.get_publisher_queue(),
         )
+
+    check_tx = bigchaindb.config['check_tx']
+    if check_tx['concurrency']:
+        app = CheckTxServer(app=app,
+                            concurrency=check_tx['concurrency'],
+                            queue_depth=check_tx['queue_depth'])
+    else:
+        app = ABCIServer(app=app)
     app.run()
 
 
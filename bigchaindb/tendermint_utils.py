@@ -8,22 +8,28 @@ import hashlib
 import json
 from binascii import hexlify
 
+import rapidjson
+
 try:
     from hashlib import sha3_256
 except ImportError:
     from sha3 import sha3_256
 
+from bigchaindb.common.utils import serialize
+
 
 def encode_transaction(value):
-    """Encode a transaction (dict) to Base64."""
+    """Encode a transaction (dict, or its serialization) to Base64."""
 
-    return base64.b64encode(json.dumps(value).encode('utf8')).decode('utf8')
+    if isinstance(value, dict):
+        value = serialize(value)
+    return base64.b64encode(value.encode('utf8')).decode('utf8')
 
 
 def decode_transaction(raw):
     """Decode a transaction from bytes to a dict."""
 
-    return json.loads(raw.decode('utf8'))
+    return rapidjson.loads(raw)
 
 
 def decode_transaction_base64(value):
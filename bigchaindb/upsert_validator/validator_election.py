@@ -33,8 +33,8 @@ class ValidatorElection(Election):
         return self
 
     @classmethod
-    def validate_schema(cls, tx):
-        super(ValidatorElection, cls).validate_schema(tx)
+    def validate_schema(cls, tx, serialized=None):
+        super(ValidatorElection, cls).validate_schema(tx, serialized)
         validate_asset_public_key(tx['asset']['data']['public_key'])
 
     def has_concluded(self, bigchain, *args, **kwargs):
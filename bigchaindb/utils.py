@@ -134,6 +134,27 @@ def condition_details_has_owner(condition_details, owner):
     return False
 
 
+def condition_details_owners(condition_details):
+    """Return the public keys of the Ed25519Fulfillments in the condition
+    details, i.e. the owners for which :func:`condition_details_has_owner`
+    is ``True``.
+
+    Args:
+        condition_details (dict): dict with condition details
+
+    Returns:
+        set: the base58 public keys found in the condition details
+
+    """
+    if 'subconditions' in condition_details:
+        return condition_details_owners(condition_details['subconditions'])
+    if isinstance(condition_details, list):
+        return set().union(*map(condition_details_owners, condition_details))
+    if 'public_key' in condition_details:
+        return {condition_details['public_key']}
+    return set()
+
+
 class Lazy:
     """Lazy objects are useful to create chains of methods to
     execute later.
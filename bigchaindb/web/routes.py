@@ -7,6 +7,7 @@
 from flask_restful import Api
 from bigchaindb.web.views import (
     assets,
+    caches,
     metadata,
     blocks,
     info,
@@ -39,6 +40,7 @@ ROUTES_API_V1 = [
     r('transactions', tx.TransactionListApi),
     r('outputs/', outputs.OutputListApi),
     r('validators/', validators.ValidatorsApi),
+    r('caches/', caches.CachesApi),
 ]
 
 
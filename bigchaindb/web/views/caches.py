@@ -0,0 +1,39 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""This module provides the blueprint for the caches API endpoint."""
+
+import logging
+
+import requests
+from flask import current_app
+from flask_restful import Resource
+
+from bigchaindb.common import cache
+
+logger = logging.getLogger(__name__)
+
+
+class CachesApi(Resource):
+    def get(self):
+        """API endpoint to get the statistics of the caches.
+
+        Return:
+            A JSON string containing the hits, misses and evictions of the
+            caches of the HTTP API (``api``) and of the ABCI application
+            (``abci``), by cache name. ``abci`` is ``null`` when
+            Tendermint cannot be reached.
+        """
+
+        pool = current_app.config['bigchain_pool']
+
+        with pool() as bigchain:
+            try:
+                abci = bigchain.get_abci_cache_stats()
+            except (requests.exceptions.RequestException, KeyError, ValueError) as exc:
+                logger.warning('Cannot query the caches of the ABCI application: %s', exc)
+                abci = None
+
+        return {'api': cache.stats(), 'abci': abci}
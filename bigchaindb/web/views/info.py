@@ -54,4 +54,5 @@ def get_api_v1_info(api_prefix):
         'streams': websocket_root,
         'metadata': '{}metadata/'.format(api_prefix),
         'validators': '{}validators'.format(api_prefix),
+        'caches': '{}caches/'.format(api_prefix),
     }
@@ -14,17 +14,28 @@ class OutputListApi(Resource):
         """API endpoint to retrieve a list of links to transaction
         outputs.
 
+        The ``public_key`` argument can be given several times, to list
+        the outputs of all the keys at once.
+
             Returns:
-                A :obj:`list` of :cls:`str` of links to outputs.
+                A :obj:`list` of :cls:`str` of links to outputs. With
+                ``details``, the links also hold the ``public_key`` owning
+                the output, its ``amount``, ``asset_id`` and whether it is
+                ``spent``.
         """
         parser = reqparse.RequestParser()
         parser.add_argument('public_key', type=parameters.valid_ed25519,
-                            required=True)
+                            required=True, action='append')
         parser.add_argument('spent', type=parameters.valid_bool)
+        parser.add_argument('details', type=parameters.valid_bool,
+                            default=False)
         args = parser.parse_args(strict=True)
 
         pool = current_app.config['bigchain_pool']
         with pool() as bigchain:
+            if args['details']:
+                return bigchain.get_owner_outputs(args['public_key'],
+                                                  args['spent'])
             outputs = bigchain.get_outputs_filtered(args['public_key'],
                                                     args['spent'])
             return [{'transaction_id': output.txid, 'output_index': output.output}
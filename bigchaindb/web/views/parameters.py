@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
+import base64
+import json
 import re
 
 from bigchaindb.common.transaction_mode_types import (BROADCAST_TX_COMMIT,
@@ -49,3 +51,28 @@ def valid_mode(mode):
     if mode == 'commit':
         return BROADCAST_TX_COMMIT
     raise ValueError('Mode must be "async", "sync" or "commit"')
+
+
+def valid_limit(limit):
+    limit = int(limit)
+    if 1 <= limit <= 1000:
+        return limit
+    raise ValueError('Limit must be between 1 and 1000')
+
+
+def encode_cursor(position):
+    """Encode the position of a transaction in the history of its asset as
+    an opaque pagination cursor."""
+    cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+    return cursor.rstrip('=')
+
+
+def valid_cursor(cursor):
+    try:
+        cursor = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        height, position, transaction_id = json.loads(cursor)
+        if isinstance(height, int) and isinstance(position, int):
+            return height, position, valid_txid(transaction_id)
+    except (ValueError, TypeError):
+        pass
+    raise ValueError('Invalid cursor')
@@ -8,6 +8,7 @@
 For more information please refer to the documentation: http://bigchaindb.com/http-api
 """
 import logging
+from urllib.parse import urlencode
 
 from flask import current_app, request, jsonify
 from flask_restful import Resource, reqparse
@@ -51,11 +52,27 @@ class TransactionListApi(Resource):
                             required=True)
         parser.add_argument('last_tx', type=parameters.valid_bool,
                             required=False)
+        parser.add_argument('limit', type=parameters.valid_limit)
+        parser.add_argument('cursor', type=parameters.valid_cursor)
         args = parser.parse_args()
-        with current_app.config['bigchain_pool']() as bigchain:
-            txs = bigchain.get_transactions_filtered(**args)
+        limit = args.pop('limit')
+        cursor = args.pop('cursor')
+
+        if args['last_tx'] or (limit is None and cursor is None):
+            with current_app.config['bigchain_pool']() as bigchain:
+                txs = bigchain.get_transactions_filtered(**args)
+            return [tx.to_dict() for tx in txs]
 
-        return [tx.to_dict() for tx in txs]
+        with current_app.config['bigchain_pool']() as bigchain:
+            txs, next_position = bigchain.get_transactions_page(
+                args['asset_id'], args['operation'], cursor, limit or 100)
+
+        headers = {}
+        if next_position:
+            query = dict(request.args, cursor=parameters.encode_cursor(next_position))
+            headers['Link'] = '<{}?{}>; rel="next"'.format(
+                request.path, urlencode(query))
+        return [tx.to_dict() for tx in txs], 200, headers
 
     def post(self):
         """API endpoint to push transactions to the Federation.
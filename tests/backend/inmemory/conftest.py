@@ -0,0 +1,17 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from pytest import fixture
+
+
+@fixture
+def memory_conn():
+    from bigchaindb.backend.inmemory.connection import DATABASES, InMemoryConnection
+    from bigchaindb.backend.schema import init_database
+
+    conn = InMemoryConnection(dbname='bigchain_inmemory_test')
+    init_database(conn, 'bigchain_inmemory_test')
+    yield conn
+    DATABASES.pop('bigchain_inmemory_test', None)
@@ -0,0 +1,65 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import pytest
+
+
+def test_create_tables(memory_conn):
+    from bigchaindb.backend.schema import TABLES
+
+    tables = memory_conn.run(lambda database: database.tables)
+    assert set(tables) == set(TABLES)
+    assert set(tables['transactions'].indexes) == {'transaction_id', 'asset_id', 'outputs'}
+    assert tables['assets'].text_index is not None
+    assert tables['transactions'].text_index is None
+
+
+def test_init_database_is_graceful_if_db_exists(memory_conn):
+    from bigchaindb.backend.schema import init_database
+
+    init_database(memory_conn, 'bigchain_inmemory_test')
+
+
+def test_connections_share_the_database(memory_conn):
+    from bigchaindb.backend import query
+    from bigchaindb.backend.inmemory.connection import InMemoryConnection
+
+    query.store_block(memory_conn, {'app_hash': 'a', 'height': 1, 'transactions': []})
+    conn = InMemoryConnection(dbname='bigchain_inmemory_test')
+    assert query.get_latest_block(conn)['height'] == 1
+
+
+def test_drop_database(memory_conn):
+    from bigchaindb.backend import query
+    from bigchaindb.backend.inmemory.connection import DATABASES
+    from bigchaindb.backend.schema import drop_database
+    from bigchaindb.common.exceptions import DatabaseDoesNotExist
+
+    query.store_block(memory_conn, {'app_hash': 'a', 'height': 1, 'transactions': []})
+    drop_database(memory_conn, 'bigchain_inmemory_test')
+    assert 'bigchain_inmemory_test' not in DATABASES
+
+    with pytest.raises(DatabaseDoesNotExist):
+        drop_database(memory_conn, 'bigchain_inmemory_test')
+
+    # as with MongoDB, the database is created again on its first use
+    assert query.get_latest_block(memory_conn) is None
+
+
+@pytest.mark.parametrize('asset', [
+    {'bad.key': 'v'},
+    {'root': {'language': 'klingon'}},
+])
+def test_validity_does_not_depend_on_the_backend(monkeypatch, memory_conn, alice, asset):
+    import bigchaindb
+    from bigchaindb.lib import BigchainDB
+    from bigchaindb.models import Transaction
+
+    monkeypatch.setitem(bigchaindb.config['database'], 'backend', 'inmemory')
+    tx = Transaction.create([alice.public_key], [([alice.public_key], 1)], asset=asset)
+    tx = tx.sign([alice.private_key])
+
+    # the restrictions of MongoDB are rules of the network
+    assert not BigchainDB(connection=memory_conn).is_valid_transaction(tx.to_dict())
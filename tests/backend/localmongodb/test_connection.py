@@ -109,3 +109,38 @@ def test_connection_with_credentials(mock_authenticate):
                                   password='secret')
     conn.connect()
     assert mock_authenticate.call_count == 1
+
+
+def test_connection_durability_profiles():
+    from pymongo.read_concern import ReadConcern
+    from pymongo.write_concern import WriteConcern
+    from bigchaindb.backend.localmongodb.connection import LocalMongoDBConnection
+    from bigchaindb.common.exceptions import ConfigurationError
+
+    profiles = {
+        'fast': {'default': {'w': '1', 'j': False}},
+        'balanced': {'default': {'w': 1, 'j': False},
+                     'blocks': {'w': 'majority', 'j': True, 'read_concern': 'majority'}},
+        'invalid': {'default': {'w': 0, 'j': True}},
+    }
+
+    # the concerns of the server are used by default
+    conn = LocalMongoDBConnection(durability_profiles=profiles)
+    assert conn.durability is None
+    assert conn.collection_options == {}
+
+    conn = LocalMongoDBConnection(durability='balanced', durability_profiles=profiles)
+    blocks = conn.collection('blocks').run(conn.conn)
+    assert blocks.write_concern == WriteConcern(w='majority', j=True)
+    assert blocks.read_concern == ReadConcern('majority')
+    transactions = conn.collection('transactions').run(conn.conn)
+    assert transactions.write_concern == WriteConcern(w=1, j=False)
+    assert transactions.read_concern == ReadConcern()
+
+    conn = LocalMongoDBConnection(durability='fast', durability_profiles=profiles)
+    assert conn.collection_options['default']['write_concern'] == WriteConcern(w=1, j=False)
+
+    with pytest.raises(ConfigurationError):
+        LocalMongoDBConnection(durability='invalid', durability_profiles=profiles)
+    with pytest.raises(ConfigurationError):
+        LocalMongoDBConnection(durability='missing', durability_profiles=profiles)
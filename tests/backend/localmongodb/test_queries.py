@@ -19,12 +19,14 @@ def test_get_txids_filtered(signed_create_tx, signed_transfer_tx):
     from bigchaindb.models import Transaction
     conn = connect()
 
+    asset_id = Transaction.get_asset_id([signed_create_tx, signed_transfer_tx])
+
     # create and insert two blocks, one for the create and one for the
     # transfer transaction
-    conn.db.transactions.insert_one(signed_create_tx.to_dict())
-    conn.db.transactions.insert_one(signed_transfer_tx.to_dict())
-
-    asset_id = Transaction.get_asset_id([signed_create_tx, signed_transfer_tx])
+    query.store_asset_history(conn, [
+        {'asset_id': asset_id, 'height': height, 'position': 0,
+         'transaction_id': tx.id, 'operation': tx.operation}
+        for height, tx in enumerate([signed_create_tx, signed_transfer_tx])])
 
     # Test get by just asset id
     txids = set(query.get_txids_filtered(conn, asset_id))
@@ -38,6 +40,58 @@ def test_get_txids_filtered(signed_create_tx, signed_transfer_tx):
     txids = set(query.get_txids_filtered(conn, asset_id, Transaction.TRANSFER))
     assert txids == {signed_transfer_tx.id}
 
+    # Test get the last transaction
+    assert list(query.get_txids_filtered(conn, asset_id, last_tx=True)) == \
+        [signed_transfer_tx.id]
+    assert list(query.get_txids_filtered(conn, asset_id, Transaction.CREATE, True)) == \
+        [signed_create_tx.id]
+
+
+def test_get_asset_history():
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    # two blocks, the second one with the transactions 2 and 3 of the asset
+    records = [
+        {'asset_id': 'a', 'height': 1, 'position': 0, 'transaction_id': 'a', 'operation': 'CREATE'},
+        {'asset_id': 'b', 'height': 1, 'position': 1, 'transaction_id': 'b', 'operation': 'CREATE'},
+        {'asset_id': 'a', 'height': 2, 'position': 0, 'transaction_id': 'c', 'operation': 'TRANSFER'},
+        {'asset_id': 'a', 'height': 2, 'position': 1, 'transaction_id': 'd', 'operation': 'TRANSFER'},
+    ]
+    query.store_asset_history(conn, deepcopy(records))
+    # storing the same block again is a no-op
+    query.store_asset_history(conn, deepcopy(records[2:]))
+
+    page = list(query.get_asset_history(conn, 'a', limit=2))
+    assert page == [records[0], records[2]]
+    page = list(query.get_asset_history(conn, 'a', after=(2, 0, 'c'), limit=2))
+    assert page == [records[3]]
+    page = list(query.get_asset_history(conn, 'a', 'TRANSFER'))
+    assert page == [records[2], records[3]]
+
+    query.delete_transactions(conn, ['d'])
+    assert list(query.get_txids_filtered(conn, 'a', last_tx=True)) == ['c']
+
+
+def test_get_full_transactions(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    # the transactions are stored like `store_bulk_transactions` does
+    create_tx = signed_create_tx.to_dict()
+    transfer_tx = signed_transfer_tx.to_dict()
+    for tx in (create_tx, transfer_tx):
+        tx = deepcopy(tx)
+        conn.db.metadata.insert_one({'id': tx['id'], 'metadata': tx.pop('metadata')})
+        if tx['operation'] == 'CREATE':
+            conn.db.assets.insert_one(dict(tx.pop('asset'), id=tx['id']))
+        conn.db.transactions.insert_one(tx)
+
+    txs = query.get_full_transactions(conn, [transfer_tx['id'], 'missing', create_tx['id']])
+    assert txs == [transfer_tx, create_tx]
+    assert query.get_full_transactions(conn, []) == []
+    assert sorted(query.get_transaction_ids(conn)) == sorted([create_tx['id'], transfer_tx['id']])
+
 
 def test_write_assets():
     from bigchaindb.backend import connect, query
@@ -213,6 +267,13 @@ def test_get_owned_ids(signed_create_tx, user_pk):
     assert txns[0] == signed_create_tx.to_dict()
 
 
+def store_spent_outputs(conn, transactions, height=1):
+    from bigchaindb.backend import query
+    query.store_spent_outputs(conn, [dict(spent_output, spent_by=tx.id, height=height)
+                                     for tx in transactions
+                                     for spent_output in tx.spent_outputs])
+
+
 def test_get_spending_transactions(user_pk, user_sk):
     from bigchaindb.backend import connect, query
     from bigchaindb.models import Transaction
@@ -227,12 +288,95 @@ def test_get_spending_transactions(user_pk, user_sk):
     tx4 = Transaction.transfer([inputs[2]], out, tx1.id).sign([user_sk])
     txns = [deepcopy(tx.to_dict()) for tx in [tx1, tx2, tx3, tx4]]
     conn.db.transactions.insert_many(txns)
+    store_spent_outputs(conn, [tx2, tx3, tx4])
 
     links = [inputs[0].fulfills.to_dict(), inputs[2].fulfills.to_dict()]
     txns = list(query.get_spending_transactions(conn, links))
 
     # tx3 not a member because input 1 not asked for
-    assert txns == [tx2.to_dict(), tx4.to_dict()]
+    assert sorted(txns, key=lambda tx: tx['id']) == \
+        sorted([tx2.to_dict(), tx4.to_dict()], key=lambda tx: tx['id'])
+
+
+def test_get_transaction_outputs_and_spent_outputs(user_pk, user_sk):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.models import Transaction
+    conn = connect()
+
+    out = [([user_pk], 1)]
+    tx1 = Transaction.create([user_pk], out * 3, metadata={'a': 1})
+    tx1.sign([user_sk])
+    inputs = tx1.to_inputs()
+    tx2 = Transaction.transfer([inputs[0]], out, tx1.id).sign([user_sk])
+    tx3 = Transaction.transfer([inputs[2]], out, tx1.id).sign([user_sk])
+    conn.db.transactions.insert_many([deepcopy(tx.to_dict()) for tx in [tx1, tx2, tx3]])
+    store_spent_outputs(conn, [tx2, tx3])
+
+    outputs = {tx['id']: tx for tx in query.get_transaction_outputs(conn, [tx1.id, tx2.id])}
+    assert outputs[tx2.id] == {
+        'id': tx2.id,
+        'operation': 'TRANSFER',
+        'asset': {'id': tx1.id},
+        'outputs': [{'amount': '1',
+                     'condition': {'uri': tx2.outputs[0].fulfillment.condition_uri}}],
+    }
+    assert 'metadata' not in outputs[tx1.id]
+
+    # the output 1 of tx1 is not spent, tx2 and tx3 spend the others
+    links = [(tx1.id, 0), (tx1.id, 1), (tx1.id, 2), (tx2.id, 0)]
+    spent = query.get_spent_outputs(conn, links)
+    assert sorted((link['transaction_id'], link['output_index']) for link in spent) == \
+        [(tx1.id, 0), (tx1.id, 2)]
+    assert query.get_spent_outputs(conn, []) == []
+
+
+def test_store_and_delete_spent_outputs(user_pk, user_sk):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.backend.exceptions import DuplicateKeyError
+    from bigchaindb.models import Transaction
+    conn = connect()
+
+    tx1 = Transaction.create([user_pk], [([user_pk], 1)]).sign([user_sk])
+    tx2 = Transaction.transfer(tx1.to_inputs(), [([user_pk], 1)], tx1.id).sign([user_sk])
+    double_spend = Transaction.transfer(tx1.to_inputs(), [([user_pk], 2)], tx1.id).sign([user_sk])
+    conn.db.transactions.insert_many([deepcopy(tx.to_dict()) for tx in [tx1, tx2]])
+
+    store_spent_outputs(conn, [tx2], height=2)
+    # storing the same block again is a no-op
+    store_spent_outputs(conn, [tx2], height=2)
+    with pytest.raises(DuplicateKeyError):
+        store_spent_outputs(conn, [double_spend], height=3)
+
+    assert list(query.get_spent_outputs(conn, [(tx1.id, 0)])) == [
+        {'transaction_id': tx1.id, 'output_index': 0,
+         'spent_by': tx2.id, 'height': 2}]
+    assert list(query.get_spent(conn, tx1.id, 0)) == [tx2.to_dict()]
+
+    query.delete_transactions(conn, [tx2.id])
+    assert list(query.get_spent_outputs(conn, [(tx1.id, 0)])) == []
+
+
+def test_store_spent_outputs_is_all_or_nothing(user_pk, user_sk):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.backend.exceptions import DuplicateKeyError
+    from bigchaindb.models import Transaction
+    conn = connect()
+
+    tx1 = Transaction.create([user_pk], [([user_pk], 1), ([user_pk], 1)]).sign([user_sk])
+    inputs = tx1.to_inputs()
+    tx2 = Transaction.transfer([inputs[0]], [([user_pk], 1)], tx1.id).sign([user_sk])
+    tx3 = Transaction.transfer([inputs[1]], [([user_pk], 1)], tx1.id).sign([user_sk])
+    double_spend = Transaction.transfer([inputs[0]], [([user_pk], 2)], tx1.id).sign([user_sk])
+    store_spent_outputs(conn, [tx2], height=2)
+
+    with pytest.raises(DuplicateKeyError):
+        store_spent_outputs(conn, [tx3, double_spend], height=3)
+
+    # the output spent by tx3 is not recorded
+    assert [spent_output['spent_by']
+            for spent_output in query.get_spent_outputs(conn, [(tx1.id, 0), (tx1.id, 1)])] == [tx2.id]
+    store_spent_outputs(conn, [tx3], height=3)
+    assert len(list(query.get_spent_outputs(conn, [(tx1.id, 0), (tx1.id, 1)]))) == 2
 
 
 def test_get_spending_transactions_multiple_inputs():
@@ -264,6 +408,7 @@ def test_get_spending_transactions_multiple_inputs():
 
     txns = [deepcopy(tx.to_dict()) for tx in [tx1, tx2, tx3, tx4]]
     conn.db.transactions.insert_many(txns)
+    store_spent_outputs(conn, [tx2, tx3, tx4])
 
     links = [
         ({'transaction_id': tx2.id, 'output_index': 0}, 1, [tx3.id]),
@@ -306,6 +451,20 @@ def test_get_block():
     assert block['height'] == 3
 
 
+def test_get_block_with_transaction():
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    conn.db.blocks.insert_many([{'app_hash': 'a', 'height': 3, 'transactions': ['a', 'b']},
+                                {'app_hash': 'b', 'height': 4, 'transactions': ['c']}])
+
+    assert list(query.get_block_with_transaction(conn, 'b')) == [{'height': 3}]
+    assert list(query.get_block_with_transaction(conn, 'd')) == []
+    # the lookup is a hit of the multikey index on the transactions
+    plan = conn.db.blocks.find({'transactions': 'b'}).explain()['queryPlanner']['winningPlan']
+    assert "'indexName': 'transactions'" in str(plan)
+
+
 def test_delete_zero_unspent_outputs(db_context, utxoset):
     from bigchaindb.backend import query
     unspent_outputs, utxo_collection = utxoset
@@ -394,6 +553,38 @@ def test_get_unspent_outputs(db_context, utxoset):
     assert retrieved_utxoset == unspent_outputs
 
 
+def test_update_unspent_outputs(db_context, utxoset):
+    from bigchaindb.backend import query
+    unspent_outputs, utxo_collection = utxoset
+    new_unspent_output = {'transaction_id': 'c', 'output_index': 0}
+
+    res = query.update_unspent_outputs(db_context.conn,
+                                       unspent_outputs[:2],
+                                       [new_unspent_output, unspent_outputs[2]])
+    assert res.deleted_count == 2
+    assert res.upserted_count == 1
+    assert list(query.get_unspent_outputs(db_context.conn)) == [
+        unspent_outputs[2], new_unspent_output]
+
+    assert query.update_unspent_outputs(db_context.conn, [], []) is None
+
+
+def test_get_unspent_output(db_context, utxoset):
+    from bigchaindb.backend import query
+    unspent_outputs, utxo_collection = utxoset
+    assert query.get_unspent_output(db_context.conn, 'a', 1) == unspent_outputs[1]
+    assert query.get_unspent_output(db_context.conn, 'a', 2) is None
+
+
+def test_get_unspent_outputs_by_links(db_context, utxoset):
+    from bigchaindb.backend import query
+    unspent_outputs, utxo_collection = utxoset
+    utxos = query.get_unspent_outputs_by_links(db_context.conn, [('a', 1), ('a', 2), ('b', 0)])
+    assert sorted(utxos, key=lambda utxo: utxo['transaction_id']) == \
+        [unspent_outputs[1], unspent_outputs[2]]
+    assert list(query.get_unspent_outputs_by_links(db_context.conn, [])) == []
+
+
 def test_store_pre_commit_state(db_context):
     from bigchaindb.backend import query
 
@@ -414,6 +605,17 @@ def test_get_pre_commit_state(db_context):
     assert resp == state
 
 
+def test_store_schema_version(db_context):
+    from bigchaindb.backend import query
+
+    assert query.get_schema_version(db_context.conn) is None
+    query.store_schema_version(db_context.conn, None)
+    assert query.get_schema_version(db_context.conn) is None
+    query.store_schema_version(db_context.conn, 1)
+    assert query.get_schema_version(db_context.conn) == 1
+    assert db_context.conn.db.schema_version.count_documents({}) == 1
+
+
 def test_validator_update():
     from bigchaindb.backend import connect, query
 
@@ -33,8 +33,9 @@ def test_create_tables():
 
     collection_names = conn.conn[dbname].list_collection_names()
     assert set(collection_names) == {
-        'transactions', 'assets', 'metadata', 'blocks', 'utxos', 'validators', 'elections',
-        'pre_commit', 'abci_chains',
+        'transactions', 'assets', 'metadata', 'blocks', 'utxos', 'utxo_tree', 'validators',
+        'elections', 'pre_commit', 'abci_chains', 'spent_outputs', 'owner_outputs', 'asset_history',
+        'schema_version',
     }
 
     indexes = conn.conn[dbname]['assets'].index_information().keys()
@@ -48,7 +49,7 @@ def test_create_tables():
 
     index_info = conn.conn[dbname]['blocks'].index_information()
     indexes = index_info.keys()
-    assert set(indexes) == {'_id_', 'height'}
+    assert set(indexes) == {'_id_', 'height', 'transactions'}
     assert index_info['height']['unique']
 
     index_info = conn.conn[dbname]['utxos'].index_information()
@@ -57,6 +58,24 @@ def test_create_tables():
     assert index_info['utxo']['key'] == [('transaction_id', 1),
                                          ('output_index', 1)]
 
+    index_info = conn.conn[dbname]['utxo_tree'].index_information()
+    assert set(index_info.keys()) == {'_id_', 'path'}
+    assert index_info['path']['unique']
+
+    index_info = conn.conn[dbname]['spent_outputs'].index_information()
+    assert set(index_info.keys()) == {'_id_', 'spent_output', 'spent_by'}
+    assert index_info['spent_output']['unique']
+    assert index_info['spent_output']['key'] == [('transaction_id', 1),
+                                                 ('output_index', 1)]
+
+    index_info = conn.conn[dbname]['owner_outputs'].index_information()
+    assert set(index_info.keys()) == {'_id_', 'public_key', 'owner_output'}
+    assert index_info['owner_output']['unique']
+
+    index_info = conn.conn[dbname]['asset_history'].index_information()
+    assert set(index_info.keys()) == {'_id_', 'asset_history', 'transaction_id'}
+    assert index_info['asset_history']['unique']
+
     indexes = conn.conn[dbname]['elections'].index_information()
     assert set(indexes.keys()) == {'_id_', 'election_id_height'}
     assert indexes['election_id_height']['unique']
@@ -0,0 +1,17 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from pytest import fixture
+
+
+@fixture
+def sqlite_conn(tmp_path):
+    from bigchaindb.backend.localsqlite.connection import LocalSQLiteConnection
+    from bigchaindb.backend.schema import init_database
+
+    conn = LocalSQLiteConnection(dbname='bigchain_test', directory=str(tmp_path))
+    init_database(conn, 'bigchain_test')
+    yield conn
+    conn.close()
@@ -0,0 +1,181 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from copy import deepcopy
+
+import pytest
+
+from bigchaindb.backend import query
+
+
+def store_transactions(conn, transactions, height=0):
+    """Store the transactions like `store_bulk_transactions` does."""
+    query.store_spent_outputs(conn, [dict(spent_output, spent_by=tx.id, height=height)
+                                     for tx in transactions
+                                     for spent_output in tx.spent_outputs])
+    for tx in transactions:
+        tx = deepcopy(tx.to_dict())
+        query.store_metadatas(conn, [{'id': tx['id'], 'metadata': tx.pop('metadata')}])
+        if tx['operation'] == 'CREATE':
+            query.store_assets(conn, [dict(tx.pop('asset'), id=tx['id'])])
+        query.store_transactions(conn, [tx])
+
+
+def test_get_transactions(sqlite_conn, signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend.exceptions import DuplicateKeyError
+
+    store_transactions(sqlite_conn, [signed_create_tx, signed_transfer_tx])
+    create_tx = signed_create_tx.to_dict()
+    transfer_tx = signed_transfer_tx.to_dict()
+
+    assert query.get_transaction(sqlite_conn, transfer_tx['id'])['id'] == transfer_tx['id']
+    assert query.get_transaction(sqlite_conn, 'missing') is None
+    assert sorted(query.get_transaction_ids(sqlite_conn)) == sorted([create_tx['id'], transfer_tx['id']])
+    txs = query.get_full_transactions(sqlite_conn, [transfer_tx['id'], 'missing', create_tx['id']])
+    assert txs == [transfer_tx, create_tx]
+    assert query.get_asset(sqlite_conn, create_tx['id']) == create_tx['asset']
+
+    with pytest.raises(DuplicateKeyError):
+        query.store_transactions(sqlite_conn, [transfer_tx])
+
+
+def test_transaction_is_rolled_back(sqlite_conn, signed_create_tx):
+    with pytest.raises(ZeroDivisionError):
+        with sqlite_conn.transaction():
+            store_transactions(sqlite_conn, [signed_create_tx])
+            with sqlite_conn.transaction():
+                query.store_block(sqlite_conn, {'app_hash': 'a', 'height': 1,
+                                                'transactions': [signed_create_tx.id]})
+            1 / 0
+
+    assert query.get_transaction(sqlite_conn, signed_create_tx.id) is None
+    assert query.get_latest_block(sqlite_conn) is None
+    assert query.text_search(sqlite_conn, signed_create_tx.id) == []
+
+
+@pytest.mark.parametrize('table', ['assets', 'metadata'])
+def test_text_search(sqlite_conn, table):
+    # the examples of test_text_search for MongoDB, the text index being
+    # English only
+    objects = [
+        {'id': 1, 'subject': 'coffee', 'author': 'xyz', 'views': 50},
+        {'id': 2, 'subject': 'Coffee Shopping', 'author': 'efg', 'views': 5},
+        {'id': 3, 'subject': 'Baking a cake', 'author': 'abc', 'views': 90},
+        {'id': 4, 'subject': 'baking', 'author': 'xyz', 'views': 100},
+        {'id': 5, 'subject': 'Café Con Leche', 'author': 'abc', 'views': 200},
+        {'id': 6, 'subject': 'Сырники', 'author': 'jkl', 'views': 80},
+        {'id': 7, 'subject': 'coffee and cream', 'author': 'efg', 'views': 10},
+        {'id': 8, 'subject': 'Cafe con Leche', 'author': 'xyz', 'views': 10}
+    ]
+    if table == 'assets':
+        query.store_assets(sqlite_conn, deepcopy(objects))
+    else:
+        query.store_metadatas(sqlite_conn, deepcopy(objects))
+
+    def search(*args, **kwargs):
+        return [obj['id'] for obj in query.text_search(sqlite_conn, *args, table=table, **kwargs)]
+
+    assert search('coffee') == [1, 2, 7]
+    assert sorted(search('bake coffee cake')) == [1, 2, 3, 4, 7]
+    assert search('"coffee shop"') == [2]
+    assert search('coffee -shop') == [1, 7]
+    assert sorted(search('сы́рники CAFÉS')) == [5, 6, 8]
+    assert search('Coffee', case_sensitive=True) == [2]
+    assert search('CAFÉ', diacritic_sensitive=True) == [5]
+    assert search('coffee', limit=2) == [1, 2]
+    assert search('-coffee') == []
+
+    results = list(query.text_search(sqlite_conn, 'coffee', text_score=True, table=table))
+    assert results[0] == dict(objects[0], score=results[0]['score'])
+    assert results[0]['score'] > results[1]['score'] > 0
+
+
+def test_store_and_delete_spent_outputs(sqlite_conn, user_pk, user_sk):
+    from bigchaindb.backend.exceptions import DuplicateKeyError
+    from bigchaindb.fastquery import owner_outputs
+    from bigchaindb.models import Transaction
+
+    tx1 = Transaction.create([user_pk], [([user_pk], 1)]).sign([user_sk])
+    tx2 = Transaction.transfer(tx1.to_inputs(), [([user_pk], 1)], tx1.id).sign([user_sk])
+    double_spend = Transaction.transfer(tx1.to_inputs(), [([user_pk], 2)], tx1.id).sign([user_sk])
+    store_transactions(sqlite_conn, [tx1, tx2], height=2)
+    spent_outputs = [dict(spent_output, spent_by=tx2.id, height=2) for spent_output in tx2.spent_outputs]
+    query.store_owner_outputs(sqlite_conn, owner_outputs(tx1.to_dict()) + owner_outputs(tx2.to_dict()),
+                              spent_outputs)
+
+    # storing the same block again is a no-op
+    query.store_spent_outputs(sqlite_conn, spent_outputs)
+    with pytest.raises(DuplicateKeyError):
+        store_transactions(sqlite_conn, [double_spend], height=3)
+
+    assert query.get_spent_outputs(sqlite_conn, [(tx1.id, 0)]) == spent_outputs
+    assert [tx['id'] for tx in query.get_spent(sqlite_conn, tx1.id, 0)] == [tx2.id]
+    assert [(output['transaction_id'], output['spent'])
+            for output in query.get_owner_outputs(sqlite_conn, [user_pk])] == \
+        [(tx1.id, True), (tx2.id, False)]
+
+    query.delete_transactions(sqlite_conn, [tx2.id])
+    assert query.get_spent_outputs(sqlite_conn, [(tx1.id, 0)]) == []
+    assert [(output['transaction_id'], output['spent'])
+            for output in query.get_owner_outputs(sqlite_conn, [user_pk])] == [(tx1.id, False)]
+
+
+def test_get_asset_history(sqlite_conn):
+    records = [
+        {'asset_id': 'a', 'height': 1, 'position': 0, 'transaction_id': 'a', 'operation': 'CREATE'},
+        {'asset_id': 'b', 'height': 1, 'position': 1, 'transaction_id': 'b', 'operation': 'CREATE'},
+        {'asset_id': 'a', 'height': 2, 'position': 0, 'transaction_id': 'c', 'operation': 'TRANSFER'},
+        {'asset_id': 'a', 'height': 2, 'position': 1, 'transaction_id': 'd', 'operation': 'TRANSFER'},
+    ]
+    query.store_asset_history(sqlite_conn, records)
+    # storing the same block again is a no-op
+    query.store_asset_history(sqlite_conn, records[2:])
+
+    assert query.get_asset_history(sqlite_conn, 'a', limit=2) == [records[0], records[2]]
+    assert query.get_asset_history(sqlite_conn, 'a', after=(2, 0, 'c'), limit=2) == [records[3]]
+    assert list(query.get_txids_filtered(sqlite_conn, 'a', last_tx=True)) == ['d']
+    assert list(query.get_txids_filtered(sqlite_conn, 'a', 'CREATE', True)) == ['a']
+
+
+def test_get_block_with_transaction(sqlite_conn):
+    query.store_block(sqlite_conn, {'app_hash': 'a', 'height': 3, 'transactions': ['a', 'b']})
+    query.store_block(sqlite_conn, {'app_hash': 'b', 'height': 4, 'transactions': ['c']})
+
+    assert query.get_latest_block(sqlite_conn) == {'app_hash': 'b', 'height': 4, 'transactions': ['c']}
+    assert query.get_block_with_transaction(sqlite_conn, 'b') == [{'height': 3}]
+    assert list(query.get_block_transaction_ids(sqlite_conn)) == [
+        {'height': 3, 'position': 0, 'transaction_id': 'a'},
+        {'height': 3, 'position': 1, 'transaction_id': 'b'},
+        {'height': 4, 'position': 0, 'transaction_id': 'c'},
+    ]
+
+
+def test_update_utxo_tree_nodes(sqlite_conn):
+    query.update_utxo_tree_nodes(sqlite_conn, [{'path': '', 'hash': b'\x00\x01'},
+                                               {'path': '0', 'hash': b'\x02', 'key': b'\x03'}], [])
+    query.update_utxo_tree_nodes(sqlite_conn, [{'path': '', 'hash': b'\x04'}], ['0'])
+
+    assert query.get_utxo_tree_nodes(sqlite_conn, ['', '0']) == [{'path': '', 'hash': b'\x04'}]
+
+
+def test_store_schema_version(sqlite_conn):
+    assert query.get_schema_version(sqlite_conn) is None
+    query.store_schema_version(sqlite_conn, 1)
+    query.store_schema_version(sqlite_conn, None)
+    assert query.get_schema_version(sqlite_conn) is None
+    query.store_schema_version(sqlite_conn, 1)
+    assert query.get_schema_version(sqlite_conn) == 1
+
+
+def test_store_abci_chain(sqlite_conn):
+    from bigchaindb.backend.exceptions import DuplicateKeyError
+
+    query.store_abci_chain(sqlite_conn, 0, 'some-id')
+    query.store_abci_chain(sqlite_conn, 0, 'new-id', False)
+    assert query.get_latest_abci_chain(sqlite_conn) == \
+        {'height': 0, 'chain_id': 'new-id', 'is_synced': False}
+
+    with pytest.raises(DuplicateKeyError):
+        query.store_abci_chain(sqlite_conn, 10, 'new-id')
@@ -0,0 +1,46 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import os
+
+import pytest
+
+
+def test_create_tables(sqlite_conn):
+    tables = {name for name, in sqlite_conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND sql NOT LIKE 'CREATE TABLE ''%'")}
+    assert tables == {
+        'transactions', 'transaction_public_keys', 'assets', 'assets_text', 'metadata',
+        'metadata_text', 'blocks', 'block_transactions', 'utxos', 'utxo_tree', 'validators',
+        'elections', 'pre_commit', 'abci_chains', 'spent_outputs', 'owner_outputs',
+        'asset_history', 'schema_version', 'sqlite_sequence',
+    }
+
+    indexes = {name for name, in sqlite_conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+    assert indexes == {
+        'transactions_asset_id', 'transaction_public_keys_transaction_id',
+        'spent_outputs_spent_by', 'owner_outputs_public_key', 'elections_election_id',
+    }
+
+    assert sqlite_conn.execute('PRAGMA journal_mode') == [('wal',)]
+
+
+def test_init_database_is_graceful_if_db_exists(sqlite_conn):
+    from bigchaindb.backend.schema import init_database
+
+    init_database(sqlite_conn, 'bigchain_test')
+
+
+def test_drop_database(sqlite_conn):
+    from bigchaindb.backend.schema import drop_database
+    from bigchaindb.common.exceptions import DatabaseDoesNotExist
+
+    assert os.path.exists(sqlite_conn.path)
+    drop_database(sqlite_conn, 'bigchain_test')
+    assert not os.path.exists(sqlite_conn.path)
+
+    with pytest.raises(DatabaseDoesNotExist):
+        drop_database(sqlite_conn, 'bigchain_test')
@@ -29,6 +29,25 @@ def test_schema(schema_func_name, args_qty):
     ('get_asset', 1),
     ('store_metadatas', 1),
     ('get_metadata', 1),
+    ('update_unspent_outputs', 2),
+    ('get_unspent_output', 2),
+    ('get_unspent_outputs_by_links', 1),
+    ('get_transaction_outputs', 1),
+    ('get_spent_outputs', 1),
+    ('store_spent_outputs', 1),
+    ('delete_all_spent_outputs', 0),
+    ('store_owner_outputs', 2),
+    ('get_owner_outputs', 1),
+    ('delete_all_owner_outputs', 0),
+    ('get_asset_history', 1),
+    ('store_asset_history', 1),
+    ('delete_all_asset_history', 0),
+    ('get_block_transaction_ids', 0),
+    ('get_full_transactions', 1),
+    ('get_utxo_tree_nodes', 1),
+    ('update_utxo_tree_nodes', 2),
+    ('store_schema_version', 1),
+    ('get_schema_version', 0),
 ))
 def test_query(query_func_name, args_qty):
     from bigchaindb.backend import query
@@ -144,6 +144,16 @@ def test_drop_db_does_not_drop_when_interactive_no(mock_db_drop, monkeypatch):
     assert not mock_db_drop.called
 
 
+@patch('bigchaindb.lib.BigchainDB.rebuild_utxoset', return_value=3)
+def test_run_rebuild_utxoset(mock_rebuild_utxoset, capsys):
+    from bigchaindb.commands.bigchaindb import run_rebuild_utxoset
+    args = Namespace(config=None)
+
+    run_rebuild_utxoset(args)
+    assert mock_rebuild_utxoset.called
+    assert capsys.readouterr()[1] == 'Rebuilt the UTXO set with 3 unspent outputs.\n'
+
+
 # TODO Beware if you are putting breakpoints in there, and using the '-s'
 # switch with pytest. It will just hang. Seems related to the monkeypatching of
 # input_on_stderr.
@@ -233,6 +243,8 @@ def test_calling_main(start_mock, monkeypatch):
                                           'configuration')
     subparsers.add_parser.assert_any_call('init', help='Init the database')
     subparsers.add_parser.assert_any_call('drop', help='Drop the database')
+    subparsers.add_parser.assert_any_call('rebuild-utxoset',
+                                          help='Rebuild the UTXO set')
 
     subparsers.add_parser.assert_any_call('start', help='Start BigchainDB')
     subparsers.add_parser.assert_any_call('tendermint-version',
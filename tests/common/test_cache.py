@@ -0,0 +1,169 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import sys
+from copy import deepcopy
+
+import pytest
+
+from bigchaindb.common.cache import LRUCache
+
+
+def fixed_size(key, value):
+    return 10
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache(100, sizeof=fixed_size)
+
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert cache.pop('a') == 1
+    assert cache.pop('a', False) is False
+    assert 'a' not in cache
+
+    assert cache.stats() == {
+        'entries': 0,
+        'bytes': 0,
+        'max_bytes': 100,
+        'hits': 2,
+        'misses': 2,
+        'hit_rate': 0.5,
+        'evictions': 0,
+    }
+    cache.reset()
+    assert cache.stats()['hit_rate'] is None
+
+
+def test_lru_cache_evicts_least_recently_used_entries():
+    cache = LRUCache(30, sizeof=fixed_size)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    # `a` becomes the most recently used entry
+    cache.get('a')
+    cache.put('d', 4)
+
+    assert 'b' not in cache
+    assert all(key in cache for key in 'acd')
+    assert cache.size == 30
+    assert cache.evictions == 1
+
+    # replacing an entry does not change the accounted size
+    cache.put('a', 5)
+    assert cache.size == 30
+    assert cache.get('a') == 5
+
+
+def test_lru_cache_ignores_entries_larger_than_the_budget():
+    cache = LRUCache(5, sizeof=fixed_size)
+    cache.put('a', 1)
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_lru_cache_resize_evicts_entries():
+    cache = LRUCache(30, sizeof=fixed_size)
+    for key in 'abc':
+        cache.put(key, 1)
+
+    cache.resize(10)
+    assert list(cache._entries) == ['c']
+    assert cache.evictions == 2
+
+    cache.reset()
+    assert len(cache) == 0
+    assert cache.stats()['evictions'] == 0
+
+
+def test_deep_sizeof_counts_nested_objects():
+    from bigchaindb.common.cache import deep_sizeof
+
+    value = {'inputs': [{'fulfillment': 'x' * 1000}]}
+    assert deep_sizeof(value) > 1000
+    assert deep_sizeof(value) > sys.getsizeof(value)
+
+
+@pytest.fixture
+def caches():
+    from bigchaindb.common import cache
+    cache.reset()
+    yield cache
+    cache.reset()
+
+
+@pytest.fixture
+def signed_tx():
+    from bigchaindb.common.crypto import generate_key_pair
+    from bigchaindb.models import Transaction
+
+    alice = generate_key_pair()
+    return Transaction.create([alice.public_key],
+                              [([alice.public_key], 1)],
+                              asset={'data': {'id': 'test_id'}})\
+        .sign([alice.private_key])
+
+
+def test_to_dict_is_cached(caches, signed_tx):
+    signed_tx.to_dict()
+    signed_tx.to_dict()
+    signed_tx.to_dict()
+
+    stats = caches.stats()['transaction_dicts']
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+
+
+def test_from_dict_is_cached(caches, signed_tx):
+    from bigchaindb.models import Transaction
+
+    tx_dict = deepcopy(signed_tx.to_dict())
+    tx = Transaction.from_dict(tx_dict)
+    assert Transaction.from_dict(deepcopy(tx_dict)) is tx
+    assert Transaction.from_dict(tx_dict) is tx
+
+    stats = caches.stats()['transactions']
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+
+
+def test_from_dict_cache_checks_the_transaction(caches, signed_tx):
+    from bigchaindb.common.exceptions import InvalidHash
+    from bigchaindb.models import Transaction
+
+    tx_dict = deepcopy(signed_tx.to_dict())
+    Transaction.from_dict(tx_dict)
+
+    # a transaction with the same id, but not the same content
+    with pytest.raises(InvalidHash):
+        Transaction.from_dict(dict(tx_dict, metadata={'tampered': True}))
+
+
+def test_input_valid_is_cached(caches, signed_tx):
+    signed_tx.inputs_valid()
+    signed_tx.inputs_valid()
+    signed_tx.inputs_valid()
+
+    stats = caches.stats()['inputs']
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    # the keys don't keep transactions alive
+    (fulfillment_uri, digest, condition_uri), = caches.get_cache('inputs')._entries
+    assert fulfillment_uri == signed_tx.inputs[0].fulfillment_uri
+    assert condition_uri is None
+
+
+def test_caches_are_configured(caches, signed_tx):
+    from bigchaindb import config_utils
+
+    signed_tx.to_dict()
+    config_utils.update_config({'cache': {'transaction_dicts': 0}})
+    try:
+        assert caches.stats()['transaction_dicts']['entries'] == 0
+        assert caches.stats()['transaction_dicts']['max_bytes'] == 0
+    finally:
+        config_utils.update_config({'cache': {'transaction_dicts': 16 * 1024 * 1024}})
@@ -0,0 +1,94 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import pytest
+
+from bigchaindb.common.crypto import generate_key_pair
+
+
+@pytest.fixture
+def keypairs():
+    return generate_key_pair(), generate_key_pair()
+
+
+def test_verify_signatures(keypairs):
+    from base58 import b58decode
+    from bigchaindb.common.crypto import PrivateKey, verify_signatures
+
+    (user_priv, user_pub), (_, user2_pub) = keypairs
+
+    signature = PrivateKey(user_priv).sign(b'message', encoding='bytes')
+    public_key = b58decode(user_pub)
+    assert verify_signatures([
+        (public_key, b'message', signature),
+        (public_key, b'other message', signature),
+        (b58decode(user2_pub), b'message', signature),
+    ]) == [True, False, False]
+
+
+def test_signature_batch_verifies_threshold_inputs(keypairs):
+    from bigchaindb.common.signatures import SignatureBatch, ed25519_signatures
+    from bigchaindb.common.transaction import Transaction
+
+    (user_priv, user_pub), (user2_priv, user2_pub) = keypairs
+    create_tx = Transaction.create([user_pub], [([user_pub, user2_pub], 1)])
+    create_tx.sign([user_priv])
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(),
+                                       [([user2_pub], 1)],
+                                       asset_id=create_tx.id)
+    transfer_tx.sign([user_priv, user2_priv])
+    assert len(ed25519_signatures(transfer_tx.inputs[0].fulfillment)) == 2
+
+    batch = SignatureBatch()
+    batch.add(create_tx)
+    batch.add(transfer_tx)
+    assert batch.verify() == []
+    assert create_tx.signatures_verified
+    assert transfer_tx.signatures_verified
+
+
+def test_signature_batch_leaves_invalid_transactions(keypairs):
+    from bigchaindb.common.signatures import SignatureBatch
+    from bigchaindb.common.transaction import Transaction
+
+    (user_priv, user_pub), _ = keypairs
+    tx = Transaction.create([user_pub], [([user_pub], 1)]).sign([user_priv])
+    other_tx = Transaction.create([user_pub], [([user_pub], 2)]).sign([user_priv])
+    # the signature of another transaction
+    forged_tx = Transaction.from_dict(dict(other_tx.to_dict(), inputs=[tx.inputs[0].to_dict()]))
+    # a fulfillment without signature
+    unsigned_tx = Transaction.create([user_pub], [([user_pub], 3)])
+
+    batch = SignatureBatch()
+    for transaction in (tx, forged_tx, unsigned_tx):
+        batch.add(transaction)
+    assert batch.verify() == [forged_tx, unsigned_tx]
+    assert tx.signatures_verified
+    assert not forged_tx.signatures_verified
+    assert not forged_tx.signatures_valid()
+
+
+def test_verify_batch(keypairs):
+    from base58 import b58decode
+    from bigchaindb.common.crypto import PrivateKey, verify_batch, verify_signatures
+
+    signatures = []
+    for index in range(8):
+        private_key, public_key = keypairs[index % 2]
+        message = 'message {}'.format(index).encode()
+        signatures.append((b58decode(public_key), message,
+                           PrivateKey(private_key).sign(message, encoding='bytes')))
+    assert verify_batch(signatures)
+
+    public_key, message, signature = signatures[5]
+    signatures[5] = public_key, b'other message', signature
+    assert not verify_batch(signatures)
+    assert verify_signatures(signatures) == [True] * 5 + [False] + [True] * 2
+
+    # a signature whose `s` is not reduced
+    public_key, message, signature = signatures[0]
+    order = 2 ** 252 + 27742317777372353535851937790883648493
+    s = int.from_bytes(signature[32:], 'little') + order
+    assert not verify_batch([(public_key, message, signature[:32] + s.to_bytes(32, 'little'))])
@@ -89,6 +89,29 @@ def test_input_deserialization_with_unsigned_fulfillment(ffill_uri, user_pub):
     assert input == expected
 
 
+def test_lazy_input_deserialization(ffill_uri, user_pub):
+    from bigchaindb.common.exceptions import InvalidSignature
+    from bigchaindb.common.transaction import Input
+    from cryptoconditions import Fulfillment
+
+    ffill = {
+        'owners_before': [user_pub],
+        'fulfillment': ffill_uri,
+        'fulfills': None,
+    }
+    input = Input.from_dict(ffill, lazy=True)
+    assert input._fulfillment is None
+    assert input.to_dict() == ffill
+    assert input.fulfillment.serialize_uri() == ffill_uri
+    assert input == Input(Fulfillment.from_uri(ffill_uri), [user_pub])
+
+    # an invalid URI is only detected when it is parsed
+    input = Input.from_dict(dict(ffill, fulfillment='an invalid fulfillment'),
+                            lazy=True)
+    with raises(InvalidSignature):
+        input.fulfillment
+
+
 def test_output_serialization(user_Ed25519, user_pub):
     from bigchaindb.common.transaction import Output
 
@@ -129,6 +152,27 @@ def test_output_deserialization(user_Ed25519, user_pub):
     assert cond == expected
 
 
+def test_lazy_output_deserialization(user_Ed25519, user_pub):
+    from bigchaindb.common.transaction import Output
+
+    cond = {
+        'condition': {
+            'uri': user_Ed25519.condition_uri,
+            'details': {
+                'type': 'ed25519-sha-256',
+                'public_key': b58encode(user_Ed25519.public_key).decode(),
+            },
+        },
+        'public_keys': [user_pub],
+        'amount': '1',
+    }
+    output = Output.from_dict(cond, lazy=True)
+    assert output._fulfillment is None
+    assert output.to_dict() == cond
+    assert output.fulfillment.condition_uri == user_Ed25519.condition_uri
+    assert output == Output(user_Ed25519, [user_pub], 1)
+
+
 def test_output_hashlock_serialization():
     from bigchaindb.common.transaction import Output
     from cryptoconditions import PreimageSha256
@@ -653,7 +697,7 @@ def test_validate_inputs_of_transfer_tx_with_invalid_params(
     invalid_out = Output(Ed25519Sha256.from_uri(ffill_uri), ['invalid'])
     assert transfer_tx.inputs_valid([invalid_out]) is False
     invalid_out = utx.outputs[0]
-    invalid_out.public_key = 'invalid'
+    invalid_out.public_keys = ['invalid']
     assert transfer_tx.inputs_valid([invalid_out]) is True
 
     with raises(TypeError):
@@ -1008,6 +1052,31 @@ def test_transaction_hash(fulfilled_transaction):
     assert tx_obj.id == expected_hash_id
 
 
+def test_transaction_serializations_are_cached(user_pub, user_priv):
+    from bigchaindb.common.transaction import Transaction
+
+    tx = Transaction.create([user_pub], [([user_pub], 1)])
+    # a transaction without id can still change
+    assert tx._fulfillment_message() is not tx._fulfillment_message()
+
+    tx.sign([user_priv])
+    assert tx.serialized is tx.serialized
+    assert tx._fulfillment_message() is tx._fulfillment_message()
+
+
+def test_remove_signatures_leaves_transaction_unchanged(signed_transfer_tx):
+    from bigchaindb.common.transaction import Transaction
+
+    tx_dict = signed_transfer_tx.to_dict()
+    expected = deepcopy(tx_dict)
+    unsigned = Transaction._remove_signatures(tx_dict)
+    unsigned['id'] = None
+
+    assert tx_dict == expected
+    assert all(input_['fulfillment'] is None for input_ in unsigned['inputs'])
+    assert all(input_['fulfillment'] for input_ in tx_dict['inputs'])
+
+
 def test_output_from_dict_invalid_amount(user_output):
     from bigchaindb.common.transaction import Output
     from bigchaindb.common.exceptions import AmountError
@@ -136,16 +136,13 @@ def _bdb(_setup_database, _configure_bigchaindb):
     from bigchaindb import config
     from bigchaindb.backend import connect
     from .utils import flush_db
-    from bigchaindb.common.memoize import to_dict, from_dict
-    from bigchaindb.models import Transaction
+    from bigchaindb.common import cache
     conn = connect()
     yield
     dbname = config['database']['name']
     flush_db(conn, dbname)
 
-    to_dict.cache_clear()
-    from_dict.cache_clear()
-    Transaction._input_valid.cache_clear()
+    cache.reset()
 
 
 # We need this function to avoid loading an existing
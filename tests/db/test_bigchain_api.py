@@ -38,10 +38,12 @@ class TestBigchainApi(object):
         with pytest.raises(DoubleSpend):
             b.validate_transaction(transfer_tx2)
 
-        b.store_bulk_transactions([transfer_tx2])
-
+        # the `spent_outputs` collection rejects the double spend
         with pytest.raises(CriticalDoubleSpend):
-            b.get_spent(tx.id, 0)
+            b.store_bulk_transactions([transfer_tx2])
+
+        assert b.get_spent(tx.id, 0) == transfer_tx
+        assert b.get_transaction(transfer_tx2.id) is None
 
     def test_double_inclusion(self, b, alice):
         from bigchaindb.models import Transaction
@@ -448,48 +450,38 @@ def test_get_outputs_filtered_only_unspent():
     from bigchaindb.common.transaction import TransactionLink
     from bigchaindb.lib import BigchainDB
 
-    go = 'bigchaindb.fastquery.FastQuery.get_outputs_by_public_key'
+    go = 'bigchaindb.fastquery.FastQuery.get_owner_outputs'
     with patch(go) as get_outputs:
-        get_outputs.return_value = [TransactionLink('a', 1),
-                                    TransactionLink('b', 2)]
-        fs = 'bigchaindb.fastquery.FastQuery.filter_spent_outputs'
-        with patch(fs) as filter_spent:
-            filter_spent.return_value = [TransactionLink('b', 2)]
-            out = BigchainDB().get_outputs_filtered('abc', spent=False)
-    get_outputs.assert_called_once_with('abc')
+        get_outputs.return_value = [{'transaction_id': 'b', 'output_index': 2}]
+        out = BigchainDB().get_outputs_filtered('abc', spent=False)
+    get_outputs.assert_called_once_with(['abc'], False)
     assert out == [TransactionLink('b', 2)]
 
 
 def test_get_outputs_filtered_only_spent():
     from bigchaindb.common.transaction import TransactionLink
     from bigchaindb.lib import BigchainDB
-    go = 'bigchaindb.fastquery.FastQuery.get_outputs_by_public_key'
+    go = 'bigchaindb.fastquery.FastQuery.get_owner_outputs'
     with patch(go) as get_outputs:
-        get_outputs.return_value = [TransactionLink('a', 1),
-                                    TransactionLink('b', 2)]
-        fs = 'bigchaindb.fastquery.FastQuery.filter_unspent_outputs'
-        with patch(fs) as filter_spent:
-            filter_spent.return_value = [TransactionLink('b', 2)]
-            out = BigchainDB().get_outputs_filtered('abc', spent=True)
-    get_outputs.assert_called_once_with('abc')
+        get_outputs.return_value = [{'transaction_id': 'b', 'output_index': 2}]
+        out = BigchainDB().get_outputs_filtered('abc', spent=True)
+    get_outputs.assert_called_once_with(['abc'], True)
     assert out == [TransactionLink('b', 2)]
 
 
-@patch('bigchaindb.fastquery.FastQuery.filter_unspent_outputs')
-@patch('bigchaindb.fastquery.FastQuery.filter_spent_outputs')
-def test_get_outputs_filtered(filter_spent, filter_unspent):
+def test_get_outputs_filtered():
     from bigchaindb.common.transaction import TransactionLink
     from bigchaindb.lib import BigchainDB
 
-    go = 'bigchaindb.fastquery.FastQuery.get_outputs_by_public_key'
+    go = 'bigchaindb.fastquery.FastQuery.get_owner_outputs'
     with patch(go) as get_outputs:
-        get_outputs.return_value = [TransactionLink('a', 1),
-                                    TransactionLink('b', 2)]
-        out = BigchainDB().get_outputs_filtered('abc')
-    get_outputs.assert_called_once_with('abc')
-    filter_spent.assert_not_called()
-    filter_unspent.assert_not_called()
-    assert out == get_outputs.return_value
+        # the output 1 of `a` is owned by both public keys
+        get_outputs.return_value = [{'transaction_id': 'a', 'output_index': 1},
+                                    {'transaction_id': 'a', 'output_index': 1},
+                                    {'transaction_id': 'b', 'output_index': 2}]
+        out = BigchainDB().get_outputs_filtered(['abc', 'def'])
+    get_outputs.assert_called_once_with(['abc', 'def'], None)
+    assert out == [TransactionLink('a', 1), TransactionLink('b', 2)]
 
 
 def test_cant_spend_same_input_twice_in_tx(b, alice):
@@ -0,0 +1,178 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import json
+from io import BytesIO
+
+import pytest
+from abci import CodeTypeOk
+from abci import types_v0_31_5 as types
+from abci.application import BaseApplication
+from abci.encoding import read_messages, write_message
+
+from bigchaindb.common.cache import LRUCache
+from bigchaindb.common.crypto import generate_key_pair
+from bigchaindb.common.exceptions import InvalidHash, InvalidSignature
+from bigchaindb.models import Transaction
+from bigchaindb.parallel_validation import VALID, error_code
+
+
+def raw(transaction_dict):
+    return json.dumps(transaction_dict).encode('utf8')
+
+
+@pytest.fixture
+def transactions():
+    alice = generate_key_pair()
+    create_tx = Transaction.create([alice.public_key],
+                                   [([alice.public_key], 1)]).sign([alice.private_key])
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(),
+                                       [([alice.public_key], 1)],
+                                       asset_id=create_tx.id).sign([alice.private_key])
+    forged_tx = Transaction.create([alice.public_key],
+                                   [([alice.public_key], 2)]).sign([alice.private_key])
+    # the signature of another transaction
+    forged_tx = forged_tx.to_dict()
+    forged_tx['inputs'][0]['fulfillment'] = create_tx.inputs[0].fulfillment.serialize_uri()
+    forged_tx['id'] = None
+    forged_tx['id'] = Transaction._to_hash(Transaction._to_str(forged_tx))
+    return create_tx.to_dict(), transfer_tx.to_dict(), forged_tx
+
+
+def test_verify_transactions(transactions):
+    from bigchaindb.check_tx import verify_transactions
+
+    create_tx, transfer_tx, forged_tx = transactions
+    tampered_tx = dict(create_tx, metadata={'tampered': True})
+    assert verify_transactions([raw(create_tx), raw(forged_tx),
+                                raw(transfer_tx), raw(tampered_tx)]) == \
+        [VALID, error_code(InvalidSignature), VALID, error_code(InvalidHash)]
+
+
+class RecordingApp(BaseApplication):
+
+    def __init__(self):
+        super().__init__(types)
+        self.checked = []
+        self.verified_transactions = LRUCache(1024 * 1024)
+
+    def check_tx(self, raw_transaction, verified=False):
+        self.checked.append((raw_transaction, verified))
+        return self.abci.ResponseCheckTx(code=CodeTypeOk)
+
+
+def check_tx_request(transaction_dict):
+    return types.Request(check_tx=types.RequestCheckTx(tx=raw(transaction_dict)))
+
+
+def exchange(server, requests):
+    """Send ``requests`` on a new connection to ``server``, and return the
+    responses."""
+    import gevent
+    from gevent import socket
+
+    tendermint, abci = socket.socketpair()
+    greenlet = gevent.spawn(server.handle_connection, abci, ('tendermint', 0))
+    tendermint.sendall(b''.join(write_message(request) for request in requests))
+
+    data = b''
+    with gevent.Timeout(5):
+        while len(list(read_messages(BytesIO(data), types.Response))) < len(requests):
+            data += tendermint.recv(1024 * 8)
+    tendermint.shutdown(socket.SHUT_RDWR)
+    tendermint.close()
+    greenlet.join(timeout=5)
+    return list(read_messages(BytesIO(data), types.Response))
+
+
+def test_check_tx_server_answers_in_order(transactions):
+    from bigchaindb.check_tx import CheckTxServer
+
+    create_tx, transfer_tx, forged_tx = transactions
+    app = RecordingApp()
+    server = CheckTxServer(app=app, concurrency=2, queue_depth=3)
+
+    requests = [check_tx_request(tx) for tx in (create_tx, forged_tx, transfer_tx, create_tx)]
+    requests.append(types.Request(flush=types.RequestFlush()))
+    responses = exchange(server, requests)
+
+    assert [response.WhichOneof('value') for response in responses] == \
+        ['check_tx'] * 4 + ['flush']
+    # the forged transaction is invalid, and the last transaction is
+    # rejected as the queue is full
+    assert [response.check_tx.code for response in responses[:4]] == \
+        [CodeTypeOk, 1, CodeTypeOk, 1]
+    assert responses[3].check_tx.log == 'check_tx queue is full'
+    # the application only runs the state dependent checks
+    assert app.checked == [(raw(create_tx), True), (raw(transfer_tx), True)]
+    server.executor.shutdown()
+
+
+def test_check_tx_server_skips_verified_transactions(transactions, monkeypatch):
+    from hashlib import sha3_256
+    from bigchaindb.check_tx import CheckTxServer
+
+    create_tx, transfer_tx, _ = transactions
+    app = RecordingApp()
+    server = CheckTxServer(app=app, concurrency=2)
+    # the transaction is rechecked after a block
+    app.verified_transactions.put(sha3_256(raw(create_tx)).digest(), True)
+    submitted = []
+    submit = server.executor.submit
+    monkeypatch.setattr(server.executor, 'submit',
+                        lambda function, chunk: submitted.extend(chunk) or submit(function, chunk))
+
+    responses = exchange(server, [check_tx_request(create_tx), check_tx_request(transfer_tx),
+                                  types.Request(flush=types.RequestFlush())])
+
+    assert [response.check_tx.code for response in responses[:2]] == [CodeTypeOk, CodeTypeOk]
+    assert submitted == [raw(transfer_tx)]
+    assert app.checked == [(raw(create_tx), True), (raw(transfer_tx), True)]
+    server.executor.shutdown()
+
+
+def test_check_tx_server_serves_other_connections_directly(monkeypatch):
+    from bigchaindb.check_tx import CheckTxServer
+
+    server = CheckTxServer(app=RecordingApp())
+    monkeypatch.setattr(server, 'answer', None)
+    monkeypatch.setattr(server, 'submit', None)
+
+    responses = exchange(server, [types.Request(echo=types.RequestEcho(message='hello')),
+                                  types.Request(flush=types.RequestFlush())])
+
+    assert responses[0].echo.message == 'hello'
+    assert responses[1].WhichOneof('value') == 'flush'
+    server.executor.shutdown()
+
+
+def test_check_tx_server_waits_without_blocking_the_hub(transactions, monkeypatch):
+    import gevent
+    from concurrent.futures import Future
+    from threading import Timer
+    from bigchaindb.check_tx import CheckTxServer
+
+    create_tx, _, _ = transactions
+    server = CheckTxServer(app=RecordingApp(), concurrency=1)
+    # the pool verifies the transaction in 0.2 seconds
+    future = Future()
+    monkeypatch.setattr(server.executor, 'submit', lambda function, chunk: future)
+    Timer(0.2, future.set_result, ([VALID],)).start()
+
+    ticks = []
+
+    def tick():
+        while not future.done():
+            ticks.append(None)
+            gevent.sleep(0.01)
+
+    ticker = gevent.spawn(tick)
+    responses = exchange(server, [check_tx_request(create_tx), types.Request(flush=types.RequestFlush())])
+    ticker.join()
+
+    assert responses[0].check_tx.code == CodeTypeOk
+    # the other greenlets ran while the handler waited
+    assert len(ticks) > 5
+    server.executor.shutdown()
@@ -199,6 +199,29 @@ def test_info(a, b):
     assert res.last_block_app_hash == b'4'
 
 
+def test_query_returns_the_cache_stats(a, b):
+    from bigchaindb.models import Transaction
+
+    alice = generate_key_pair()
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+
+    app = App(a, b)
+    app.check_tx(encode_tx_to_bytes(tx))
+
+    res = app.query(types.RequestQuery(path='/caches'))
+    assert res.code == CodeTypeOk
+    stats = json.loads(res.value.decode('utf8'))
+    assert stats['validation']['entries'] == 1
+    assert set(stats['validation']) == {'entries', 'bytes', 'max_bytes', 'hits',
+                                        'misses', 'hit_rate', 'evictions'}
+
+    res = app.query(types.RequestQuery(path='/unknown'))
+    assert res.code == CodeTypeOk
+    assert res.value == b''
+
+
 def test_check_tx__signed_create_is_ok(a, b):
     from bigchaindb import App
     from bigchaindb.models import Transaction
@@ -232,6 +255,33 @@ def test_check_tx__unsigned_create_is_error(a, b):
     assert result.code == CodeTypeError
 
 
+def test_check_tx_result_is_reused_by_deliver_tx(a, b, init_chain_request):
+    from bigchaindb import App
+    from bigchaindb.models import Transaction
+    from bigchaindb.common.crypto import generate_key_pair
+
+    alice = generate_key_pair()
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    raw_tx = encode_tx_to_bytes(tx)
+
+    app = App(a, b)
+    app.init_chain(init_chain_request)
+
+    assert app.check_tx(raw_tx).code == CodeTypeOk
+    assert app.check_tx(raw_tx).code == CodeTypeOk
+    assert len(app.verified_transactions) == 1
+
+    app.begin_block(types.RequestBeginBlock())
+    assert app.deliver_tx(raw_tx).code == CodeTypeOk
+    assert len(app.verified_transactions) == 0
+
+    stats = app.verified_transactions.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+
+
 def test_deliver_tx__valid_create_updates_db_and_emits_event(a, b, init_chain_request):
     import multiprocessing as mp
     from bigchaindb import App
@@ -262,12 +312,12 @@ def test_deliver_tx__valid_create_updates_db_and_emits_event(a, b, init_chain_re
     block_event = events.get()
     assert block_event.data['transactions'] == [tx]
 
-    # unspent_outputs = b.get_unspent_outputs()
-    # unspent_output = next(unspent_outputs)
-    # expected_unspent_output = next(tx.unspent_outputs)._asdict()
-    # assert unspent_output == expected_unspent_output
-    # with pytest.raises(StopIteration):
-    #     next(unspent_outputs)
+    unspent_outputs = b.get_unspent_outputs()
+    unspent_output = next(unspent_outputs)
+    expected_unspent_output = next(tx.unspent_outputs)._asdict()
+    assert unspent_output == expected_unspent_output
+    with pytest.raises(StopIteration):
+        next(unspent_outputs)
 
 
 def test_deliver_tx__double_spend_fails(a, b, init_chain_request):
@@ -299,6 +349,142 @@ def test_deliver_tx__double_spend_fails(a, b, init_chain_request):
     assert result.code == CodeTypeError
 
 
+def test_commit_writes_behind(a, b, init_chain_request, monkeypatch):
+    import multiprocessing as mp
+    from threading import Event
+    from bigchaindb import config
+    from bigchaindb.lib import BigchainDB
+    from bigchaindb.models import Transaction
+
+    monkeypatch.setitem(config['commit'], 'mode', 'write_behind')
+    alice = generate_key_pair()
+    events = mp.Queue()
+    app = App(a, BigchainDB(b.connection, cache_chain_state=True), events)
+    app.init_chain(init_chain_request)
+
+    # the blocks are written once `written` is set
+    written = Event()
+    write = app.block_writer._write
+    monkeypatch.setattr(app.block_writer, '_write',
+                        lambda *args: written.wait() and write(*args))
+
+    tx = Transaction.create([alice.public_key], [([alice.public_key], 1)]).sign([alice.private_key])
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [([alice.public_key], 1)],
+                                       asset_id=tx.id).sign([alice.private_key])
+    double_spend = Transaction.transfer(tx.to_inputs(), [([alice.public_key], 2)],
+                                        asset_id=tx.id).sign([alice.private_key])
+
+    app.begin_block(types.RequestBeginBlock())
+    assert app.deliver_tx(encode_tx_to_bytes(tx)).code == CodeTypeOk
+    app.end_block(types.RequestEndBlock(height=1))
+    app.commit()
+    assert b.get_latest_block()['height'] == 0
+    assert app.bigchaindb.get_latest_block()['height'] == 1
+
+    # the next block sees the transactions of the block being written
+    assert app.check_tx(encode_tx_to_bytes(transfer_tx)).code == CodeTypeOk
+    app.begin_block(types.RequestBeginBlock())
+    assert app.deliver_tx(encode_tx_to_bytes(tx)).code == CodeTypeError
+    assert app.deliver_tx(encode_tx_to_bytes(transfer_tx)).code == CodeTypeOk
+    assert app.deliver_tx(encode_tx_to_bytes(double_spend)).code == CodeTypeError
+    assert events.empty()
+
+    written.set()
+    app.end_block(types.RequestEndBlock(height=2))
+    assert b.get_transaction(tx.id).id == tx.id
+    assert b.get_latest_block()['height'] == 1
+    assert b.get_pre_commit_state()['height'] == 2
+    assert events.get().data['transactions'] == [tx]
+
+    app.commit()
+    app.block_writer.wait()
+    assert b.get_transaction(transfer_tx.id).id == transfer_tx.id
+    assert b.get_latest_block()['height'] == 2
+    assert events.get().data['transactions'] == [transfer_tx]
+
+
+def test_block_written_behind_is_replayed_after_a_crash(a, b, init_chain_request, monkeypatch):
+    from bigchaindb import config
+    from bigchaindb.lib import BigchainDB
+    from bigchaindb.models import Transaction
+
+    monkeypatch.setitem(config['commit'], 'mode', 'write_behind')
+    alice = generate_key_pair()
+    app = App(a, BigchainDB(b.connection, cache_chain_state=True))
+    app.init_chain(init_chain_request)
+
+    tx = Transaction.create([alice.public_key], [([alice.public_key], 1)]).sign([alice.private_key])
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [([alice.public_key], 1)],
+                                       asset_id=tx.id).sign([alice.private_key])
+
+    app.begin_block(types.RequestBeginBlock())
+    app.deliver_tx(encode_tx_to_bytes(tx))
+    app.end_block(types.RequestEndBlock(height=1))
+    app.commit()
+
+    # the node crashes while the second block is written, after replying
+    # to the `Commit` request: only its transactions are stored
+    monkeypatch.setattr(app.block_writer, '_write',
+                        lambda block, transactions, callback:
+                        app.block_writer._writer.store_bulk_transactions(transactions, block['height']))
+    app.begin_block(types.RequestBeginBlock())
+    assert app.deliver_tx(encode_tx_to_bytes(transfer_tx)).code == CodeTypeOk
+    app.end_block(types.RequestEndBlock(height=2))
+    app.commit()
+    app.block_writer.wait()
+
+    # on restart, the last written block is reported to Tendermint, which
+    # replays the lost one
+    rollback(b)
+    app = App(a, BigchainDB(b.connection, cache_chain_state=True))
+    assert app.info(types.RequestInfo(version=__tm_supported_versions__[0])).last_block_height == 1
+    assert b.get_transaction(transfer_tx.id) is None
+
+    app.begin_block(types.RequestBeginBlock())
+    assert app.deliver_tx(encode_tx_to_bytes(transfer_tx)).code == CodeTypeOk
+    app.end_block(types.RequestEndBlock(height=2))
+    app.commit()
+    app.block_writer.wait()
+    assert b.get_latest_block()['height'] == 2
+    assert b.get_transaction(transfer_tx.id).id == transfer_tx.id
+
+
+def test_parallel_validation_waits_for_the_block_written_behind(a, b, init_chain_request, monkeypatch):
+    import time
+    from bigchaindb import config
+    from bigchaindb.lib import BigchainDB
+    from bigchaindb.models import Transaction
+    from bigchaindb.parallel_validation import ParallelValidationApp
+
+    class ParallelValidator:
+        def start(self):
+            pass
+
+    monkeypatch.setattr('bigchaindb.parallel_validation.ParallelValidator', ParallelValidator)
+    monkeypatch.setitem(config['commit'], 'mode', 'write_behind')
+    alice = generate_key_pair()
+    app = ParallelValidationApp(BigchainDB(b.connection, cache_chain_state=True), abci=a)
+    app.init_chain(init_chain_request)
+
+    tx = Transaction.create([alice.public_key], [([alice.public_key], 1)]).sign([alice.private_key])
+    app.begin_block(types.RequestBeginBlock())
+    app.block_txn_ids = [tx.id]
+    app.block_transactions = [tx]
+    super(ParallelValidationApp, app).end_block(types.RequestEndBlock(height=1))
+
+    # the block is written behind, slowly
+    write = app.block_writer._write
+    monkeypatch.setattr(app.block_writer, '_write',
+                        lambda *args: time.sleep(0.2) or write(*args))
+    app.commit()
+    assert b.get_latest_block()['height'] == 0
+
+    # the workers of the next block read the transactions in the database
+    app.begin_block(types.RequestBeginBlock())
+    assert b.get_latest_block()['height'] == 1
+    assert b.get_transaction(tx.id).id == tx.id
+
+
 def test_deliver_transfer_tx__double_spend_fails(a, b, init_chain_request):
     from bigchaindb import App
     from bigchaindb.models import Transaction
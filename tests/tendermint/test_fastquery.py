@@ -77,7 +77,6 @@ def test_filter_unspent_outputs(b, user_pk, user_sk):
 
 
 def test_outputs_query_key_order(b, user_pk, user_sk, user2_pk, user2_sk):
-    from bigchaindb import backend
     from bigchaindb.backend import connect
 
     tx1 = Transaction.create([user_pk],
@@ -93,7 +92,7 @@ def test_outputs_query_key_order(b, user_pk, user_sk, user2_pk, user2_sk):
     fulfills = tx2_dict['inputs'][0]['fulfills']
     tx2_dict['inputs'][0]['fulfills'] = {'transaction_id': fulfills['transaction_id'],
                                          'output_index': fulfills['output_index']}
-    backend.query.store_transactions(b.connection, [tx2_dict])
+    b.store_bulk_transactions([Transaction.from_dict(tx2_dict)])
 
     outputs = b.get_outputs_filtered(user_pk, spent=False)
     assert len(outputs) == 2
@@ -106,15 +105,52 @@ def test_outputs_query_key_order(b, user_pk, user_sk, user2_pk, user2_sk):
     conn.run(conn.collection('transactions').delete_many({}))
     conn.run(conn.collection('metadata').delete_many({}))
     conn.run(conn.collection('assets').delete_many({}))
+    conn.run(conn.collection('spent_outputs').delete_many({}))
+    conn.run(conn.collection('owner_outputs').delete_many({}))
 
     b.store_bulk_transactions([tx1])
     tx2_dict = tx2.to_dict()
     tx2_dict['inputs'][0]['fulfills'] = {'output_index': fulfills['output_index'],
                                          'transaction_id': fulfills['transaction_id']}
 
-    backend.query.store_transactions(b.connection, [tx2_dict])
+    b.store_bulk_transactions([Transaction.from_dict(tx2_dict)])
     outputs = b.get_outputs_filtered(user_pk, spent=False)
     assert len(outputs) == 2
 
     outputs = b.get_outputs_filtered(user2_pk, spent=False)
     assert len(outputs) == 1
+
+
+def test_get_owner_outputs(b, user_pk, user_sk, user2_pk, user2_sk, txns):
+    from bigchaindb.common.transaction import TransactionLink
+
+    # spend the output of user2, to both public keys
+    tx = Transaction.transfer([txns[2].to_inputs()[1]], [([user_pk, user2_pk], 1)],
+                              asset_id=txns[2].id).sign([user2_sk])
+    b.store_bulk_transactions([tx])
+
+    assert b.get_owner_outputs([user_pk, user2_pk], spent=True) == [
+        {'public_key': user2_pk, 'transaction_id': txns[2].id,
+         'output_index': 1, 'amount': 1, 'asset_id': txns[2].id, 'spent': True}]
+    outputs = b.get_owner_outputs([user_pk, user2_pk], spent=False)
+    assert [(o['public_key'], o['transaction_id']) for o in outputs[-2:]] == \
+        sorted([(user_pk, tx.id), (user2_pk, tx.id)])
+    assert b.get_outputs_filtered([user_pk, user2_pk])[-1] == TransactionLink(tx.id, 0)
+    assert len(b.get_outputs_filtered([user_pk, user2_pk])) == 5
+
+    # rolling the transaction back unspends its input
+    b.delete_transactions([tx.id])
+    assert b.get_owner_outputs([user_pk, user2_pk], spent=True) == []
+    assert len(b.get_outputs_filtered([user_pk, user2_pk])) == 4
+
+
+def test_owner_outputs(user_pk, user2_pk):
+    from bigchaindb.fastquery import owner_outputs
+
+    tx = Transaction.create([user_pk], [([user_pk], 2), ([user_pk, user2_pk], 3)])
+    records = owner_outputs(tx.to_dict(), spent={(tx.id, 0)})
+    assert [(r['public_key'], r['output_index'], r['amount'], r['spent']) for r in records] == [
+        (user_pk, 0, 2, True),
+        *sorted([(user_pk, 1, 3, False), (user2_pk, 1, 3, False)]),
+    ]
+    assert {r['asset_id'] for r in records} == {tx.id}
@@ -152,6 +152,17 @@ def test_post_transaction_invalid_mode(b):
         b.write_transaction(tx, 'nope')
 
 
+@pytest.mark.bdb
+def test_validate_transaction_verifies_signatures_in_batch(b, alice, user_pk, user_sk):
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key, user_pk], [([user_pk], 1)])
+    tx.sign([alice.private_key, user_sk])
+
+    transaction = b.validate_transaction(tx.to_dict())
+    assert transaction.signatures_verified
+
+
 @pytest.mark.bdb
 def test_update_utxoset(b, signed_create_tx, signed_transfer_tx, db_context):
     mongo_client = MongoClient(host=db_context.host, port=db_context.port)
@@ -168,6 +179,61 @@ def test_update_utxoset(b, signed_create_tx, signed_transfer_tx, db_context):
     assert utxo['output_index'] == 0
 
 
+@pytest.mark.bdb
+def test_update_utxoset_with_many_transactions(b, signed_create_tx,
+                                               signed_transfer_tx, db_context):
+    mongo_client = MongoClient(host=db_context.host, port=db_context.port)
+    b.update_utxoset(signed_create_tx, signed_transfer_tx)
+    utxoset = mongo_client[db_context.name]['utxos']
+    assert utxoset.count_documents({}) == 1
+    assert b.get_unspent_output(signed_create_tx.id, 0) is None
+    assert b.get_unspent_output(signed_transfer_tx.id, 0) == \
+        next(signed_transfer_tx.unspent_outputs)
+
+    # applying the same transactions again is a no-op
+    b.update_utxoset(signed_create_tx, signed_transfer_tx)
+    assert utxoset.count_documents({}) == 1
+
+
+@pytest.mark.bdb
+def test_rebuild_utxoset(b, signed_create_tx, signed_transfer_tx, db_context):
+    from bigchaindb.merkle import leaf_hash, utxo_hash
+    mongo_client = MongoClient(host=db_context.host, port=db_context.port)
+    utxoset = mongo_client[db_context.name]['utxos']
+    utxoset.insert_one({'transaction_id': 'stale', 'output_index': 0})
+    b.store_bulk_transactions([signed_create_tx, signed_transfer_tx])
+    spent_outputs = mongo_client[db_context.name]['spent_outputs']
+    spent_outputs.delete_many({})
+
+    assert b.rebuild_utxoset() == 1
+    assert utxoset.count_documents({}) == 1
+    assert b.get_spent_outputs([(signed_create_tx.id, 0)]) == {(signed_create_tx.id, 0)}
+    assert b.get_unspent_output(signed_transfer_tx.id, 0) == \
+        next(signed_transfer_tx.unspent_outputs)
+    assert b.get_utxoset_merkle_root() == \
+        leaf_hash(utxo_hash(signed_transfer_tx.id, 0)).hex()
+
+
+@pytest.mark.bdb
+def test_validate_transfer_inputs_with_utxoset(b, signed_create_tx,
+                                               signed_transfer_tx,
+                                               double_spend_tx):
+    from bigchaindb.common.exceptions import DoubleSpend
+
+    b.update_utxoset(signed_create_tx)
+    with patch('bigchaindb.backend.query.get_spent') as get_spent:
+        assert b.validate_transaction(signed_transfer_tx) == signed_transfer_tx
+        assert not get_spent.called
+
+    with pytest.raises(DoubleSpend):
+        b.validate_transaction(double_spend_tx, [signed_transfer_tx])
+
+    b.update_utxoset(signed_transfer_tx)
+    b.store_bulk_transactions([signed_create_tx, signed_transfer_tx])
+    with pytest.raises(DoubleSpend):
+        b.validate_transaction(double_spend_tx)
+
+
 @pytest.mark.bdb
 def test_store_transaction(mocker, b, signed_create_tx,
                            signed_transfer_tx, db_context):
@@ -345,13 +411,16 @@ def test_get_utxoset_merkle_root_when_no_utxo(b):
 
 
 @pytest.mark.bdb
-@pytest.mark.usefixture('utxoset')
-def test_get_utxoset_merkle_root(b, utxoset):
+def test_get_utxoset_merkle_root(b, dummy_unspent_outputs):
     expected_merkle_root = (
-        '86d311c03115bf4d287f8449ca5828505432d69b82762d47077b1c00fe426eac')
+        'a63f60536c6ee9d5c3756a10506f3285f5ec47409153d94edd52bc2e4efa4e9e')
+    b.store_unspent_outputs(*dummy_unspent_outputs)
     merkle_root = b.get_utxoset_merkle_root()
     assert merkle_root == expected_merkle_root
 
+    b.delete_unspent_outputs(*dummy_unspent_outputs)
+    assert b.get_utxoset_merkle_root() == sha3_256(b'').hexdigest()
+
 
 @pytest.mark.bdb
 def test_get_spent_transaction_critical_double_spend(b, alice, bob, carol):
@@ -397,10 +466,59 @@ def test_get_spent_transaction_critical_double_spend(b, alice, bob, carol):
     with pytest.raises(DoubleSpend):
         b.get_spent(tx.id, tx_transfer.inputs[0].fulfills.output, [double_spend])
 
-    b.store_bulk_transactions([double_spend])
+    with pytest.raises(CriticalDoubleSpend):
+        b.store_bulk_transactions([double_spend])
+
+    assert b.get_spent(tx.id, tx_transfer.inputs[0].fulfills.output) == tx_transfer
+
+
+@pytest.mark.bdb
+def test_store_bulk_transactions_leaves_no_spent_output_on_double_spend(b, alice, bob):
+    from bigchaindb.exceptions import CriticalDoubleSpend
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key], [([alice.public_key], 1), ([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    inputs = tx.to_inputs()
+    spend = Transaction.transfer([inputs[0]], [([bob.public_key], 1)], asset_id=tx.id)\
+                       .sign([alice.private_key])
+    b.store_bulk_transactions([tx, spend])
 
+    other_spend = Transaction.transfer([inputs[1]], [([bob.public_key], 1)], asset_id=tx.id)\
+                             .sign([alice.private_key])
+    double_spend = Transaction.transfer([inputs[0]], [([alice.public_key], 1)], asset_id=tx.id)\
+                              .sign([alice.private_key])
     with pytest.raises(CriticalDoubleSpend):
-        b.get_spent(tx.id, tx_transfer.inputs[0].fulfills.output)
+        b.store_bulk_transactions([other_spend, double_spend])
+
+    # none of the outputs spent by the rejected block are recorded
+    links = [(tx.id, 0), (tx.id, 1)]
+    assert [spent_output['spent_by']
+            for spent_output in backend.query.get_spent_outputs(b.connection, links)] == [spend.id]
+
+    # the block can be stored without the double spend
+    b.store_bulk_transactions([other_spend])
+    assert b.get_spent(tx.id, 1) == other_spend
+
+
+@pytest.mark.bdb
+def test_get_spent_builds_the_transaction_read(b, alice, bob):
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key], [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    tx_transfer = Transaction.transfer(tx.to_inputs(), [([bob.public_key], 1)],
+                                       asset_id=tx.id, metadata={'spent': True})\
+                             .sign([alice.private_key])
+    b.store_bulk_transactions([tx, tx_transfer])
+
+    # the spending transaction is not read again
+    with patch('bigchaindb.backend.query.get_full_transactions') as get_full_transactions:
+        spent = b.get_spent(tx.id, 0)
+    get_full_transactions.assert_not_called()
+    assert spent.to_dict() == tx_transfer.to_dict()
+
+    assert Transaction.from_db(b, []) == []
 
 
 def test_validation_with_transaction_buffer(b):
@@ -457,6 +575,74 @@ def test_migrate_abci_chain_generates_new_chains(b, chain, block_height,
     assert latest_chain == expected
 
 
+def store_without_indexes(b, transactions):
+    """Store the transactions and their blocks as a release of BigchainDB
+    which didn't maintain the tables derived from them."""
+    for height, transaction in enumerate(transactions, 1):
+        tx_dict = transaction.to_dict()
+        backend.query.store_metadatas(b.connection, [{'id': transaction.id,
+                                                      'metadata': tx_dict.pop('metadata')}])
+        if transaction.operation == 'CREATE':
+            backend.query.store_assets(b.connection, [dict(tx_dict.pop('asset'), id=transaction.id)])
+        backend.query.store_transactions(b.connection, [tx_dict])
+        b.store_block(Block(app_hash='', height=height, transactions=[transaction.id])._asdict())
+
+
+@pytest.mark.bdb
+def test_migrate(b, alice):
+    from bigchaindb.backend.schema import SCHEMA_VERSION
+    from bigchaindb.models import Transaction
+
+    # a new database
+    assert not b.migrate()
+    assert backend.query.get_schema_version(b.connection) == SCHEMA_VERSION
+
+    create_tx = Transaction.create([alice.public_key], [([alice.public_key], 1)]).sign([alice.private_key])
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(), [([alice.public_key], 1)],
+                                       asset_id=create_tx.id).sign([alice.private_key])
+    backend.query.store_schema_version(b.connection, None)
+    store_without_indexes(b, [create_tx, transfer_tx])
+    assert b.get_spent(create_tx.id, 0) is None
+
+    # an upgraded database
+    assert b.migrate()
+    assert b.get_spent(create_tx.id, 0).id == transfer_tx.id
+    assert backend.query.get_schema_version(b.connection) == SCHEMA_VERSION
+    assert not b.migrate()
+
+
+@pytest.mark.bdb
+def test_migrate_lists_the_outputs(b, alice, bob):
+    from bigchaindb.common.transaction import TransactionLink
+    from bigchaindb.models import Transaction
+
+    create_tx = Transaction.create([alice.public_key], [([alice.public_key], 1)]).sign([alice.private_key])
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(), [([bob.public_key], 1)],
+                                       asset_id=create_tx.id).sign([alice.private_key])
+    store_without_indexes(b, [create_tx, transfer_tx])
+    assert b.get_outputs_filtered(alice.public_key) == []
+
+    b.migrate()
+    assert b.get_outputs_filtered(alice.public_key) == [TransactionLink(create_tx.id, 0)]
+    assert b.get_outputs_filtered(alice.public_key, spent=True) == [TransactionLink(create_tx.id, 0)]
+    assert b.get_outputs_filtered(bob.public_key, spent=False) == [TransactionLink(transfer_tx.id, 0)]
+
+
+@pytest.mark.bdb
+def test_migrate_lists_the_transactions_of_an_asset(b, alice):
+    from bigchaindb.models import Transaction
+
+    create_tx = Transaction.create([alice.public_key], [([alice.public_key], 1)]).sign([alice.private_key])
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(), [([alice.public_key], 1)],
+                                       asset_id=create_tx.id).sign([alice.private_key])
+    store_without_indexes(b, [create_tx, transfer_tx])
+    assert list(b.get_transactions_filtered(create_tx.id)) == []
+
+    b.migrate()
+    assert [tx.id for tx in b.get_transactions_filtered(create_tx.id)] == [create_tx.id, transfer_tx.id]
+    assert [tx.id for tx in b.get_transactions_filtered(create_tx.id, last_tx=True)] == [transfer_tx.id]
+
+
 @pytest.mark.bdb
 def test_get_spent_key_order(b, user_pk, user_sk, user2_pk, user2_sk):
     from bigchaindb import backend
@@ -483,8 +669,41 @@ def test_get_spent_key_order(b, user_pk, user_sk, user2_pk, user2_sk):
                                          'transaction_id': fulfills['transaction_id']}
 
     backend.query.store_transactions(b.connection, [tx2_dict])
+    backend.query.store_spent_outputs(b.connection, [dict(fulfills, spent_by=tx2.id, height=1)])
 
     tx3 = Transaction.transfer([inputs[1]], [([bob.public_key], 2)], tx1.id).sign([user_sk])
 
     with pytest.raises(DoubleSpend):
         tx3.validate(b)
+
+
+@pytest.mark.bdb
+def test_committed_documents_are_cached(b, signed_create_tx, signed_transfer_tx):
+    from bigchaindb.common import cache
+
+    b.store_bulk_transactions([signed_create_tx, signed_transfer_tx])
+    # the two transactions, the asset and the two metadata
+    assert cache.stats()['documents']['entries'] == 5
+
+    with patch('bigchaindb.backend.query.get_full_transactions') as get_full_transactions, \
+            patch('bigchaindb.backend.query.get_assets') as get_assets, \
+            patch('bigchaindb.backend.query.get_transaction_outputs') as get_transaction_outputs:
+        assert b.get_transaction(signed_transfer_tx.id).to_dict() == signed_transfer_tx.to_dict()
+        assert b.get_assets([signed_create_tx.id]) == [dict(signed_create_tx.asset, id=signed_create_tx.id)]
+        outputs = b.get_transaction_outputs({signed_create_tx.id})
+        assert outputs[signed_create_tx.id][0].asset_id == signed_create_tx.id
+    assert not get_full_transactions.called
+    assert not get_assets.called
+    assert not get_transaction_outputs.called
+
+    # the documents of a rolled back transaction are dropped
+    b.delete_transactions([signed_transfer_tx.id])
+    assert b.get_transaction(signed_transfer_tx.id) is None
+    assert b.get_metadata([signed_transfer_tx.id]) == []
+
+    # the documents read from the database are cached
+    cache.reset()
+    assert b.get_transaction(signed_create_tx.id).to_dict() == signed_create_tx.to_dict()
+    assert b.get_transaction(signed_create_tx.id).to_dict() == signed_create_tx.to_dict()
+    stats = cache.stats()['documents']
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
@@ -4,7 +4,6 @@
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
 import base64
-import json
 
 try:
     from hashlib import sha3_256
@@ -13,6 +12,7 @@ except ImportError:
 
 
 def test_encode_decode_transaction(b):
+    from bigchaindb.common.utils import serialize
     from bigchaindb.tendermint_utils import (encode_transaction,
                                              decode_transaction)
 
@@ -21,7 +21,7 @@ def test_encode_decode_transaction(b):
     }
 
     encode_tx = encode_transaction(asset)
-    new_encode_tx = base64.b64encode(json.dumps(asset).
+    new_encode_tx = base64.b64encode(serialize(asset).
                                      encode('utf8')).decode('utf8')
 
     assert encode_tx == new_encode_tx
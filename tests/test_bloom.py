@@ -0,0 +1,132 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from unittest.mock import Mock
+
+import pytest
+
+from bigchaindb.bloom import BloomFilter, CommittedTransactions, ScalableBloomFilter
+
+
+def keys(start, stop):
+    return ['{:064x}'.format(i) for i in range(start, stop)]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter(1000, 0.01)
+    assert (bloom_filter.size, bloom_filter.hashes) == (9586, 7)
+
+    for key in keys(0, 1000):
+        bloom_filter.add(key)
+    assert all(key in bloom_filter for key in keys(0, 1000))
+    false_positives = sum(key in bloom_filter for key in keys(1000, 11000))
+    assert false_positives < 200
+
+
+def test_scalable_bloom_filter_grows():
+    bloom_filter = ScalableBloomFilter(100, 0.01)
+    for key in keys(0, 1000):
+        bloom_filter.add(key)
+
+    assert len(bloom_filter) == 1000
+    assert [(f.capacity, f.count) for f in bloom_filter.filters] == \
+        [(100, 100), (200, 200), (400, 400), (800, 300)]
+    assert all(key in bloom_filter for key in keys(0, 1000))
+    assert sum(key in bloom_filter for key in keys(1000, 11000)) < 400
+
+
+def test_scalable_bloom_filter_dump_and_load(tmpdir):
+    path = str(tmpdir.join('filter'))
+    bloom_filter = ScalableBloomFilter(10, 0.01)
+    for key in keys(0, 15):
+        bloom_filter.add(key)
+    bloom_filter.dump({'height': 3}, path)
+
+    loaded, header = ScalableBloomFilter.load(path)
+    assert header == {'height': 3}
+    assert len(loaded) == 15
+    assert [f.bits for f in loaded.filters] == [f.bits for f in bloom_filter.filters]
+
+    with open(path, 'rb+') as snapshot:
+        snapshot.truncate(snapshot.seek(0, 2) - 1)
+    with pytest.raises(ValueError):
+        ScalableBloomFilter.load(path)
+
+
+@pytest.fixture
+def query(monkeypatch):
+    blocks = {
+        1: {'height': 1, 'app_hash': 'a', 'transactions': ['t1']},
+        2: {'height': 2, 'app_hash': 'b', 'transactions': ['t2', 't3']},
+    }
+    query = Mock()
+    query.get_transaction_ids.side_effect = lambda conn: iter(['t1', 't2', 't3'])
+    query.get_latest_block.side_effect = lambda conn: blocks[max(blocks)]
+    query.get_block.side_effect = lambda conn, height: blocks.get(height)
+    query.blocks = blocks
+    monkeypatch.setattr('bigchaindb.backend.query', query)
+    return query
+
+
+def test_committed_transactions_are_loaded_on_first_use(query):
+    committed = CommittedTransactions(Mock(), 100, 0.001)
+    assert committed.filter is None
+
+    assert 't2' in committed
+    assert 't4' not in committed
+    committed.add(['t4'])
+    assert 't4' in committed
+    assert query.get_transaction_ids.call_count == 1
+
+    committed.reset()
+    assert 't4' not in committed
+    assert query.get_transaction_ids.call_count == 2
+
+    # the filter is loaded before adding ids, which may not be stored yet
+    committed.reset()
+    committed.add(['t4'])
+    assert 't1' in committed and 't4' in committed
+    assert query.get_transaction_ids.call_count == 3
+
+
+def test_committed_transactions_snapshot(query, tmpdir):
+    path = str(tmpdir.join('committed.bloom'))
+    committed = CommittedTransactions(Mock(), 100, 0.001, path, snapshot_interval=2)
+    assert 't1' in committed
+    assert committed.snapshot_height == 2
+
+    committed.add(['t4'])
+    query.blocks[3] = {'height': 3, 'app_hash': 'c', 'transactions': ['t4']}
+    committed.store_block(query.blocks[3])
+    assert committed.snapshot_height == 2
+    committed.add(['t5'])
+    query.blocks[4] = {'height': 4, 'app_hash': 'd', 'transactions': ['t5']}
+    committed.add(['t6'])
+    query.blocks[5] = {'height': 5, 'app_hash': 'e', 'transactions': ['t6']}
+
+    # the blocks stored since the snapshot are read on restart
+    restarted = CommittedTransactions(Mock(), 100, 0.001, path, snapshot_interval=2)
+    assert all(txid in restarted for txid in ['t1', 't2', 't3', 't4', 't5', 't6'])
+    assert restarted.snapshot_height == 2
+    assert query.get_transaction_ids.call_count == 1
+    assert [call[0][1] for call in query.get_block.call_args_list] == [2, 3, 4, 5]
+
+    # a snapshot of another chain is ignored
+    query.blocks[2] = dict(query.blocks[2], app_hash='other')
+    query.get_transaction_ids.side_effect = lambda conn: iter(['t1'])
+    restarted = CommittedTransactions(Mock(), 100, 0.001, path)
+    assert 't1' in restarted
+    assert 't6' not in restarted
+    assert restarted.snapshot_height == 5
+
+
+def test_bigchain_checks_committed_transactions_in_filter(query):
+    from bigchaindb.lib import BigchainDB
+
+    query.get_transaction.return_value = {'id': 't1'}
+    b = BigchainDB(Mock(), cache_chain_state=True)
+    assert b.is_committed('t1')
+    assert not b.is_committed('t4')
+    assert query.get_transaction.call_count == 1
@@ -0,0 +1,99 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from unittest.mock import Mock
+
+import pytest
+
+from bigchaindb.chain_state import MISSING, ChainState
+
+
+def validator_set(height):
+    return {'height': height, 'validators': [{'voting_power': height}]}
+
+
+def test_chain_state_validator_sets():
+    state = ChainState()
+    assert state.get_validator_set() is MISSING
+    state.store_validator_set(validator_set(1))
+    assert state.validator_sets is MISSING
+
+    state.validator_sets = [validator_set(1)]
+    state.store_validator_set(validator_set(5))
+    assert state.get_validator_set() == validator_set(5)
+    assert state.get_validator_set(4) == validator_set(1)
+    assert state.get_validator_set(5) == validator_set(5)
+    assert state.get_validator_set(0) is MISSING
+
+    state.delete_validator_set(5)
+    assert state.get_validator_set(10) == validator_set(1)
+
+    # a validator set older than the latest one can't be applied
+    state.store_validator_set(validator_set(0))
+    assert state.validator_sets is MISSING
+
+
+def test_chain_state_copies_stored_records():
+    state = ChainState()
+    state.latest_block = None
+    block = {'height': 1, 'app_hash': '', 'transactions': []}
+    state.store_block(block)
+    block['transactions'].append('txid')
+    assert state.latest_block['transactions'] == []
+
+    state.store_block({'height': 0, 'app_hash': '', 'transactions': []})
+    assert state.latest_block['height'] == 1
+
+
+@pytest.fixture
+def query(monkeypatch):
+    query = Mock()
+    query.get_latest_block.return_value = {'height': 3, 'app_hash': 'hash',
+                                           'transactions': []}
+    query.get_latest_abci_chain.return_value = {'height': 0,
+                                                'chain_id': 'chain',
+                                                'is_synced': True}
+    query.get_validator_set.return_value = validator_set(1)
+    monkeypatch.setattr('bigchaindb.backend.query', query)
+    return query
+
+
+def test_bigchain_caches_chain_state(query):
+    from bigchaindb.lib import BigchainDB
+
+    b = BigchainDB(Mock(), cache_chain_state=True)
+    for _ in range(2):
+        assert b.get_latest_block()['height'] == 3
+        assert b.get_latest_abci_chain()['chain_id'] == 'chain'
+        assert b.get_validators() == validator_set(1)['validators']
+    assert query.get_latest_block.call_count == 1
+    assert query.get_latest_abci_chain.call_count == 1
+    assert query.get_validator_set.call_count == 1
+
+    b.store_block({'height': 4, 'app_hash': 'new', 'transactions': []})
+    b.store_validator_set(5, validator_set(5)['validators'])
+    b.store_abci_chain(5, 'chain-migrated', False)
+    assert b.get_latest_block()['app_hash'] == 'new'
+    assert b.get_validators(4) == validator_set(1)['validators']
+    assert b.get_validators(5) == validator_set(5)['validators']
+    assert b.get_latest_abci_chain()['chain_id'] == 'chain-migrated'
+
+    b.get_validators()[0]['voting_power'] = 10
+    assert b.get_validators() == validator_set(5)['validators']
+
+    b.delete_abci_chain(5)
+    b.get_latest_abci_chain()
+    assert query.get_latest_abci_chain.call_count == 2
+    assert query.get_latest_block.call_count == 1
+    assert query.get_validator_set.call_count == 1
+
+
+def test_bigchain_does_not_cache_chain_state_by_default(query):
+    from bigchaindb.lib import BigchainDB
+
+    b = BigchainDB(Mock())
+    b.get_latest_block()
+    b.get_latest_block()
+    assert query.get_latest_block.call_count == 2
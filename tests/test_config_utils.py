@@ -200,6 +200,20 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch, request):
         'keyfile': 'keyfile',
         'keyfile_passphrase': 'passphrase',
         'crlfile': 'crlfile',
+        'durability': None,
+        'durability_profiles': {
+            'fast': {
+                'default': {'w': 1, 'j': False},
+            },
+            'balanced': {
+                'default': {'w': 1, 'j': False},
+                'blocks': {'w': 'majority', 'j': True},
+                'pre_commit': {'w': 'majority', 'j': True},
+            },
+            'safe': {
+                'default': {'w': 'majority', 'j': True},
+            },
+        },
     }
 
     assert bigchaindb.config == {
@@ -218,6 +232,26 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch, request):
             'advertised_port': WSSERVER_ADVERTISED_PORT,
         },
         'database': database_mongodb,
+        'cache': {
+            'validation': 8 * 1024 * 1024,
+            'transactions': 32 * 1024 * 1024,
+            'transaction_dicts': 16 * 1024 * 1024,
+            'inputs': 4 * 1024 * 1024,
+            'documents': 64 * 1024 * 1024,
+        },
+        'commit': {
+            'mode': 'sync',
+        },
+        'committed_filter': {
+            'capacity': 1000000,
+            'error_rate': 0.001,
+            'snapshot': None,
+            'snapshot_interval': 1000,
+        },
+        'check_tx': {
+            'concurrency': 0,
+            'queue_depth': 1024,
+        },
         'tendermint': {
             'host': 'localhost',
             'port': 26657,
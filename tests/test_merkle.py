@@ -0,0 +1,48 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import pytest
+
+from bigchaindb.merkle import SparseMerkleTree, utxo_hash, verify_proof
+
+
+pytestmark = pytest.mark.bdb
+
+
+@pytest.fixture
+def keys():
+    return [utxo_hash('tx{}'.format(i), i % 3) for i in range(50)]
+
+
+def test_root_only_depends_on_the_keys(b, keys):
+    tree = SparseMerkleTree(b.connection)
+    empty_root = tree.root
+
+    tree.update(keys[:30])
+    tree.update(keys[30:], keys[:10])
+    # inserting or deleting twice is a no-op
+    tree.update(keys[30:], keys[:10])
+    root = tree.root
+
+    tree.clear()
+    assert tree.root == empty_root
+    tree.update(reversed(keys[10:]))
+    assert tree.root == root
+
+    tree.update(deleted=keys)
+    assert tree.root == empty_root
+    assert not list(b.connection.db.utxo_tree.find())
+
+
+def test_inclusion_proofs(b, keys):
+    tree = SparseMerkleTree(b.connection)
+    tree.update(keys[:40])
+    root = tree.root
+
+    for key in keys[:40]:
+        assert verify_proof(root, key, tree.get_proof(key))
+
+    assert tree.get_proof(keys[45]) is None
+    assert not verify_proof(root, keys[45], tree.get_proof(keys[0]))
@@ -0,0 +1,52 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from bigchaindb.models import Transaction
+from bigchaindb.overlay import BlockOverlay
+
+
+def generate_create_and_transfer(keypair):
+    create_tx = Transaction.create([keypair.public_key],
+                                   [([keypair.public_key], 10)])\
+                           .sign([keypair.private_key])
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(),
+                                       [([keypair.public_key], 10)],
+                                       asset_id=create_tx.id)\
+                             .sign([keypair.private_key])
+    return create_tx, transfer_tx
+
+
+def test_block_overlay_indexes_transactions(alice):
+    create_tx, transfer_tx = generate_create_and_transfer(alice)
+
+    overlay = BlockOverlay()
+    assert create_tx.id not in overlay
+    assert not overlay.get_spending_transactions(create_tx.id, 0)
+
+    overlay.add(create_tx)
+    overlay.add(transfer_tx)
+
+    assert len(overlay) == 2
+    assert list(overlay) == [create_tx, transfer_tx]
+    assert create_tx.id in overlay
+    assert overlay.get_transaction(transfer_tx.id) == transfer_tx
+    assert overlay.get_output(create_tx.id, 0) == create_tx.outputs[0]
+    assert overlay.get_output(create_tx.id, 1) is None
+    assert overlay.get_spending_transactions(create_tx.id, 0) == [transfer_tx]
+    assert overlay.get_spending_transactions(transfer_tx.id, 0) == []
+
+    overlay.reset()
+    assert len(overlay) == 0
+    assert create_tx.id not in overlay
+    assert overlay.get_output(create_tx.id, 0) is None
+
+
+def test_block_overlay_wrap(alice):
+    create_tx, transfer_tx = generate_create_and_transfer(alice)
+
+    overlay = BlockOverlay.wrap([create_tx, transfer_tx])
+    assert isinstance(overlay, BlockOverlay)
+    assert overlay.get_spending_transactions(create_tx.id, 0) == [transfer_tx]
+    assert BlockOverlay.wrap(overlay) is overlay
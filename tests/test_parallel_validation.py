@@ -25,8 +25,11 @@ def generate_create_and_transfer(keypair=None):
 
 
 def test_validation_worker_process_multiple_transactions(b):
-    import multiprocessing as mp
-    from bigchaindb.parallel_validation import ValidationWorker, RESET, EXIT
+    from json import dumps
+    from bigchaindb.common.exceptions import DoubleSpend
+    from bigchaindb.parallel_validation import (ValidationWorker, RingBuffer,
+                                                ResultArray, RESET, EXIT,
+                                                VALID, error_code)
 
     keypair = generate_key_pair()
     create_tx, transfer_tx = generate_create_and_transfer(keypair)
@@ -35,39 +38,42 @@ def test_validation_worker_process_multiple_transactions(b):
             [([keypair.public_key], 10)],
             asset_id=create_tx.id).sign([keypair.private_key])
 
-    in_queue, results_queue = mp.Queue(), mp.Queue()
-    vw = ValidationWorker(in_queue, results_queue)
+    def raw(transaction):
+        return dumps(transaction.to_dict()).encode('utf8')
+
+    in_buffer, results = RingBuffer(64 * 1024), ResultArray(16)
+    vw = ValidationWorker(in_buffer, results)
 
     # Note: in the following instructions, the worker will encounter two
     # `RESET` messages, and an `EXIT` message. When a worker processes a
     # `RESET` message, it forgets all transactions it has validated. This allow
     # us to re-validate the same transactions. This won't happen in real life,
     # but it's quite handy to check if the worker actually forgot about the
-    # past transactions (if not, it will return `False` because the
+    # past transactions (if not, it will return an error code because the
     # transactions look like a double spend).
     # `EXIT` makes the worker to stop the infinite loop.
-    in_queue.put((0, create_tx.to_dict()))
-    in_queue.put((10, transfer_tx.to_dict()))
-    in_queue.put((20, double_spend.to_dict()))
-    in_queue.put(RESET)
-    in_queue.put((0, create_tx.to_dict()))
-    in_queue.put((5, transfer_tx.to_dict()))
-    in_queue.put(RESET)
-    in_queue.put((20, create_tx.to_dict()))
-    in_queue.put((25, double_spend.to_dict()))
-    in_queue.put((30, transfer_tx.to_dict()))
-    in_queue.put(EXIT)
+    in_buffer.put(0, raw(create_tx))
+    in_buffer.put(1, raw(transfer_tx))
+    in_buffer.put(2, raw(double_spend))
+    in_buffer.put(RESET)
+    in_buffer.put(3, raw(create_tx))
+    in_buffer.put(4, raw(transfer_tx))
+    in_buffer.put(RESET)
+    in_buffer.put(5, raw(create_tx))
+    in_buffer.put(6, raw(double_spend))
+    in_buffer.put(7, raw(transfer_tx))
+    in_buffer.put(EXIT)
 
     vw.run()
 
-    assert results_queue.get() == (0, create_tx)
-    assert results_queue.get() == (10, transfer_tx)
-    assert results_queue.get() == (20, False)
-    assert results_queue.get() == (0, create_tx)
-    assert results_queue.get() == (5, transfer_tx)
-    assert results_queue.get() == (20, create_tx)
-    assert results_queue.get() == (25, double_spend)
-    assert results_queue.get() == (30, False)
+    assert results.get(0) == VALID
+    assert results.get(1) == VALID
+    assert results.get(2) == error_code(DoubleSpend)
+    assert results.get(3) == VALID
+    assert results.get(4) == VALID
+    assert results.get(5) == VALID
+    assert results.get(6) == VALID
+    assert results.get(7) == error_code(DoubleSpend)
 
 
 def test_parallel_validator_routes_transactions_correctly(b, monkeypatch):
@@ -75,7 +81,7 @@ def test_parallel_validator_routes_transactions_correctly(b, monkeypatch):
     from collections import defaultdict
     import multiprocessing as mp
     from json import dumps
-    from bigchaindb.parallel_validation import ParallelValidator
+    from bigchaindb.parallel_validation import ParallelValidator, VALID
 
     # We want to make sure that the load is distributed across all workers.
     # Since introspection on an object running on a different process is
@@ -85,20 +91,24 @@ def test_parallel_validator_routes_transactions_correctly(b, monkeypatch):
 
     # Validate is now a passthrough, and every time it is called it will emit
     # the PID of its worker to the designated queue.
-    def validate(self, dict_transaction):
-        validation_called_by.put((os.getpid(), dict_transaction['id']))
-        return dict_transaction
+    def validate(self, transaction):
+        validation_called_by.put((os.getpid(), transaction.id))
+        return VALID
 
     monkeypatch.setattr(
         'bigchaindb.parallel_validation.ValidationWorker.validate',
         validate)
 
-    # Transaction routing uses the `id` of the transaction. This test strips
-    # down a transaction to just its `id`. We have two workers, so even ids
-    # will be processed by one worker, odd ids by the other.
-    transactions = [{'id': '0'}, {'id': '1'}, {'id': '2'}, {'id': '3'}]
+    # Transaction routing uses the asset id of the transaction, which is the
+    # `id` of a CREATE transaction. We have two workers, and new assets go to
+    # the least loaded one, so the first and the third transactions will be
+    # processed by one worker, the second and the fourth by the other.
+    transactions = [generate_create_and_transfer()[0] for _ in range(4)]
 
-    pv = ParallelValidator(number_of_workers=2)
+    # The ring buffers and the results are smaller than a block, so their
+    # space is reused while the block is validated.
+    pv = ParallelValidator(number_of_workers=2, ring_buffer_size=2048,
+                           results_size=3)
     pv.start()
 
     # ParallelValidator is instantiated once, and then used several times.
@@ -109,7 +119,7 @@ def test_parallel_validator_routes_transactions_correctly(b, monkeypatch):
     for _ in range(2):
         # First, we push the transactions to the parallel validator instance
         for transaction in transactions:
-            pv.validate(dumps(transaction).encode('utf8'))
+            pv.validate(dumps(transaction.to_dict()).encode('utf8'))
 
         assert pv.result(timeout=1) == transactions
 
@@ -120,15 +130,31 @@ def test_parallel_validator_routes_transactions_correctly(b, monkeypatch):
             worker_to_transactions[worker_pid].append(transaction_id)
 
         # The transactions are stored in two buckets.
+        expected = [{transactions[0].id, transactions[2].id},
+                    {transactions[1].id, transactions[3].id}]
         for _, transaction_ids in worker_to_transactions.items():
-            assert len(transaction_ids) == 2
-
-            # We have two workers, hence we have two different routes for
-            # transactions. We have the route for even transactions, and the
-            # route for odd transactions. Since we don't know which worker
-            # processed what, we test that the transactions processed by a
-            # worker are all even or all odd.
-            assert (all(filter(lambda x: int(x) % 2 == 0, transaction_ids)) or
-                    all(filter(lambda x: int(x) % 2 == 1, transaction_ids)))
+            assert set(transaction_ids) in expected
 
     pv.stop()
+
+
+def test_parallel_validator_routes_transactions_by_asset():
+    from bigchaindb.parallel_validation import ParallelValidator
+
+    create_1, transfer_1 = generate_create_and_transfer()
+    create_2, transfer_2 = generate_create_and_transfer()
+    pv = ParallelValidator(number_of_workers=2)
+
+    assert pv.route(create_1.to_dict()) == 0
+    assert pv.route(create_2.to_dict()) == 1
+    assert pv.route(transfer_2.to_dict()) == 1
+    assert pv.route(transfer_1.to_dict()) == 0
+    assert pv.loads == [2, 2]
+
+    # a transfer claiming a new asset follows the transactions it spends
+    dict_transfer = transfer_2.to_dict()
+    dict_transfer['asset'] = {'id': 'unknown'}
+    assert pv.route(dict_transfer) == 1
+
+    pv.reset()
+    assert pv.route(transfer_2.to_dict()) == 0
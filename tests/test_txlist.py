@@ -46,3 +46,23 @@ def test_get_txlist_by_asset(b, txlist):
 def test_get_txlist_by_operation(b, txlist):
     res = b.get_transactions_filtered(txlist.create1.id, operation='CREATE')
     assert set(tx.id for tx in res) == {txlist.create1.id}
+
+
+@pytest.mark.bdb
+def test_get_txlist_page(b, txlist, user_pk, user_sk):
+    from bigchaindb.models import Transaction
+
+    transfer2 = Transaction.transfer(txlist.transfer1.to_inputs(),
+                                     [([user_pk], 8)],
+                                     txlist.create1.id).sign([user_sk])
+    # the transactions of the fixture are stored at the height 0
+    b.store_bulk_transactions([transfer2], 1)
+
+    txs, after = b.get_transactions_page(txlist.create1.id, limit=2)
+    assert [tx.id for tx in txs] == [txlist.create1.id, txlist.transfer1.id]
+    txs, after = b.get_transactions_page(txlist.create1.id, after=after, limit=2)
+    assert [tx.id for tx in txs] == [transfer2.id]
+    assert after is None
+
+    res = b.get_transactions_filtered(txlist.create1.id, last_tx=True)
+    assert [tx.id for tx in res] == [transfer2.id]
@@ -9,7 +9,9 @@ import random
 
 from functools import singledispatch
 
+from bigchaindb.backend.inmemory.connection import InMemoryConnection
 from bigchaindb.backend.localmongodb.connection import LocalMongoDBConnection
+from bigchaindb.backend.localsqlite.connection import LocalSQLiteConnection
 from bigchaindb.backend.schema import TABLES
 from bigchaindb.common import crypto
 from bigchaindb.common.transaction_mode_types import BROADCAST_TX_COMMIT
@@ -28,6 +30,21 @@ def flush_localmongo_db(connection, dbname):
         getattr(connection.conn[dbname], t).delete_many({})
 
 
+@flush_db.register(LocalSQLiteConnection)
+def flush_localsqlite_db(connection, dbname):
+    # NOTE: the tables of the text indexes are emptied via their virtual
+    #       table, `sqlite_sequence` resets the `owner_outputs` sequence
+    for name, in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' "
+                                    "AND name NOT LIKE '%\\_text\\_%' ESCAPE '\\'"):
+        connection.execute('DELETE FROM {}'.format(name))
+
+
+@flush_db.register(InMemoryConnection)
+def flush_inmemory_db(connection, dbname):
+    for t in TABLES:
+        connection.run(lambda database: database[t].clear())
+
+
 def generate_block(bigchain):
     from bigchaindb.common.crypto import generate_key_pair
     from bigchaindb.models import Transaction
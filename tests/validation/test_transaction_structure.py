@@ -41,6 +41,37 @@ def test_validation_passes(signed_create_tx):
     Transaction.from_dict(signed_create_tx.to_dict())
 
 
+def test_validation_from_json(signed_create_tx):
+    raw = json.dumps(signed_create_tx.to_dict()).encode('utf8')
+    assert Transaction.from_json(raw).to_dict() == signed_create_tx.to_dict()
+
+
+def test_validation_from_json_explains_the_error(create_tx, alice):
+    create_tx.operation = 'something invalid'
+    raw = json.dumps(create_tx.sign([alice.private_key]).to_dict()).encode('utf8')
+    with pytest.raises(SchemaValidationError) as exc:
+        Transaction.from_json(raw)
+    assert "'something invalid' is not one of" in str(exc.value)
+
+
+@pytest.mark.parametrize('backend', ['localmongodb', 'localsqlite', 'inmemory'])
+@pytest.mark.parametrize('metadata', [
+    {'a.b': 1},
+    {'nested': [{'$key': 1}]},
+    {'language': 'klingon'},
+    {'nested': {'language': 'klingon'}},
+])
+def test_validate_metadata_keys_and_languages(monkeypatch, create_tx, alice, metadata, backend):
+    import bigchaindb
+    from bigchaindb.common.exceptions import ValidationError
+
+    # the names of the keys and the languages are restricted by MongoDB,
+    # whatever the backend of the node
+    monkeypatch.setitem(bigchaindb.config['database'], 'backend', backend)
+    create_tx.metadata = metadata
+    validate_raises(create_tx.sign([alice.private_key]), ValidationError)
+
+
 ################################################################################
 # ID
 
@@ -0,0 +1,50 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# BigchainDB and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import base64
+import json
+from unittest.mock import patch
+
+import requests
+
+CACHES_ENDPOINT = '/api/v1/caches/'
+
+
+@patch('requests.post')
+def test_get_caches_endpoint(mock_post, client, monkeypatch):
+    from bigchaindb.common import cache
+    from bigchaindb.common.cache import LRUCache
+
+    monkeypatch.setattr(cache, '_caches', {})
+    api_cache = cache.register('test_api', LRUCache(1024))
+    api_cache.put('key', 'value')
+    api_cache.get('key')
+    api_cache.get('missing')
+
+    abci_stats = {'validation': {'entries': 1, 'bytes': 64, 'max_bytes': 1024, 'hits': 3,
+                                 'misses': 1, 'hit_rate': 0.75, 'evictions': 0}}
+    mock_post.return_value.json.return_value = {
+        'result': {'response': {'value': base64.b64encode(json.dumps(abci_stats).encode('utf8')).decode()}}
+    }
+
+    res = client.get(CACHES_ENDPOINT)
+    assert res.status_code == 200
+    assert res.json['abci'] == abci_stats
+    stats = res.json['api']['test_api']
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1, 0)
+
+    payload = mock_post.call_args[1]['json']
+    assert payload['method'] == 'abci_query'
+    assert payload['params']['path'] == '/caches'
+
+
+@patch('requests.post')
+def test_get_caches_endpoint_without_tendermint(mock_post, client):
+    mock_post.side_effect = requests.exceptions.ConnectionError
+
+    res = client.get(CACHES_ENDPOINT)
+    assert res.status_code == 200
+    assert res.json['abci'] is None
+    assert 'api' in res.json
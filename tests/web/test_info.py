@@ -24,6 +24,7 @@ def test_api_root_endpoint(client, wsserver_base_url):
                     wsserver_base_url),
                 'metadata': '/api/v1/metadata/',
                 'validators': '/api/v1/validators',
+                'caches': '/api/v1/caches/',
             }
         },
         'docs': 'https://docs.bigchaindb.com/projects/server/en/vtsttst/',
@@ -46,7 +47,8 @@ def test_api_v1_endpoint(client, wsserver_base_url):
                 'streams': '{}/api/v1/streams/valid_transactions'.format(
                     wsserver_base_url),
         'metadata': '/metadata/',
-        'validators': '/validators'
+        'validators': '/validators',
+        'caches': '/caches/',
     }
     res = client.get('/api/v1')
     assert res.json == api_v1_info
@@ -24,7 +24,7 @@ def test_get_outputs_endpoint(client, user_pk):
             {'transaction_id': 'a', 'output_index': 0}
         ]
     assert res.status_code == 200
-    gof.assert_called_once_with(user_pk, None)
+    gof.assert_called_once_with([user_pk], None)
 
 
 def test_get_outputs_endpoint_unspent(client, user_pk):
@@ -37,7 +37,7 @@ def test_get_outputs_endpoint_unspent(client, user_pk):
         res = client.get(OUTPUTS_ENDPOINT + params)
     assert res.json == [{'transaction_id': 'a', 'output_index': 0}]
     assert res.status_code == 200
-    gof.assert_called_once_with(user_pk, False)
+    gof.assert_called_once_with([user_pk], False)
 
 
 @pytest.mark.bdb
@@ -52,7 +52,32 @@ def test_get_outputs_endpoint_spent(client, user_pk):
         res = client.get(OUTPUTS_ENDPOINT + params)
     assert res.json == [{'transaction_id': 'a', 'output_index': 0}]
     assert res.status_code == 200
-    gof.assert_called_once_with(user_pk, True)
+    gof.assert_called_once_with([user_pk], True)
+
+
+def test_get_outputs_endpoint_several_public_keys(client, user_pk, user2_pk):
+    m = MagicMock()
+    m.txid = 'a'
+    m.output = 0
+    with patch('bigchaindb.BigchainDB.get_outputs_filtered') as gof:
+        gof.return_value = [m]
+        params = '?public_key={}&public_key={}'.format(user_pk, user2_pk)
+        res = client.get(OUTPUTS_ENDPOINT + params)
+    assert res.json == [{'transaction_id': 'a', 'output_index': 0}]
+    assert res.status_code == 200
+    gof.assert_called_once_with([user_pk, user2_pk], None)
+
+
+def test_get_outputs_endpoint_details(client, user_pk):
+    output = {'public_key': user_pk, 'transaction_id': 'a', 'output_index': 0,
+              'amount': 3, 'asset_id': 'b', 'spent': False}
+    with patch('bigchaindb.BigchainDB.get_owner_outputs') as goo:
+        goo.return_value = [output]
+        params = '?spent=false&details=true&public_key={}'.format(user_pk)
+        res = client.get(OUTPUTS_ENDPOINT + params)
+    assert res.json == [output]
+    assert res.status_code == 200
+    goo.assert_called_once_with([user_pk], False)
 
 
 @pytest.mark.bdb
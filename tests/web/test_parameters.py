@@ -78,3 +78,26 @@ def test_valid_operation():
         valid_operation('blah')
     with pytest.raises(ValueError):
         valid_operation('')
+
+
+def test_valid_limit():
+    from bigchaindb.web.views.parameters import valid_limit
+
+    assert valid_limit('1') == 1
+    assert valid_limit('1000') == 1000
+
+    for limit in ('0', '1001', '-1', 'ten', ''):
+        with pytest.raises(ValueError):
+            valid_limit(limit)
+
+
+def test_valid_cursor():
+    from bigchaindb.web.views.parameters import encode_cursor, valid_cursor
+
+    txid = '18ac3e7343f016890c510e93f935261169d9e3f565436429830faf0934f4f8e4'
+    assert valid_cursor(encode_cursor((12, 3, txid))) == (12, 3, txid)
+
+    for cursor in ('', 'abc', encode_cursor([12, 3]), encode_cursor(['12', 3, txid]),
+                   encode_cursor((12, 3, 'abc'))):
+        with pytest.raises(ValueError):
+            valid_cursor(cursor)
@@ -69,29 +69,27 @@ def test_post_create_transaction_endpoint(b, client):
 def test_post_create_transaction_with_language(b, client, nested, language,
                                                expected_status_code):
     from bigchaindb.models import Transaction
-    from bigchaindb.backend.localmongodb.connection import LocalMongoDBConnection
 
-    if isinstance(b.connection, LocalMongoDBConnection):
-        user_priv, user_pub = crypto.generate_key_pair()
-        lang_obj = {'language': language}
+    user_priv, user_pub = crypto.generate_key_pair()
+    lang_obj = {'language': language}
 
-        if nested:
-            asset = {'root': lang_obj}
-        else:
-            asset = lang_obj
+    if nested:
+        asset = {'root': lang_obj}
+    else:
+        asset = lang_obj
 
-        tx = Transaction.create([user_pub], [([user_pub], 1)],
-                                asset=asset)
-        tx = tx.sign([user_priv])
-        res = client.post(TX_ENDPOINT, data=json.dumps(tx.to_dict()))
-        assert res.status_code == expected_status_code
-        if res.status_code == 400:
-            expected_error_message = (
-                'Invalid transaction (ValidationError): MongoDB does not support '
-                'text search for the language "{}". If you do not understand this '
-                'error message then please rename key/field "language" to something '
-                'else like "lang".').format(language)
-            assert res.json['message'] == expected_error_message
+    tx = Transaction.create([user_pub], [([user_pub], 1)],
+                            asset=asset)
+    tx = tx.sign([user_priv])
+    res = client.post(TX_ENDPOINT, data=json.dumps(tx.to_dict()))
+    assert res.status_code == expected_status_code
+    if res.status_code == 400:
+        expected_error_message = (
+            'Invalid transaction (ValidationError): MongoDB does not support '
+            'text search for the language "{}". If you do not understand this '
+            'error message then please rename key/field "language" to something '
+            'else like "lang".').format(language)
+        assert res.json['message'] == expected_error_message
 
 
 @pytest.mark.abci
@@ -107,27 +105,25 @@ def test_post_create_transaction_with_language(b, client, nested, language,
 def test_post_create_transaction_with_invalid_key(b, client, field, value,
                                                   err_key, expected_status_code):
     from bigchaindb.models import Transaction
-    from bigchaindb.backend.localmongodb.connection import LocalMongoDBConnection
     user_priv, user_pub = crypto.generate_key_pair()
 
-    if isinstance(b.connection, LocalMongoDBConnection):
-        if field == 'asset':
-            tx = Transaction.create([user_pub], [([user_pub], 1)],
-                                    asset=value)
-        elif field == 'metadata':
-            tx = Transaction.create([user_pub], [([user_pub], 1)],
-                                    metadata=value)
-        tx = tx.sign([user_priv])
-        res = client.post(TX_ENDPOINT, data=json.dumps(tx.to_dict()))
+    if field == 'asset':
+        tx = Transaction.create([user_pub], [([user_pub], 1)],
+                                asset=value)
+    elif field == 'metadata':
+        tx = Transaction.create([user_pub], [([user_pub], 1)],
+                                metadata=value)
+    tx = tx.sign([user_priv])
+    res = client.post(TX_ENDPOINT, data=json.dumps(tx.to_dict()))
 
-        assert res.status_code == expected_status_code
+    assert res.status_code == expected_status_code
 
-        if res.status_code == 400:
-            expected_error_message = (
-                'Invalid transaction (ValidationError): Invalid key name "{}" '
-                'in {} object. The key name cannot contain characters '
-                '".", "$" or null characters').format(err_key, field)
-            assert res.json['message'] == expected_error_message
+    if res.status_code == 400:
+        expected_error_message = (
+            'Invalid transaction (ValidationError): Invalid key name "{}" '
+            'in {} object. The key name cannot contain characters '
+            '".", "$" or null characters').format(err_key, field)
+        assert res.json['message'] == expected_error_message
 
 
 @pytest.mark.abci
@@ -400,6 +396,34 @@ def test_transactions_get_list_good(client):
         ]
 
 
+def test_transactions_get_list_page(client):
+    from bigchaindb.web.views.parameters import encode_cursor
+
+    asset_id = '1' * 64
+    last = (3, 1, '2' * 64)
+    tx = type('', (), {'to_dict': lambda self: {'id': '2' * 64}})()
+
+    with patch('bigchaindb.BigchainDB.get_transactions_page',
+               return_value=([tx], last)) as get_page:
+        res = client.get(TX_ENDPOINT + '?asset_id=' + asset_id + '&limit=1')
+    assert res.status_code == 200
+    assert res.json == [{'id': '2' * 64}]
+    get_page.assert_called_once_with(asset_id, None, None, 1)
+    next_url = res.headers['Link'][1:res.headers['Link'].index('>')]
+    assert 'cursor=' + encode_cursor(last) in next_url
+
+    with patch('bigchaindb.BigchainDB.get_transactions_page',
+               return_value=([], None)) as get_page:
+        res = client.get(next_url)
+    assert res.status_code == 200
+    assert res.json == []
+    assert 'Link' not in res.headers
+    get_page.assert_called_once_with(asset_id, None, last, 1)
+
+    res = client.get(TX_ENDPOINT + '?asset_id=' + asset_id + '&cursor=abc')
+    assert res.status_code == 400
+
+
 def test_transactions_get_list_bad(client):
     def should_not_be_called():
         assert False